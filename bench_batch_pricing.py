@@ -0,0 +1,58 @@
+import random  # Seeded synthetic carts
+import sys  # Read the cart count from the command line
+import time  # Wall-clock timing
+
+import numpy as np  # Pre-built arrays for the kernel-only timing
+
+from ebookstore import Ebook, Customer, ShoppingCart, Order  # Import the scalar pricing classes
+from ebookstore.batch_pricing import price_orders, price_lines, flatten_carts  # Import the vectorized pricing engine
+
+
+def make_orders(count, seed=0):
+    # Builds `count` orders over a small catalog, mixing loyalty and non-loyalty customers
+    rng = random.Random(seed)
+    ebooks = [Ebook(f"Title {i}", "Author", "2020", "Fiction", round(rng.uniform(1, 80), 2), str(i), "Penguin",
+                    "English") for i in range(500)]
+    orders = []
+    for i in range(count):
+        cart = ShoppingCart()
+        for ebook in rng.sample(ebooks, rng.randint(1, 8)):
+            cart.add_item(ebook, rng.randint(1, 3))
+        customer = Customer(f"Customer {i}", "c@example.com", "050-0000000", "Dubai", "Card", rng.random() < 0.4)
+        orders.append(Order(customer, cart))
+    return orders
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    orders = make_orders(count)
+
+    start = time.perf_counter()
+    scalar = [order.calculate_total() for order in orders]
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = price_orders(orders)
+    batch_seconds = time.perf_counter() - start
+
+    # The kernel alone, for callers that already hold flat price/quantity arrays
+    price_cents, quantities, line_counts = map(np.array, flatten_carts(order.shopping_cart for order in orders))
+    loyalty = np.array([order.customer.loyalty_member for order in orders])
+    start = time.perf_counter()
+    kernel = price_lines(price_cents, quantities, line_counts, loyalty)
+    kernel_seconds = time.perf_counter() - start
+    assert np.array_equal(kernel.total, batch.total)
+
+    # Every field must agree with the scalar path exactly
+    for i, expected in enumerate(scalar):
+        actual = (batch.subtotal[i], batch.discount[i], batch.vat[i], batch.total[i])
+        assert list(actual) == [value.cents for value in expected], (i, actual, expected)
+
+    print(f"{count} orders")
+    print(f"scalar calculate_total: {scalar_seconds:.3f}s ({count / scalar_seconds:,.0f} orders/s)")
+    print(f"batch price_orders:     {batch_seconds:.3f}s ({count / batch_seconds:,.0f} orders/s)")
+    print(f"batch price_lines:      {kernel_seconds:.3f}s ({count / kernel_seconds:,.0f} orders/s)")
+
+
+if __name__ == "__main__":
+    main()  # Run the batch pricing benchmark
@@ -0,0 +1,44 @@
+import os  # Report how many CPUs the numbers were taken on
+import random  # Seeded synthetic customers and carts
+import sys  # Read the order count from the command line
+import time  # Wall-clock timing
+
+from ebookstore import Ebook, Customer, ShoppingCart  # Import the classes used to build synthetic pairs
+from ebookstore.bulk_orders import process_orders  # Import the bulk entry point under test
+
+
+def make_pairs(count, seed=0):
+    # Builds `count` (Customer, ShoppingCart) pairs over a small catalog
+    rng = random.Random(seed)
+    ebooks = [Ebook(f"Title {i}", "Author", "2020", "Fiction", round(rng.uniform(1, 80), 2), str(i), "Penguin",
+                    "English") for i in range(1_000)]
+    pairs = []
+    for i in range(count):
+        cart = ShoppingCart()
+        for ebook in rng.sample(ebooks, rng.randint(1, 10)):
+            cart.add_item(ebook, rng.randint(1, 3))
+        pairs.append((Customer(f"Customer {i}", "c@example.com", "050-0000000", "Dubai", "Card", i % 3 == 0), cart))
+    return pairs
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    pairs = make_pairs(count)
+    baseline = None
+    print(f"{count} orders on {os.cpu_count()} CPU(s)")
+    print(f"{'executor':>8} {'workers':>8} {'seconds':>9} {'orders/s':>12} {'speedup':>8}")
+    for executor, workers in [("inline", 1), ("process", 1), ("process", 2), ("process", 4), ("process", 8),
+                              ("thread", 4)]:
+        start = time.perf_counter()
+        results = process_orders(pairs, workers=workers, executor=executor)
+        seconds = time.perf_counter() - start
+        if baseline is None:
+            baseline = (seconds, [(result.total, result.invoice) for result in results])
+        else:
+            # Every configuration must return the same results in the same order
+            assert [(result.total, result.invoice) for result in results] == baseline[1]
+        print(f"{executor:>8} {workers:>8} {seconds:>9.2f} {count / seconds:>12,.0f} {baseline[0] / seconds:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()  # Run the bulk order scaling benchmark
@@ -0,0 +1,48 @@
+import contextlib  # Send PrintEventSink output to /dev/null instead of the terminal
+import os  # os.devnull and temporary file cleanup
+import sys  # Read the mutation count from the command line
+import tempfile  # Scratch file for the structured log
+import time  # Wall-clock timing
+
+from ebookstore import Ebook, ShoppingCart, NullEventSink, PrintEventSink, BufferedLogSink  # Import cart and sinks
+
+
+def replay(cart, ebooks, count):
+    # Replays `count` cart events: mostly adds, with a remove every third event
+    for i in range(count):
+        ebook = ebooks[i % len(ebooks)]
+        if i % 3 == 2:
+            cart.remove_item(ebook, 1)
+        else:
+            cart.add_item(ebook, 1)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    ebooks = [Ebook(f"Title {i}", "Author", "2020", "Fiction", 9.99, str(i), "Penguin", "English") for i in range(50)]
+    log_path = os.path.join(tempfile.mkdtemp(), "cart_events.jsonl")
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        with BufferedLogSink(log_path) as log_sink:
+            cases = [("NullEventSink", NullEventSink()), ("BufferedLogSink", log_sink),
+                     ("PrintEventSink (to /dev/null)", PrintEventSink())]
+            results = []
+            for name, sink in cases:
+                start = time.perf_counter()
+                replay(ShoppingCart(sink), ebooks, count)
+                if sink is log_sink:
+                    sink.flush()  # Include the final write in the measurement
+                results.append((name, time.perf_counter() - start))
+
+    with open(log_path, encoding="utf-8") as log_file:
+        assert sum(1 for _ in log_file) == count  # Every event reached the structured log
+    os.remove(log_path)
+    os.rmdir(os.path.dirname(log_path))
+
+    print(f"{count} cart mutations per sink")
+    for name, seconds in results:
+        print(f"{name:<30} {seconds:>7.3f}s {count / seconds:>14,.0f} mutations/s")
+
+
+if __name__ == "__main__":
+    main()  # Run the cart event sink benchmark
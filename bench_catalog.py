@@ -0,0 +1,66 @@
+import random  # Random ISBNs to look up
+import sys  # Read catalog sizes from the command line
+import time  # High-resolution timer for latency measurements
+
+from ebookstore import Ebook  # Import the Ebook class to build a synthetic catalog
+from ebookstore.catalog import Catalog  # Import the indexed catalog under test
+
+GENRES = ["Self-help", "Thriller", "Fantasy", "Romance", "Science", "History", "Biography", "Poetry"]
+PUBLISHERS = ["Penguin", "Celadon", "HarperCollins", "Macmillan", "Hachette", "Scholastic"]
+LANGUAGES = ["English", "Arabic", "French", "Spanish"]
+
+
+def make_ebooks(count):
+    # Builds `count` synthetic ebooks with unique ISBNs and repeating secondary keys
+    return [Ebook(f"Title {i}", f"Author {i % 5000}", str(1950 + i % 75), GENRES[i % len(GENRES)],
+                  9.99 + i % 40, f"978{i:010d}", PUBLISHERS[i % len(PUBLISHERS)], LANGUAGES[i % len(LANGUAGES)])
+            for i in range(count)]
+
+
+def time_per_call(func, args):
+    # Returns the average time per call in microseconds
+    start = time.perf_counter()
+    for arg in args:
+        func(arg)
+    return (time.perf_counter() - start) / len(args) * 1e6
+
+
+def linear_get_isbn(ebooks, isbn):
+    # The pre-catalog approach: scan the list until the ISBN matches
+    for ebook in ebooks:
+        if ebook.get_isbn() == isbn:
+            return ebook
+    return None
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f"{'titles':>10} {'build s':>9} {'isbn us':>9} {'author us':>10} {'genre us':>9} {'scan us':>10}")
+    for size in sizes:
+        ebooks = make_ebooks(size)
+        start = time.perf_counter()
+        catalog = Catalog(ebooks)
+        build_seconds = time.perf_counter() - start
+
+        rng = random.Random(size)
+        isbns = [ebooks[rng.randrange(size)].get_isbn() for _ in range(10_000)]
+        authors = [f"Author {rng.randrange(5000)}" for _ in range(1_000)]
+        genres = [rng.choice(GENRES) for _ in range(20)]
+
+        # Sanity check: the index agrees with a linear scan and follows set_isbn()
+        assert catalog.get(isbns[0]) is linear_get_isbn(ebooks, isbns[0])
+        moved = catalog.get(isbns[0])
+        moved.set_isbn("moved-" + isbns[0])
+        assert catalog.get("moved-" + isbns[0]) is moved and isbns[0] not in catalog
+        moved.set_isbn(isbns[0])
+
+        isbn_us = time_per_call(catalog.get, isbns)
+        author_us = time_per_call(catalog.by_author, authors)
+        genre_us = time_per_call(catalog.by_genre, genres)
+        # Only a handful of linear scans; they are what the index replaces
+        scan_us = time_per_call(lambda isbn: linear_get_isbn(ebooks, isbn), isbns[:20])
+        print(f"{size:>10} {build_seconds:>9.2f} {isbn_us:>9.3f} {author_us:>10.3f} {genre_us:>9.1f} {scan_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()  # Run the catalog lookup benchmark
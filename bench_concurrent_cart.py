@@ -0,0 +1,79 @@
+import random  # Seeded per-thread update sequences
+import sys  # Read the update count from the command line
+import threading  # Concurrent shoppers
+import time  # Wall-clock timing
+
+from ebookstore import Ebook, Customer, ShoppingCart, Order, NullEventSink  # Import the plain cart and orders
+from ebookstore.concurrent_cart import ConcurrentShoppingCart  # Import the striped cart under test
+
+
+# === Single-lock baseline ===
+class LockedShoppingCart(ShoppingCart):
+    """Plain cart with one lock around every update and snapshot."""
+
+    def __init__(self, event_sink=None):
+        super().__init__(event_sink)
+        self.lock = threading.Lock()
+
+    def add_item(self, ebook, quantity=1):
+        with self.lock:
+            super().add_item(ebook, quantity)
+
+    def remove_item(self, ebook, quantity=1):
+        with self.lock:
+            super().remove_item(ebook, quantity)
+
+    def snapshot(self):
+        copy = ShoppingCart(NullEventSink())
+        with self.lock:
+            copy.items.update(self.items)
+            copy._subtotal, copy._total_quantity = self.subtotal_cents, self.total_quantity
+        return copy
+
+
+def shopper(cart, ebooks, customer, updates, seed, start):
+    # Adds two copies and removes one per round, pricing the cart every 50 rounds
+    rng = random.Random(seed)
+    start.wait()
+    for i in range(updates // 2):
+        ebook = rng.choice(ebooks)
+        cart.add_item(ebook, 2)
+        cart.remove_item(ebook, 1)
+        if i % 50 == 0:
+            Order(customer, cart).calculate_total()
+
+
+def run(cart, ebooks, customer, threads, updates):
+    # Splits `updates` cart updates over `threads` threads sharing one cart; returns (seconds, lost copies)
+    start = threading.Barrier(threads + 1)
+    workers = [threading.Thread(target=shopper, args=(cart, ebooks, customer, updates // threads, seed, start))
+               for seed in range(threads)]
+    for worker in workers:
+        worker.start()
+    start.wait()
+    began = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    seconds = time.perf_counter() - began
+    expected = threads * (updates // threads // 2)  # Each round leaves one more copy in the cart
+    return seconds, expected - cart.snapshot().total_quantity
+
+
+def main():
+    updates = int(sys.argv[1]) if len(sys.argv) > 1 else 400_000
+    ebooks = [Ebook(f"Title {i}", "Author", "2020", "Fiction", 9.99, str(i), "Penguin", "English") for i in range(200)]
+    customer = Customer("Family Account", "family@example.com", "050-0000000", "Dubai", "Credit Card", True)
+    variants = [("no lock (plain cart)", lambda: ShoppingCart(NullEventSink())),
+                ("single lock", lambda: LockedShoppingCart(NullEventSink())),
+                ("striped (16 locks)", lambda: ConcurrentShoppingCart(NullEventSink(), 16))]
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{updates} cart updates per run, one shared cart (GIL {'enabled' if gil else 'disabled'})")
+    for threads in (1, 2, 4, 8):
+        for name, make_cart in variants:
+            seconds, lost = run(make_cart(), ebooks, customer, threads, updates)
+            print(f"{threads} thread(s)  {name:<22} {seconds:>7.3f}s {updates / seconds:>12,.0f} updates/s"
+                  f"  lost copies: {lost}")
+
+
+if __name__ == "__main__":
+    main()  # Run the concurrent cart contention benchmark
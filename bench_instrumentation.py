@@ -0,0 +1,73 @@
+import os  # Scratch paths for the exports and the profile
+import sys  # Read the order count from the command line
+import tempfile  # Scratch directory for the exports and the profile
+import time  # Wall-clock timing
+
+from ebookstore import instrumentation  # Import the instrumentation layer under test
+from ebookstore import ShoppingCart, Order, NullEventSink  # Import the instrumented classes
+from ebookstore.synthetic import SyntheticStore  # Seeded catalog and carts
+
+
+def workload(lines_per_cart, customers):
+    # The hot paths in one pass: fill each cart, price it, render its invoice, then empty it again
+    for index, lines in enumerate(lines_per_cart):
+        cart = ShoppingCart(NullEventSink())
+        for ebook, quantity in lines:
+            cart.add_item(ebook, quantity)
+        order = Order(customers[index % len(customers)], cart)
+        order.calculate_total()
+        order.generate_invoice()
+        for ebook, quantity in lines:
+            cart.remove_item(ebook, quantity)
+
+
+def timed(lines_per_cart, customers, repeat=3):
+    # Best-of-`repeat` seconds for the workload
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        workload(lines_per_cart, customers)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    store = SyntheticStore()
+    ebooks, customers = store.ebooks(5_000), store.customers(1_000)
+    lines_per_cart = store.cart_lines(count, ebooks)
+
+    workload(lines_per_cart, customers)  # Warm up
+    baseline = timed(lines_per_cart, customers)
+    instrumentation.enable()
+    enabled = timed(lines_per_cart, customers, repeat=1)
+    instrumentation.disable()
+    disabled = timed(lines_per_cart, customers)
+
+    print(f"{count} orders (fill cart, calculate_total, generate_invoice, empty cart)")
+    print(f"never enabled:        {baseline:.3f}s")
+    print(f"enabled:              {enabled:.3f}s ({enabled / baseline - 1:+.1%})")
+    print(f"disabled again:       {disabled:.3f}s ({disabled / baseline - 1:+.1%})")
+
+    # Where the time goes, from the histograms recorded while enabled
+    print(f"{'method':<34} {'calls':>10} {'mean ns':>9} {'p50 ns':>9} {'p99 ns':>9}")
+    for name, histogram in instrumentation.metrics.snapshot().items():
+        print(f"{name:<34} {histogram['count']:>10,} {histogram['mean_ns']:>9,.0f} {histogram['p50_ns']:>9,}"
+              f" {histogram['p99_ns']:>9,}")
+
+    directory = tempfile.mkdtemp()
+    for format, filename in (("json", "metrics.json"), ("prometheus", "metrics.prom")):
+        path = os.path.join(directory, filename)
+        instrumentation.metrics.export(path, format)
+        print(f"{format} snapshot: {os.path.getsize(path):,} bytes")
+        os.remove(path)
+    profile_path = os.path.join(directory, "workload.prof")
+    with instrumentation.profiled(profile_path, top=8):
+        workload(lines_per_cart[:count // 10], customers)
+    os.remove(profile_path)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main()  # Run the instrumentation overhead benchmark
@@ -0,0 +1,63 @@
+import io  # In-memory buffer for the byte-identity check
+import os  # os.devnull as the streaming target
+import time  # Wall-clock timing
+import tracemalloc  # Peak memory while rendering
+
+from ebookstore import Ebook, Customer, ShoppingCart, Order, write_invoices  # Import the invoicing classes
+
+
+def legacy_generate_invoice(order):
+    # The previous implementation (repeated string concatenation), kept for comparison
+    subtotal, discount, vat, total = order.calculate_total()
+    invoice = f"=== Invoice ===\nCustomer Name: {order.customer.name}\n"
+    for ebook, quantity in order.shopping_cart.items.items():
+        invoice += f" - {ebook.title} (x{quantity}): ${ebook.price * quantity:.2f}\n"
+    invoice += f"Subtotal after discounts: ${subtotal - discount:.2f}\n"
+    invoice += f"VAT ({order.vat_rate * 100}%): ${vat:.2f}\n"
+    invoice += f"Total with VAT: ${total:.2f}\n"
+    return invoice
+
+
+def make_order(lines):
+    # Builds a B2B order with `lines` distinct titles
+    customer = Customer("Bulk Buyer LLC", "buyer@example.com", "050-0000000", "Dubai", "Invoice", True)
+    cart = ShoppingCart()
+    for i in range(lines):
+        cart.add_item(Ebook(f"Course Reader Volume {i}", "Author", "2020", "Education", 19.99 + i % 30,
+                            str(i), "Penguin", "English"), 1 + i % 4)
+    return Order(customer, cart)
+
+
+def measure(render):
+    # Returns (seconds, peak bytes) for one call of `render`
+    tracemalloc.start()
+    start = time.perf_counter()
+    render()
+    seconds = time.perf_counter() - start
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    print(f"{'lines':>8} {'legacy s':>9} {'legacy peak':>12} {'stream s':>9} {'stream peak':>12}")
+    with open(os.devnull, "w") as devnull:
+        for lines in (1_000, 10_000, 100_000):
+            order = make_order(lines)
+            # The streamed text must match the previous output byte for byte
+            buffer = io.StringIO()
+            order.write_invoice(buffer)
+            assert buffer.getvalue() == order.generate_invoice() == legacy_generate_invoice(order)
+
+            legacy_seconds, legacy_peak = measure(lambda: legacy_generate_invoice(order))
+            stream_seconds, stream_peak = measure(lambda: order.write_invoice(devnull))
+            print(f"{lines:>8} {legacy_seconds:>9.3f} {legacy_peak:>12,} {stream_seconds:>9.3f} {stream_peak:>12,}")
+
+        # Bulk mode: many orders into one file
+        orders = [make_order(20) for _ in range(5_000)]
+        seconds, peak = measure(lambda: write_invoices(orders, devnull))
+        print(f"write_invoices: {len(orders)} orders in {seconds:.3f}s, peak {peak:,} bytes")
+
+
+if __name__ == "__main__":
+    main()  # Run the invoice rendering benchmark
@@ -0,0 +1,101 @@
+import os  # Journal size
+import random  # Spread the orders over a year
+import shutil  # Remove the scratch ledgers
+import sys  # Read the order count from the command line
+import tempfile  # Scratch ledger directories
+import time  # Wall-clock timing
+from collections import Counter  # Full-scan reference for the bestseller query
+from datetime import datetime, timedelta  # Order dates
+
+from ebookstore.ledger import OrderLedger  # Import the ledger under test
+from ebookstore.synthetic import SyntheticStore  # Seeded catalog, customers and orders
+
+
+def make_orders(count, seed=0):
+    # `count` orders over a 20k-title catalog, dated across one year
+    store = SyntheticStore(seed)
+    orders = store.orders(count, store.ebooks(20_000), store.customers(5_000))
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1)
+    for order in orders:
+        order.order_date = start + timedelta(seconds=rng.randrange(365 * 86_400))
+    orders.sort(key=lambda order: order.order_date)  # Orders arrive in time order
+    return orders
+
+
+def ingest(orders, **options):
+    # Records every order into a fresh ledger; returns (seconds, directory)
+    directory = tempfile.mkdtemp()
+    start = time.perf_counter()
+    with OrderLedger(directory, **options) as ledger:
+        for order in orders:
+            ledger.record(order)
+    return time.perf_counter() - start, directory
+
+
+def query(label, function, repeat=1_000):
+    # Prints the mean latency of `function` over `repeat` calls
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    print(f"  {label:<42} {(time.perf_counter() - start) / repeat * 1e6:>10,.1f} µs")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    orders = make_orders(count)
+    print(f"{count} orders")
+
+    print("ingest (record = price + journal append + rollups):")
+    directories = []
+    for label, options in (("flush every order", {"flush_every": 1}),
+                           ("flush every 1,000 orders", {"flush_every": 1_000}),
+                           ("flush every order, no snapshots", {"flush_every": 1, "snapshot_every": 0})):
+        seconds, directory = ingest(orders, **options)
+        directories.append(directory)
+        print(f"  {label:<42} {seconds:>7.3f}s {count / seconds:>10,.0f} orders/s")
+    fsync_count = min(count, 2_000)
+    seconds, directory = ingest(orders[:fsync_count], fsync=True)
+    directories.append(directory)
+    print(f"  {'fsync every order (' + format(fsync_count, ',') + ' orders)':<42} {seconds:>7.3f}s"
+          f" {fsync_count / seconds:>10,.0f} orders/s")
+
+    journal = os.path.join(directories[0], OrderLedger.JOURNAL)
+    print(f"journal: {os.path.getsize(journal) / 1e6:,.1f} MB")
+    start = time.perf_counter()
+    ledger = OrderLedger(directories[0])
+    print(f"reopen from snapshot:                        {time.perf_counter() - start:>7.3f}s")
+    os.remove(os.path.join(directories[2], OrderLedger.SNAPSHOT))  # Written on close; drop it to force a replay
+    start = time.perf_counter()
+    OrderLedger(directories[2]).close()
+    print(f"reopen by replaying the whole journal:       {time.perf_counter() - start:>7.3f}s")
+
+    rollups = ledger.rollups
+    print("queries (mean latency):")
+    query("one day's totals", lambda: rollups.day("2026-07-14"))
+    query("one month's totals", lambda: rollups.between("2026-03-01", "2026-03-31"))
+    query("whole year's totals", lambda: rollups.between("2026-01-01", "2026-12-31"), repeat=100)
+    query("one genre's sales", lambda: rollups.sales("genre", "Thriller"))
+    query("revenue by publisher", lambda: rollups.revenue_by("publisher"))
+    query("revenue by author", lambda: rollups.revenue_by("author"), repeat=10)
+    query("top 10 authors by revenue", lambda: rollups.revenue_by("author", 10), repeat=10)
+    top = query("top 10 bestsellers", lambda: rollups.bestsellers(10))
+    query("top 100 bestsellers", lambda: rollups.bestsellers(100))
+    query("top 1,000 bestsellers (full scan)", lambda: rollups.bestsellers(1_000), repeat=10)
+
+    # The same questions answered by scanning the journal, as reporting worked before
+    start = time.perf_counter()
+    copies = Counter()
+    for entry in ledger.entries():
+        for line in entry.lines:
+            copies[line.isbn] += line.quantity
+    print(f"  {'top 10 by scanning the journal':<42} {(time.perf_counter() - start) * 1e6:>10,.1f} µs")
+    assert [copies[isbn] for isbn, _, _ in top] == sorted(copies.values(), reverse=True)[:10]
+    ledger.close()
+    for directory in directories:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()  # Run the order ledger benchmark
@@ -0,0 +1,94 @@
+import gc  # Collect garbage between measurements
+import sys  # Read the record count from the command line
+import tracemalloc  # Measure bytes allocated per record
+
+from ebookstore import Ebook, Customer  # Import the __slots__ classes
+from ebookstore.columnar import EbookTable  # Import the columnar catalog store
+
+GENRES = ["Self-help", "Thriller", "Fantasy", "Romance", "Science", "History", "Biography", "Poetry"]
+PUBLISHERS = ["Penguin", "Celadon", "HarperCollins", "Macmillan", "Hachette", "Scholastic"]
+LANGUAGES = ["English", "Arabic", "French", "Spanish"]
+
+
+# === Previous (__dict__-based) representations, kept here for comparison ===
+class DictItem:
+    def __init__(self, title, price):
+        self.title = title
+        self.price = price
+
+
+class DictEbook(DictItem):
+    def __init__(self, title, author, publication_date, genre, price, isbn, publisher, language):
+        super().__init__(title, price)
+        self.author = author
+        self.publication_date = publication_date
+        self.genre = genre
+        self._isbn = isbn
+        self.publisher = publisher
+        self.language = language
+
+
+class DictCustomer:
+    def __init__(self, name, email, contact_number, address, payment_method, loyalty_member=False):
+        self.name = name
+        self._email = email
+        self._contact_number = contact_number
+        self.address = address
+        self.payment_method = payment_method
+        self.loyalty_member = loyalty_member
+
+
+def ebook_fields(count):
+    # Yields synthetic Ebook constructor arguments
+    for i in range(count):
+        yield (f"Title {i}", f"Author {i % 5000}", str(1950 + i % 75), GENRES[i % len(GENRES)],
+               9.99 + i % 40, f"978{i:010d}", PUBLISHERS[i % len(PUBLISHERS)], LANGUAGES[i % len(LANGUAGES)])
+
+
+def customer_fields(count):
+    # Yields synthetic Customer constructor arguments
+    for i in range(count):
+        yield (f"Customer {i}", f"customer{i}@example.com", f"050-{i:07d}", f"{i} Palm St, Dubai",
+               "Credit Card", i % 3 == 0)
+
+
+def bytes_per_record(build, count):
+    # Returns the bytes still allocated per record after `build` has created `count` records
+    gc.collect()
+    tracemalloc.start()
+    records = build(count)
+    allocated, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return allocated / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    cases = [
+        ("Ebook (__dict__)", lambda n: [DictEbook(*fields) for fields in ebook_fields(n)]),
+        ("Ebook (__slots__)", lambda n: [Ebook(*fields) for fields in ebook_fields(n)]),
+        ("EbookTable (columnar)", _build_table),
+        ("Customer (__dict__)", lambda n: [DictCustomer(*fields) for fields in customer_fields(n)]),
+        ("Customer (__slots__)", lambda n: [Customer(*fields) for fields in customer_fields(n)]),
+    ]
+    print(f"{count} records per case")
+    for name, build in cases:
+        print(f"{name:<24} {bytes_per_record(build, count):>8.1f} bytes/record")
+
+    # Sanity check: row views still satisfy the Ebook API
+    table, ebook = _build_table(1), Ebook(*next(ebook_fields(1)))
+    row = table[0]
+    assert (row.title, row.price, row.get_isbn(), str(row)) == (ebook.title, ebook.price, ebook.get_isbn(), str(ebook))
+
+
+def _build_table(count):
+    # Fills a columnar table with `count` rows
+    table = EbookTable()
+    for fields in ebook_fields(count):
+        table.append(*fields)
+    return table
+
+
+if __name__ == "__main__":
+    main()  # Run the memory benchmark
@@ -0,0 +1,226 @@
+import random  # Seeded synthetic orders
+from collections import deque  # Consume results without keeping them
+import sys  # Read the order count from the command line
+import time  # Wall-clock timing
+from datetime import datetime  # Orders record their creation time
+from decimal import Decimal, ROUND_HALF_UP  # The Decimal workaround being compared against
+
+from ebookstore import Ebook, Customer, ShoppingCart, Order, Discount, NullEventSink  # Import the integer-cents classes
+
+
+# === Previous (binary float) implementation, kept here for comparison ===
+class FloatEbook:
+    __slots__ = ("title", "_price")
+
+    def __init__(self, title, price):
+        self.title = title
+        self._price = price
+
+    @property
+    def price(self):
+        return self._price
+
+
+class FloatCart:
+    ZERO = 0.0  # Empty-cart subtotal (Decimal(0) in the Decimal variant)
+
+    def __init__(self):
+        self.event_sink = NullEventSink()
+        self.items = {}
+        self._subtotal = self.ZERO
+        self._total_quantity = 0
+
+    def add_item(self, ebook, quantity=1):
+        if ebook in self.items:
+            self.items[ebook] += quantity
+        else:
+            self.items[ebook] = quantity
+        self._subtotal += ebook.price * quantity
+        self._total_quantity += quantity
+        self.event_sink.emit("added", ebook, quantity)
+
+    @property
+    def subtotal(self):
+        return self._subtotal
+
+    @property
+    def total_quantity(self):
+        return self._total_quantity
+
+
+class FloatDiscount:
+    def __init__(self):
+        self.loyalty_discount = 0.1
+        self.bulk_discount = 0.2
+        self.bulk_threshold = 5
+
+    def apply_discount(self, subtotal, is_loyalty_member, bulk_quantity, shopping_cart=None, when=None):
+        discount = 0
+        if is_loyalty_member:
+            discount += subtotal * self.loyalty_discount
+        if bulk_quantity >= self.bulk_threshold:
+            discount += subtotal * self.bulk_discount
+        return discount
+
+
+class FloatOrder:
+    def __init__(self, customer, shopping_cart, discount):
+        self.customer = customer
+        self.shopping_cart = shopping_cart
+        self.order_date = datetime.now()
+        self.discount = discount
+        self.vat_rate = 0.08
+
+    def calculate_total(self):
+        subtotal = self.shopping_cart.subtotal
+        discount = self.discount.apply_discount(subtotal, self.customer.loyalty_member,
+                                                self.shopping_cart.total_quantity, self.shopping_cart,
+                                                self.order_date)
+        vat = (subtotal - discount) * self.vat_rate
+        total = subtotal - discount + vat
+        return subtotal, discount, vat, total
+
+    def iter_invoice(self):
+        subtotal, discount, vat, total = self.calculate_total()
+        yield f"=== Invoice ===\nCustomer Name: {self.customer.name}\n"
+        for ebook, quantity in self.shopping_cart.items.items():
+            yield f" - {ebook.title} (x{quantity}): ${ebook.price * quantity:.2f}\n"
+        yield f"Subtotal after discounts: ${subtotal - discount:.2f}\n"
+        yield f"VAT ({self.vat_rate * 100}%): ${vat:.2f}\n"
+        yield f"Total with VAT: ${total:.2f}\n"
+
+    def generate_invoice(self):
+        return "".join(self.iter_invoice())
+
+
+# === The Decimal workaround: same classes, Decimal amounts quantized to cents ===
+_CENT = Decimal("0.01")
+
+
+class DecimalCart(FloatCart):
+    ZERO = Decimal(0)
+
+
+class DecimalDiscount(FloatDiscount):
+    def __init__(self):
+        super().__init__()
+        self.loyalty_discount = Decimal("0.1")
+        self.bulk_discount = Decimal("0.2")
+
+    def apply_discount(self, subtotal, is_loyalty_member, bulk_quantity, shopping_cart=None, when=None):
+        discount = super().apply_discount(subtotal, is_loyalty_member, bulk_quantity)
+        return Decimal(discount).quantize(_CENT, ROUND_HALF_UP)
+
+
+class DecimalOrder(FloatOrder):
+    def __init__(self, customer, shopping_cart, discount):
+        super().__init__(customer, shopping_cart, discount)
+        self.vat_rate = Decimal("0.08")
+
+    def calculate_total(self):
+        subtotal = self.shopping_cart.subtotal
+        discount = self.discount.apply_discount(subtotal, self.customer.loyalty_member,
+                                                self.shopping_cart.total_quantity)
+        vat = ((subtotal - discount) * self.vat_rate).quantize(_CENT, ROUND_HALF_UP)
+        return subtotal, discount, vat, subtotal - discount + vat
+
+
+def make_specs(count, seed=0):
+    # (loyalty flag, [(catalog index, quantity), ...]) for `count` orders over a 1,000-title catalog
+    rng = random.Random(seed)
+    prices = [f"{rng.randint(99, 9_999) / 100:.2f}" for _ in range(1_000)]
+    specs = [(rng.random() < 0.4, [(rng.randrange(1_000), rng.randint(1, 3)) for _ in range(rng.randint(1, 5))])
+             for _ in range(count)]
+    return prices, specs
+
+
+def build(specs, ebooks, customers, cart_class, order_class, discount):
+    # Builds one order per spec
+    orders = []
+    for loyal, lines in specs:
+        cart = cart_class()
+        for index, quantity in lines:
+            cart.add_item(ebooks[index], quantity)
+        orders.append(order_class(customers[loyal], cart, discount))
+    return orders
+
+
+def timed(label, count, function, throughput, repeat=3, setup=None):
+    # Runs `function` `repeat` times, prints the best throughput (this box is noisy) and records it under `label`
+    # `setup`, if given, runs untimed before each repeat
+    best = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        result = function()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    print(f"{label:<34} {best:7.3f}s {count / best:12,.0f} orders/s")
+    throughput[label] = count / best
+    return result
+
+
+def end_to_end(specs, ebooks, customers, cart_class, order_class, discount):
+    # The whole order flow: build each cart and order, then render its invoice
+    for order in build(specs, ebooks, customers, cart_class, order_class, discount):
+        order.generate_invoice()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    prices, specs = make_specs(count)
+    customers = {loyal: Customer("Shopper", "s@example.com", "050-0000000", "Dubai", "Card", loyal)
+                 for loyal in (False, True)}
+    variants = [
+        ("float (previous)", [FloatEbook(f"Title {i}", float(price)) for i, price in enumerate(prices)],
+         FloatCart, FloatOrder, FloatDiscount()),
+        ("Decimal workaround", [FloatEbook(f"Title {i}", Decimal(price)) for i, price in enumerate(prices)],
+         DecimalCart, DecimalOrder, DecimalDiscount()),
+        ("Money / integer cents", [Ebook(f"Title {i}", "Author", "2020", "Genre", price, str(i), "Pub", "English")
+                                   for i, price in enumerate(prices)],
+         ShoppingCart, Order, Discount()),
+    ]
+    print(f"{count} orders")
+    results = {}
+    throughputs = {}  # variant name -> {benchmark label: orders/s}
+    for name, ebooks, cart_class, order_class, discount in variants:
+        print(f"--- {name}")
+        throughput = throughputs[name] = {}
+        orders = timed("build carts and orders", count,
+                       lambda: build(specs, ebooks, customers, cart_class, order_class, discount), throughput)
+        # Results are priced and dropped, as a checkout or invoicing run does
+        timed("calculate_total", count, lambda: deque(map(order_class.calculate_total, orders), maxlen=0),
+              throughput)
+        if order_class is Order:
+            # Orders priced again with unchanged inputs keep their Money totals; this is the first call on each order
+            timed("calculate_total (first call)", count,
+                  lambda: deque(map(order_class.calculate_total, orders), maxlen=0), throughput,
+                  setup=lambda: [order.__dict__.pop("_cached_total", None) for order in orders])
+            timed("calculate_total_cents", count,
+                  lambda: deque(map(Order.calculate_total_cents, orders), maxlen=0), throughput)
+        timed("generate_invoice", count, lambda: deque(map(order_class.generate_invoice, orders), maxlen=0),
+              throughput)
+        timed("end to end (build + invoice)", count,
+              lambda: end_to_end(specs, ebooks, customers, cart_class, order_class, discount), throughput)
+        results[name] = [order.calculate_total()[3] for order in orders]
+
+    # Each integer-cents benchmark relative to the float path doing the same work (above 1.00x is faster)
+    float_throughput, money_throughput = throughputs["float (previous)"], throughputs["Money / integer cents"]
+    print("--- Money / integer cents vs float")
+    for label, rate in money_throughput.items():
+        baseline = float_throughput[label if label in float_throughput else "calculate_total"]
+        print(f"{label:<34} {rate / baseline:5.2f}x")
+
+    # The exact paths agree to the cent; the float path drifts once its totals are added up
+    exact_totals = results["Decimal workaround"]
+    assert exact_totals == [total.to_decimal() for total in results["Money / integer cents"]]
+    exact = sum(exact_totals)
+    float_sum = sum(results["float (previous)"])
+    mismatched = sum(f"{a:.2f}" != f"{b}" for a, b in zip(results["float (previous)"], exact_totals))
+    print(f"revenue: exact {exact}, float {float_sum!r} (drift {Decimal(repr(float_sum)) - exact:+.6f});"
+          f" {mismatched} float totals print a different cent than the exact total")
+
+
+if __name__ == "__main__":
+    main()  # Run the money arithmetic benchmark
@@ -0,0 +1,57 @@
+import asyncio  # Run the pipeline and pace the offered load
+import random  # Seeded synthetic carts
+import sys  # Read the offered load from the command line
+import time  # Per-order latency
+
+from ebookstore import Ebook, Customer, ShoppingCart  # Import the classes used to build synthetic orders
+from ebookstore.order_pipeline import OrderPipeline, MemorySink  # Import the pipeline and its fake sink
+
+
+def percentile(sorted_values, fraction):
+    # Nearest-rank percentile of an already sorted list
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def offer_load(rate, seconds, sink_delay, persist_workers):
+    # Submits `rate` orders per second for `seconds` and returns the sorted due-to-persisted latencies
+    rng = random.Random(3)
+    ebooks = [Ebook(f"Title {i}", "Author", "2020", "Fiction", round(rng.uniform(1, 80), 2), str(i), "Penguin",
+                    "English") for i in range(200)]
+    customer = Customer("Load Tester", "load@example.com", "050-0000000", "Dubai", "Card", True)
+    latencies = []
+
+    def record(started):
+        return lambda future: latencies.append(time.perf_counter() - started)
+
+    sink = MemorySink(delay=sink_delay)
+    async with OrderPipeline(sink, queue_size=256, persist_workers=persist_workers) as pipeline:
+        interval = 1 / rate
+        begin = time.perf_counter()
+        for i in range(int(rate * seconds)):
+            # Open-loop pacing: each order is due at a fixed time regardless of how the previous ones did
+            due = begin + i * interval
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            cart = ShoppingCart()
+            for ebook in rng.sample(ebooks, rng.randint(1, 5)):
+                cart.add_item(ebook, rng.randint(1, 3))
+            future = await pipeline.submit(customer, cart)
+            # Latency counts from the due time, so time spent blocked by backpressure is included
+            future.add_done_callback(record(due))
+    return sorted(latencies)
+
+
+def main():
+    rate = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print(f"offered load {rate} orders/s for {seconds}s, sink latency 2 ms")
+    print(f"{'persist workers':>16} {'orders':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for persist_workers in (1, 8, 32):
+        latencies = asyncio.run(offer_load(rate, seconds, 0.002, persist_workers))
+        print(f"{persist_workers:>16} {len(latencies):>8} {percentile(latencies, 0.5) * 1e3:>8.2f} "
+              f"{percentile(latencies, 0.99) * 1e3:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()  # Run the pipeline latency benchmark
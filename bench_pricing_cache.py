@@ -0,0 +1,65 @@
+import itertools  # Cumulative weights for the Zipf draw
+import random  # Seeded Zipf-distributed carts
+import sys  # Read the order count from the command line
+import time  # Wall-clock timing
+
+from ebookstore import Ebook, Customer, ShoppingCart, Order, Discount  # Import the pricing classes
+from ebookstore.promotions import PromotionRule, RuleBasedDiscount  # Promotions make each uncached price more expensive
+from ebookstore.pricing_cache import PricingCache  # Import the cache under test
+from ebookstore.money import Money  # Price changes are made in exact money
+
+GENRES = ["Self-help", "Thriller", "Fantasy", "Romance", "Science", "History", "Biography", "Poetry"]
+
+
+def make_orders(count, discount, rng):
+    # Carts of one or two titles drawn from a Zipf-like popularity curve over 10k titles
+    ebooks = [Ebook(f"Title {i}", "Author", "2020", GENRES[i % len(GENRES)], round(rng.uniform(2, 60), 2), str(i),
+                    "Penguin", "English") for i in range(10_000)]
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) ** 1.1 for rank in range(len(ebooks))))
+    customers = [Customer("Member", "m@example.com", "050-0000000", "Dubai", "Card", True),
+                 Customer("Guest", "g@example.com", "050-0000000", "Dubai", "Card", False)]
+    orders = []
+    for _ in range(count):
+        cart = ShoppingCart()
+        for ebook in rng.choices(ebooks, cum_weights=cum_weights, k=rng.randint(1, 2)):
+            cart.add_item(ebook, 1)
+        orders.append(Order(rng.choice(customers), cart, discount))
+    return ebooks, orders
+
+
+def run(label, orders, cache):
+    # Prices every order, through the cache if one is given
+    start = time.perf_counter()
+    if cache is None:
+        results = [order.calculate_total() for order in orders]
+    else:
+        results = [cache.price_order(order) for order in orders]
+    seconds = time.perf_counter() - start
+    print(f"{label:<34} {seconds:>7.3f}s {len(orders) / seconds:>12,.0f} orders/s")
+    return results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    rng = random.Random(5)
+    rules = [PromotionRule(f"genre-{i}", tiers=[(1, 0.01), (2, 0.02)], genre=GENRES[i % len(GENRES)])
+             for i in range(200)]
+    for label, discount in (("plain Discount", Discount()), ("RuleBasedDiscount, 200 rules", RuleBasedDiscount(rules))):
+        ebooks, orders = make_orders(count, discount, rng)
+        print(f"--- {label}, {count} orders")
+        expected = run("calculate_total", orders, None)
+        cache = PricingCache(maxsize=50_000)
+        cached = run("PricingCache.price_order", orders, cache)
+        assert cached == expected
+        print(f"    {cache.stats()}")
+
+        # A price change must invalidate, and a reconfigured discount must not reuse old entries
+        ebooks[0].price += Money(1)
+        discount.loyalty_discount = 0.15
+        assert [cache.price_order(order) for order in orders[:1000]] == [order.calculate_total()
+                                                                       for order in orders[:1000]]
+        assert cache.invalidations == 1
+
+
+if __name__ == "__main__":
+    main()  # Run the pricing cache benchmark
@@ -0,0 +1,93 @@
+import random  # Seeded synthetic rules and carts
+import sys  # Read rule and cart counts from the command line
+import time  # Wall-clock timing
+from datetime import date, datetime  # Date windows for the synthetic rules
+from decimal import Decimal, ROUND_HALF_UP  # Exact reference arithmetic
+
+from ebookstore import Ebook, Customer, ShoppingCart, Order  # Import the order classes
+from ebookstore.promotions import PromotionRule, RuleBasedDiscount  # Import the rule engine under test
+from ebookstore.batch_pricing import price_orders  # Batch pricing must agree with the rule engine
+
+GENRES = ["Self-help", "Thriller", "Fantasy", "Romance", "Science", "History", "Biography", "Poetry"]
+PUBLISHERS = ["Penguin", "Celadon", "HarperCollins", "Macmillan", "Hachette", "Scholastic"]
+
+
+def make_rules(count, ebooks, rng):
+    # Mix of per-ISBN, per-publisher, per-genre, tiered and date-windowed rules
+    rules = []
+    for i in range(count):
+        kind = i % 4
+        window = (date(2020, 1, 1), date(2030, 12, 31)) if i % 5 else (date(2001, 1, 1), date(2001, 12, 31))
+        if kind == 0:
+            rule = PromotionRule(f"isbn-{i}", rate=0.05, isbn=rng.choice(ebooks).get_isbn())
+        elif kind == 1:
+            rule = PromotionRule(f"publisher-{i}", rate=0.01, publisher=rng.choice(PUBLISHERS),
+                                 genre=rng.choice(GENRES), starts=window[0], ends=window[1])
+        elif kind == 2:
+            rule = PromotionRule(f"genre-{i}", tiers=[(2, 0.01), (5, 0.02)], genre=rng.choice(GENRES),
+                                 starts=window[0], ends=window[1])
+        else:
+            rule = PromotionRule(f"isbn-tier-{i}", tiers=[(3, 0.1)], isbn=rng.choice(ebooks).get_isbn())
+        rules.append(rule)
+    return rules
+
+
+def naive_rule_discount(rules, cart, day):
+    # Reference evaluation: every rule is checked against every cart line, summed in Decimal and rounded once
+    discount = Decimal(0)
+    for rule in rules:
+        subtotal, quantity = Decimal(0), 0
+        for ebook, line_quantity in cart.items.items():
+            if rule.matches(ebook):
+                subtotal += ebook.price.to_decimal() * line_quantity
+                quantity += line_quantity
+        if quantity and rule.is_active(day):
+            discount += subtotal * Decimal(repr(rule.rate_for(quantity)))
+    return discount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def main():
+    rule_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    cart_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    rng = random.Random(7)
+    ebooks = [Ebook(f"Title {i}", "Author", "2020", GENRES[i % len(GENRES)], round(rng.uniform(2, 60), 2),
+                    str(i), PUBLISHERS[i % len(PUBLISHERS)], "English") for i in range(20_000)]
+    rules = make_rules(rule_count, ebooks, rng)
+    carts = []
+    for _ in range(cart_count):
+        cart = ShoppingCart()
+        for ebook in rng.sample(ebooks, rng.randint(1, 6)):
+            cart.add_item(ebook, rng.randint(1, 4))
+        carts.append(cart)
+    now = datetime.now()
+
+    start = time.perf_counter()
+    discount = RuleBasedDiscount(rules)
+    discount.rule_discount(carts[0], now)  # The first evaluation of the day compiles the plan
+    compile_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = [discount.rule_discount(cart, now) for cart in carts]
+    compiled_seconds = time.perf_counter() - start
+
+    # The naive loop is far slower, so it only runs on a sample and is extrapolated
+    sample = carts[:1_000]
+    start = time.perf_counter()
+    naive = [naive_rule_discount(rules, cart, now.date()) for cart in sample]
+    naive_seconds = (time.perf_counter() - start) * len(carts) / len(sample)
+    assert naive == [money.to_decimal() for money in compiled[:len(sample)]], "compiled plan disagrees with naive rules"
+
+    # Full orders priced one by one and in batch must agree exactly
+    customer = Customer("Promo Shopper", "p@example.com", "050-0000000", "Dubai", "Card", True)
+    orders = [Order(customer, cart, discount) for cart in sample]
+    batch = price_orders(orders)
+    assert list(batch.total) == [order.calculate_total()[3].cents for order in orders]
+
+    print(f"{rule_count} rules, {cart_count} carts")
+    print(f"compile:            {compile_seconds * 1e3:.2f} ms")
+    print(f"compiled plan:      {compiled_seconds:.3f}s ({cart_count / compiled_seconds:,.0f} carts/s)")
+    print(f"naive (estimated):  {naive_seconds:.3f}s ({cart_count / naive_seconds:,.0f} carts/s)")
+
+
+if __name__ == "__main__":
+    main()  # Run the promotion rule benchmark
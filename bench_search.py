@@ -0,0 +1,70 @@
+import itertools  # Cumulative weights for the Zipf-like word choice
+import random  # Seeded synthetic catalog and queries
+import sys  # Read the catalog size from the command line
+import time  # Latency measurements
+
+from ebookstore import Ebook  # Import the Ebook class to build a synthetic catalog
+from ebookstore.search import SearchIndex  # Import the search index under test
+
+SYLLABLES = ["ka", "lo", "mi", "ra", "te", "sun", "vel", "dor", "an", "is", "qu", "ze", "bar", "mon", "ith", "el"]
+GENRES = ["Self-help", "Thriller", "Fantasy", "Romance", "Science", "History", "Biography", "Poetry"]
+PUBLISHERS = ["Penguin", "Celadon", "HarperCollins", "Macmillan", "Hachette", "Scholastic"]
+
+
+def make_words(rng, count):
+    # Pseudo-words so the vocabulary and posting lengths resemble real titles
+    return ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(count)]
+
+
+def time_queries(func, queries):
+    # Returns the average latency per query in milliseconds
+    start = time.perf_counter()
+    for query in queries:
+        func(query)
+    return (time.perf_counter() - start) / len(queries) * 1e3
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(11)
+    words = make_words(rng, 20_000)
+    surnames = make_words(rng, 3_000)
+    # Zipf-like word choice: a few words are very common, most are rare
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(words))))
+    ebooks = [Ebook(" ".join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(1, 5))).title(),
+                    f"{rng.choice(surnames).title()} {rng.choice(surnames).title()}", "2020", rng.choice(GENRES),
+                    9.99, f"978{i:010d}", rng.choice(PUBLISHERS), "English") for i in range(count)]
+
+    start = time.perf_counter()
+    index = SearchIndex(ebooks)
+    build_seconds = time.perf_counter() - start
+
+    single = [rng.choice(words) for _ in range(500)]
+    multi = [f"{rng.choice(words[:200])} {rng.choice(words)}" for _ in range(500)]
+    prefixes = [f"{rng.choice(words[:200])} {rng.choice(words)[:3]}" for _ in range(500)]
+    # Incremental updates: add, re-ISBN and remove while the index is live
+    extra = Ebook("Zebra Quantum Garden", "New Author", "2024", "Science", 5.0, "new-1", "Penguin", "English")
+    index.add(extra)
+    extra.set_isbn("new2")
+    assert index.search("new2") == [extra] and index.search("zebra quantum") == [extra]
+    index.remove(extra)
+    assert index.search("zebra quantum") == []
+    # A live catalog adds titles between queries; each add must not make the next prefix query slower
+    added = [Ebook(f"Fresh {word.title()}", "New Author", "2024", "Science", 5.0, f"fresh-{i}", "Penguin", "English")
+             for i, word in enumerate(rng.sample(words, 50))]
+    start = time.perf_counter()
+    for ebook, query in zip(added, prefixes):
+        index.add(ebook)
+        index.search_prefix(query)
+    add_then_prefix = (time.perf_counter() - start) / len(added)
+
+    print(f"{count} titles: index built in {build_seconds:.1f}s")
+    print(f"add + prefix search: {add_then_prefix * 1e3:8.3f} ms/query")
+    print(f"single-term search:  {time_queries(index.search, single):8.3f} ms/query")
+    print(f"multi-term search:   {time_queries(index.search, multi):8.3f} ms/query")
+    print(f"prefix search:       {time_queries(index.search_prefix, prefixes):8.3f} ms/query")
+    print(f"complete():          {time_queries(lambda query: index.complete(query[-3:]), prefixes):8.3f} ms/query")
+
+
+if __name__ == "__main__":
+    main()  # Run the search latency benchmark
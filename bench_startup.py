@@ -0,0 +1,84 @@
+import compileall  # Make sure every module has cached bytecode, as an installed package would
+import os  # Locate the package next to this script
+import statistics  # Median over repeated cold starts
+import subprocess  # Each measurement runs in a fresh interpreter
+import sys  # Path of this interpreter; read the repeat count from the command line
+import time  # Wall-clock timing of whole processes
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# What a CLI tool or short-lived worker touches, from the bare interpreter up to the heaviest subsystem
+SCENARIOS = [
+    ("bare interpreter", "pass"),
+    ("import ebookstore", "import ebookstore"),
+    ("from ebookstore import *", "from ebookstore import *"),
+    ("+ ebookstore.OrderLedger", "import ebookstore; ebookstore.OrderLedger"),
+    ("+ ebookstore.EbookStore", "import ebookstore; ebookstore.EbookStore"),
+    ("+ ebookstore.SearchIndex", "import ebookstore; ebookstore.SearchIndex"),
+    ("+ ebookstore.OrderPipeline", "import ebookstore; ebookstore.OrderPipeline"),
+    ("+ ebookstore.price_orders", "import ebookstore; ebookstore.price_orders"),
+]
+
+# Seconds from interpreter start of user code to the first priced and invoiced order
+FIRST_ORDER = """
+import time
+start = time.perf_counter()
+from ebookstore import Ebook, Customer, ShoppingCart, Order
+imported = time.perf_counter()
+cart = ShoppingCart()
+cart.add_item(Ebook("Atomic Habits", "James Clear", "2018", "Self-help", "29.99", "12345", "Penguin", "English"), 2)
+order = Order(Customer("Zayed", "zayed@example.com", "050-1234567", "Dubai", "Credit Card", True), cart)
+order.calculate_total()
+order.generate_invoice()
+done = time.perf_counter()
+print(imported - start, done - imported)
+"""
+
+
+def run(arguments):
+    # Runs the interpreter with `arguments` from this directory; returns (wall seconds, stdout, stderr)
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, *arguments], cwd=HERE, capture_output=True, text=True, check=True)
+    return time.perf_counter() - start, result.stdout, result.stderr
+
+
+def import_times(code):
+    # {module: (self µs, cumulative µs)} reported by -X importtime for `code`; names keep their indentation,
+    # which shows who imported them
+    _, _, stderr = run(["-X", "importtime", "-c", code])
+    times = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "self [us]" not in line:
+            own, cumulative, name = line[len("import time:"):].split("|")
+            times[name[1:].rstrip()] = (int(own), int(cumulative))
+    return times
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    compileall.compile_dir(os.path.join(HERE, "ebookstore"), quiet=1)
+    baseline = {name.strip() for name in import_times("pass")}  # Loaded before any user code
+
+    print(f"cold start, median of {repeat} processes (modules beyond the bare interpreter, from -X importtime)")
+    print(f"{'scenario':<30} {'wall ms':>8} {'import ms':>10} {'modules':>8}")
+    for label, code in SCENARIOS:
+        wall = statistics.median(run(["-c", code])[0] for _ in range(repeat))
+        times = {name: value for name, value in import_times(code).items() if name.strip() not in baseline}
+        # Only top-level entries count; their cumulative time already includes everything they imported
+        top_level = sum(cumulative for name, (_, cumulative) in times.items() if not name.startswith(" "))
+        print(f"{label:<30} {wall * 1e3:>8.1f} {top_level / 1e3:>10.1f} {len(times):>8}")
+
+    print("\nslowest modules behind `import ebookstore` (self time):")
+    times = {name.strip(): value for name, value in import_times("import ebookstore").items()
+             if name.strip() not in baseline}
+    for name, (own, cumulative) in sorted(times.items(), key=lambda item: -item[1][0])[:8]:
+        print(f"  {name:<28} {own / 1e3:>6.2f} ms self {cumulative / 1e3:>8.2f} ms cumulative")
+
+    samples = [tuple(map(float, run(["-c", FIRST_ORDER])[1].split())) for _ in range(repeat)]
+    print(f"\nfirst order in a fresh process (median of {repeat}):")
+    print(f"  import ebookstore core        {statistics.median(s[0] for s in samples) * 1e3:>7.2f} ms")
+    print(f"  first cart, total and invoice {statistics.median(s[1] for s in samples) * 1e3:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()  # Run the startup benchmark
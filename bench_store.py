@@ -0,0 +1,62 @@
+import json  # The JSON load path the binary store replaces
+import os  # File sizes and scratch paths
+import subprocess  # Measure cold starts in fresh interpreters
+import sys  # Read the catalog size from the command line; path of this interpreter
+import tempfile  # Scratch directory for the generated files
+import time  # Export timing
+
+from ebookstore import Ebook  # Import the Ebook class to build a synthetic catalog
+from ebookstore.store import export_ebooks  # Import the binary store writer
+
+GENRES = ["Self-help", "Thriller", "Fantasy", "Romance", "Science", "History", "Biography", "Poetry"]
+
+# Each cold start runs in a new interpreter and prints the seconds from start of loading to first lookup
+JSON_START = """
+import json, sys, time
+start = time.perf_counter()
+from ebookstore import Ebook
+with open(sys.argv[1]) as f:
+    catalog = {row[5]: Ebook(*row) for row in json.load(f)}
+catalog[sys.argv[2]].title
+print(time.perf_counter() - start)
+"""
+STORE_START = """
+import sys, time
+start = time.perf_counter()
+from ebookstore.store import EbookStore
+catalog = EbookStore(sys.argv[1])
+catalog.get(sys.argv[2]).title
+print(time.perf_counter() - start)
+"""
+
+
+def cold_start(script, path, isbn):
+    # Runs `script` in a fresh interpreter and returns the seconds it reports
+    output = subprocess.run([sys.executable, "-c", script, path, isbn], check=True, capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    return float(output.stdout)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows = [(f"Title {i}", f"Author {i % 5000}", str(1950 + i % 75), GENRES[i % len(GENRES)], 9.99 + i % 40,
+             f"978{i:010d}", "Penguin", "English") for i in range(count)]
+    isbn = rows[count // 2][5]
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "catalog.json")
+        store_path = os.path.join(directory, "catalog.bin")
+        with open(json_path, "w") as json_file:
+            json.dump(rows, json_file)
+        start = time.perf_counter()
+        export_ebooks([Ebook(*row) for row in rows], store_path)
+        export_seconds = time.perf_counter() - start
+
+        print(f"{count} titles")
+        print(f"export_ebooks:         {export_seconds:.2f}s, {os.path.getsize(store_path) / 1e6:.1f} MB "
+              f"(JSON {os.path.getsize(json_path) / 1e6:.1f} MB)")
+        print(f"JSON cold start:       {cold_start(JSON_START, json_path, isbn) * 1e3:.1f} ms to first lookup")
+        print(f"mmap store cold start: {cold_start(STORE_START, store_path, isbn) * 1e3:.1f} ms to first lookup")
+
+
+if __name__ == "__main__":
+    main()  # Run the cold-start benchmark
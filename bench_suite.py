@@ -0,0 +1,161 @@
+import argparse  # Command-line options for scales, distributions and output
+import gc  # Keep collector pauses out of the timed sections
+import json  # Machine-readable results
+import platform  # Interpreter and machine details stored with the results
+import subprocess  # Record the git commit the numbers belong to
+import sys  # Exit status for regression checks
+import time  # Wall-clock timing
+from datetime import datetime, timezone  # Timestamp of the run
+
+from ebookstore import Ebook, Customer, ShoppingCart, Order, Discount, NullEventSink  # Import the classes under test
+from ebookstore.synthetic import SyntheticStore  # Seeded catalog, customer and cart generator
+
+SCHEMA_VERSION = 1  # Bumped if the layout of the results file changes
+
+
+# === Measurement ===
+def measure(run, setup=None, repeat=5):
+    # Best-of-`repeat` seconds for run(state), where state = setup() is rebuilt (untimed) before every repeat
+    best = None
+    for _ in range(repeat):
+        state = setup() if setup is not None else None
+        gc.collect()
+        gc.disable()  # Like timeit: collector pauses depend on everything else alive in the process
+        try:
+            start = time.perf_counter()
+            run(state)
+            seconds = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def fill(lines_per_cart):
+    # Empty carts (silent, so no console output is timed) paired with the lines to add to them
+    return [(ShoppingCart(NullEventSink()), lines) for lines in lines_per_cart]
+
+
+def add_lines(carts):
+    for cart, lines in carts:
+        for ebook, quantity in lines:
+            cart.add_item(ebook, quantity)
+
+
+def remove_lines(carts):
+    for cart, lines in carts:
+        for ebook, quantity in lines:
+            cart.remove_item(ebook, quantity)
+
+
+def filled(lines_per_cart):
+    # Carts with every line already added, ready for remove_lines
+    carts = fill(lines_per_cart)
+    add_lines(carts)
+    return carts
+
+
+def run_scale(store, scale, repeat):
+    # Runs every benchmark with `scale` carts/orders; the catalog and customer base grow with the scale
+    ebook_count, customer_count = max(100, scale // 4), max(10, scale // 10)
+    ebook_fields = store.ebook_fields(ebook_count)
+    customer_fields = store.customer_fields(customer_count)
+    ebooks = [Ebook(*fields) for fields in ebook_fields]
+    customers = [Customer(*fields) for fields in customer_fields]
+    lines_per_cart = store.cart_lines(scale, ebooks)
+    line_count = sum(len(lines) for lines in lines_per_cart)
+    discount = Discount()
+    orders = [Order(customers[index % customer_count], cart, discount)
+              for index, (cart, _lines) in enumerate(filled(lines_per_cart))]
+
+    benchmarks = [
+        ("construct_ebook", ebook_count, lambda state: [Ebook(*fields) for fields in ebook_fields], None),
+        ("construct_customer", customer_count,
+         lambda state: [Customer(*fields) for fields in customer_fields], None),
+        ("construct_order", scale,
+         lambda state: [Order(order.customer, order.shopping_cart, discount) for order in orders], None),
+        ("add_item", line_count, add_lines, lambda: fill(lines_per_cart)),
+        ("remove_item", line_count, remove_lines, lambda: filled(lines_per_cart)),
+        ("calculate_total", scale, lambda state: [order.calculate_total() for order in orders], None),
+        ("generate_invoice", scale, lambda state: [order.generate_invoice() for order in orders], None),
+    ]
+    results = []
+    for name, ops, run, setup in benchmarks:
+        seconds = measure(run, setup, repeat)
+        results.append({"benchmark": name, "scale": scale, "ops": ops, "seconds": seconds,
+                        "ns_per_op": seconds / ops * 1e9, "ops_per_second": ops / seconds})
+        print(f"{scale:>9,} {name:<20} {ops:>10,} ops {seconds:>9.4f}s {seconds / ops * 1e9:>10,.0f} ns/op")
+    return results
+
+
+def git_commit():
+    # Current git commit, or None outside a repository
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# === Regression Check ===
+def compare(results, baseline, threshold):
+    # Prints each benchmark's ns/op against the baseline file; returns the (benchmark, scale) pairs that got
+    # more than `threshold` (e.g. 0.10 = 10%) slower
+    previous = {(entry["benchmark"], entry["scale"]): entry["ns_per_op"] for entry in baseline["results"]}
+    regressions = []
+    for entry in results:
+        key = (entry["benchmark"], entry["scale"])
+        if key not in previous:
+            continue
+        ratio = entry["ns_per_op"] / previous[key]
+        flag = "REGRESSION" if ratio > 1 + threshold else ""
+        if flag:
+            regressions.append(key)
+        print(f"{key[1]:>9,} {key[0]:<20} {previous[key]:>10,.0f} -> {entry['ns_per_op']:>10,.0f} ns/op "
+              f"({ratio - 1:+.1%}) {flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pricing and invoicing benchmark suite")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="number of carts/orders per run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--lines", default="geometric:3", help="lines per cart distribution")
+    parser.add_argument("--quantity", default="geometric:1.5", help="copies per line distribution")
+    parser.add_argument("--popularity", type=float, default=1.0, help="Zipf exponent of title popularity")
+    parser.add_argument("--loyalty-rate", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=5, help="repeats per benchmark (the best is kept)")
+    parser.add_argument("--output", default="bench_suite.json", help="where to write the JSON results")
+    parser.add_argument("--compare", help="earlier results file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    store = SyntheticStore(args.seed, args.lines, args.quantity, args.popularity, args.loyalty_rate)
+    results = []
+    for scale in args.scales:
+        results.extend(run_scale(store, scale, args.repeat))
+    report = {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.platform(),
+        "generator": store.settings(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    with open(args.output, "w") as results_file:
+        json.dump(report, results_file, indent=2)
+    print(f"results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()  # Run the benchmark suite
@@ -0,0 +1,46 @@
+import importlib  # Loads optional subsystems on first use
+
+# The core shop classes are always loaded; they only need the standard library
+from .core import (Item, Ebook, Customer, NullEventSink, PrintEventSink, BufferedLogSink, ShoppingCart, Discount,
+                   Order, write_invoices)  # Catalog, customers, carts, discounts, orders and invoices
+from .money import Money  # Exact integer-cents amounts
+
+# `from ebookstore import *` brings in the core only, so it never loads an optional subsystem
+__all__ = ["Item", "Ebook", "Customer", "NullEventSink", "PrintEventSink", "BufferedLogSink", "ShoppingCart",
+           "Discount", "Order", "write_invoices", "Money"]
+
+# Optional subsystems and the names they export; each submodule (and numpy, asyncio, mmap ... behind it) is only
+# imported the first time one of its names is looked up on the package, e.g. ebookstore.SearchIndex
+_LAZY_MODULES = {
+    "search": ["SearchIndex"],
+    "catalog": ["Catalog"],
+    "columnar": ["EbookTable"],
+    "store": ["EbookStore", "CustomerStore", "export_ebooks", "export_customers"],
+    "batch_pricing": ["BatchTotals", "price_lines", "price_subtotals", "price_carts", "price_orders"],
+    "bulk_orders": ["OrderResult", "process_orders"],
+    "order_pipeline": ["OrderPipeline", "MemorySink"],
+    "promotions": ["PromotionRule", "RuleBasedDiscount"],
+    "pricing_cache": ["PricingCache"],
+    "concurrent_cart": ["ConcurrentShoppingCart", "CartRegistry"],
+    "ledger": ["OrderLedger", "SalesRollups"],
+    "instrumentation": [],
+    "synthetic": ["SyntheticStore"],
+}
+_LAZY_NAMES = {name: module for module, names in _LAZY_MODULES.items() for name in names}
+
+
+def __getattr__(name):
+    # Module-level fallback for names not loaded yet: imports the submodule that provides `name`
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Later lookups skip this function
+    return value
+
+
+def __dir__():
+    # Lazy names are listed even before they are loaded
+    return sorted(set(globals()) | set(_LAZY_MODULES) | set(_LAZY_NAMES))
@@ -0,0 +1,166 @@
+from collections import namedtuple  # Lightweight result container
+from decimal import (ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP,
+                     ROUND_UP)  # Rounding modes for the vectorized divide
+
+import numpy as np  # Vectorized arithmetic over whole batches of carts
+
+from .core import Discount  # Default discount rates when pricing bare carts
+from .money import rate_units, RATE_SCALE  # Rates are applied as exact integer fractions
+from .promotions import RuleBasedDiscount  # Orders whose discounts include promotional rules
+
+# Per-cart results of a batch pricing run; each field is an int64 array of cents with one entry per cart,
+# matching the .cents of the (subtotal, discount, vat, total) Money tuple returned by Order.calculate_total()
+BatchTotals = namedtuple("BatchTotals", ["subtotal", "discount", "vat", "total"])
+
+_INT64_LIMIT = 2 ** 63 - 1
+# apply_discount_cents() implementations that _price() reproduces; orders using any other cannot be batch priced
+_BATCH_DISCOUNTS = (Discount.apply_discount_cents, RuleBasedDiscount.apply_discount_cents)
+_pydivmod = np.frompyfunc(divmod, 2, 2)  # divmod over object arrays of Python ints, which np.divmod rejects
+
+
+# === Batch Pricing ===
+def price_lines(price_cents, quantities, line_counts, loyalty_mask, discount=None, vat_rate=0.08,
+                vat_rounding=ROUND_HALF_UP):
+    # Prices many carts given flat line arrays:
+    #   price_cents, quantities - one entry per cart line (prices in integer cents), carts stored back to back
+    #   line_counts             - number of lines in each cart
+    #   loyalty_mask            - True for carts belonging to loyalty members
+    line_counts = np.asarray(line_counts, dtype=np.int64)
+    cart_starts = np.concatenate(([0], np.cumsum(line_counts)[:-1]))
+    quantities = np.asarray(quantities, dtype=np.int64)
+    line_totals = np.asarray(price_cents, dtype=np.int64) * quantities
+    # Integer sums are exact, so the order lines are added in does not matter
+    subtotal = _sum_per_cart(line_totals, cart_starts, line_counts)
+    total_quantities = _sum_per_cart(quantities, cart_starts, line_counts)
+    return price_subtotals(subtotal, total_quantities, loyalty_mask, discount, vat_rate, vat_rounding)
+
+
+def price_subtotals(subtotals, total_quantities, loyalty_mask, discount=None, vat_rate=0.08,
+                    vat_rounding=ROUND_HALF_UP):
+    # Applies discount and VAT to carts whose subtotals (in cents) and total quantities are already known
+    # Promotional rules need the cart lines, so only the loyalty and bulk rates are used here
+    if discount is None:
+        discount = Discount()
+    return _price(subtotals, total_quantities, loyalty_mask, rate_units(discount.loyalty_discount),
+                  rate_units(discount.bulk_discount), discount.bulk_threshold, rate_units(vat_rate),
+                  discount.rounding, vat_rounding)
+
+
+def price_carts(carts, loyalty_members, discount=None, vat_rate=0.08, vat_rounding=ROUND_HALF_UP):
+    # Prices a sequence of ShoppingCart objects with one Discount and VAT rate for the whole batch
+    # Each cart's running subtotal is used as-is, so results match Order.calculate_total() exactly
+    carts = [cart.snapshot() for cart in carts]  # Subtotal and quantity read from the same contents
+    return price_subtotals([cart.subtotal_cents for cart in carts], [cart.total_quantity for cart in carts],
+                           loyalty_members, discount, vat_rate, vat_rounding)
+
+
+def price_orders(orders):
+    # Prices a sequence of Order objects, honouring each order's own Discount rates, VAT rate and rounding modes
+    # Orders using a RuleBasedDiscount get their promotional discount evaluated per cart; any other Discount
+    # subclass that overrides apply_discount_cents() cannot be vectorized and raises TypeError
+    orders = list(orders)
+    for order in orders:
+        if type(order.discount).apply_discount_cents not in _BATCH_DISCOUNTS:
+            raise TypeError(f"Cannot batch price {type(order.discount).__name__}: it overrides apply_discount_cents()")
+    # One snapshot per order, so its subtotal, quantity and promotions all describe the same contents
+    carts = [order.shopping_cart.snapshot() for order in orders]
+    rule_discounts = [order.discount.rule_discount(cart, order.order_date)
+                      if isinstance(order.discount, RuleBasedDiscount) else None for order, cart in zip(orders, carts)]
+    has_rules = [value is not None for value in rule_discounts]
+    return _price([cart.subtotal_cents for cart in carts], [cart.total_quantity for cart in carts],
+                  [order.customer.loyalty_member for order in orders],
+                  np.array([rate_units(order.discount.loyalty_discount) for order in orders], dtype=np.int64),
+                  np.array([rate_units(order.discount.bulk_discount) for order in orders], dtype=np.int64),
+                  np.array([order.discount.bulk_threshold for order in orders]),
+                  np.array([rate_units(order.vat_rate) for order in orders], dtype=np.int64),
+                  np.array([order.discount.rounding for order in orders]),
+                  np.array([order.vat_rounding for order in orders]),
+                  np.array([value.cents if value is not None else 0 for value in rule_discounts], dtype=np.int64)
+                  if any(has_rules) else None,
+                  has_rules)
+
+
+def flatten_carts(carts):
+    # Collects every cart's lines into flat price (cents) / quantity lists plus a line count per cart,
+    # ready for price_lines()
+    price_cents, quantities, line_counts = [], [], []
+    for cart in carts:
+        items = cart.items
+        line_counts.append(len(items))
+        price_cents.extend([ebook.price_cents for ebook in items])
+        quantities.extend(items.values())
+    return price_cents, quantities, line_counts
+
+
+def _sum_per_cart(values, cart_starts, line_counts):
+    # Sums consecutive runs of `values`, one run per cart (empty carts sum to zero), as differences of a running sum
+    running = np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+    return running[cart_starts + line_counts] - running[cart_starts]
+
+
+def _price(subtotal, total_quantities, loyalty_mask, loyalty_units, bulk_units, bulk_threshold, vat_units,
+           rounding, vat_rounding, rule_discounts=None, has_rules=None):
+    # Vectorized version of the discount/VAT steps of Order.calculate_total(), in integer cents;
+    # rates are exact units over RATE_SCALE and every rounding step matches the scalar path exactly
+    subtotal = np.asarray(subtotal, dtype=np.int64)
+    total_quantities = np.asarray(total_quantities)
+    loyalty_mask = np.asarray(loyalty_mask, dtype=bool)
+    units = np.where(loyalty_mask, loyalty_units, 0)
+    # Bulk discount is keyed on the total number of copies, as in Order.calculate_total()
+    units = np.where(total_quantities >= bulk_threshold, units + bulk_units, units)
+    discount = _apply_units(subtotal, units, rounding)
+    if rule_discounts is not None:
+        # Same as RuleBasedDiscount.apply_discount_cents(): add promotions, capped at the subtotal
+        discount = np.where(has_rules, np.minimum(discount + rule_discounts, subtotal), discount)
+    discounted = subtotal - discount
+    vat = _apply_units(discounted, vat_units, vat_rounding)
+    total = discounted + vat
+    return BatchTotals(subtotal, discount, vat, total)
+
+
+def _apply_units(cents, units, rounding):
+    # cents * units / RATE_SCALE rounded to whole cents; `units` and `rounding` may be scalars or per-cart arrays
+    units = np.broadcast_to(np.asarray(units, dtype=np.int64), cents.shape)
+    # Reduce each rate to lowest terms (0.08 -> 2/25) so the products stay well inside int64
+    common = np.gcd(units, RATE_SCALE)
+    numerators, denominators = units // common, RATE_SCALE // common
+    if len(cents) and int(np.abs(cents).max()) * int(np.abs(numerators).max()) > _INT64_LIMIT:
+        # Amounts this large fall back to Python integers, which are slower but never overflow
+        cents, numerators, denominators = cents.astype(object), numerators.astype(object), denominators.astype(object)
+    products = cents * numerators
+    if np.ndim(rounding) == 0:
+        return _divide(products, denominators, rounding)
+    result = np.empty(len(cents), dtype=products.dtype)
+    for mode in np.unique(rounding):
+        mask = rounding == mode
+        result[mask] = _divide(products[mask], denominators[mask], str(mode))
+    return result.astype(np.int64)
+
+
+def _divide(numerators, denominators, rounding):
+    # Vectorized money.divide(): integer division by positive denominators rounded with a decimal rounding mode
+    if numerators.dtype == object:
+        quotients, remainders = _pydivmod(numerators, denominators)
+    else:
+        quotients, remainders = np.divmod(numerators, denominators)
+    inexact = remainders != 0
+    if rounding in (ROUND_HALF_UP, ROUND_HALF_EVEN, ROUND_HALF_DOWN):
+        twice = 2 * remainders
+        if rounding == ROUND_HALF_UP:
+            tie_up = numerators > 0
+        elif rounding == ROUND_HALF_DOWN:
+            tie_up = numerators < 0
+        else:
+            tie_up = (quotients % 2) == 1
+        up = (twice > denominators) | ((twice == denominators) & tie_up)
+    elif rounding == ROUND_FLOOR:
+        up = np.zeros(len(quotients), dtype=bool)
+    elif rounding == ROUND_CEILING:
+        up = inexact
+    elif rounding == ROUND_DOWN:
+        up = inexact & (numerators < 0)
+    elif rounding == ROUND_UP:
+        up = inexact & (numerators > 0)
+    else:
+        raise ValueError(f"Unsupported rounding mode: {rounding!r}")
+    return (quotients + up).astype(np.int64)
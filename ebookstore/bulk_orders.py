@@ -0,0 +1,89 @@
+import os  # Default number of shards in flight
+from collections import deque, namedtuple  # Shards in flight; lightweight, picklable result records
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # Worker pools for sharded processing
+from datetime import datetime  # One order date shared by the whole run
+
+from .core import Ebook, Customer, ShoppingCart, Order, Discount  # Rebuild orders inside the workers
+from .money import Money  # Prices travel to the workers as integer cents
+
+# Outcome of one (customer, cart) pair, in the same order the pairs were given
+OrderResult = namedtuple("OrderResult", ["customer_name", "subtotal", "discount", "vat", "total", "invoice"])
+
+
+# === Bulk Order Processing ===
+def process_orders(pairs, discount=None, vat_rate=0.08, workers=None, executor="process", chunk_size=2_000,
+                   order_date=None):
+    # Builds an Order and its invoice for every (Customer, ShoppingCart) pair, spread over a worker pool
+    #   executor   - "process" (default), "thread" or "inline" (no pool at all)
+    #   workers    - pool size (default: the executor's own default, i.e. one per CPU)
+    #   chunk_size - pairs per shard sent to a worker; bigger shards mean less pickling overhead
+    # Results come back as OrderResult records in input order, whatever the pool size
+    discount = discount if discount is not None else Discount()
+    order_date = order_date or datetime.now()
+    # Shards are built as they are sent, so only the ones in flight are ever held in memory
+    shards = ((payloads, discount, vat_rate, order_date) for payloads in _shard(pairs, chunk_size))
+    if executor == "inline":
+        return [result for shard in shards for result in _process_shard(shard)]
+    if executor == "process":
+        try:
+            pool = ProcessPoolExecutor(max_workers=workers)
+        except (OSError, NotImplementedError):
+            # Some sandboxes cannot start worker processes; process the shards here instead
+            return [result for shard in shards for result in _process_shard(shard)]
+    elif executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        raise ValueError(f"Unknown executor: {executor!r}")
+    with pool:
+        return [result for shard_results in _map_lazily(pool, shards, 2 * (workers or os.cpu_count() or 1))
+                for result in shard_results]
+
+
+def order_payload(customer, shopping_cart):
+    # Compact, picklable form of one pair: only the fields pricing and invoicing read
+    # (customer name and loyalty flag; ISBN, title, genre, publisher, price in cents and quantity per line)
+    return (customer.name, customer.loyalty_member,
+            [(ebook.get_isbn(), ebook.title, ebook.genre, ebook.publisher, ebook.price_cents, quantity)
+             for ebook, quantity in shopping_cart.items.items()])
+
+
+def _shard(pairs, chunk_size):
+    # Converts pairs to payloads and groups them into lists of at most `chunk_size`
+    shard = []
+    for customer, shopping_cart in pairs:
+        shard.append(order_payload(customer, shopping_cart))
+        if len(shard) >= chunk_size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+
+def _map_lazily(pool, shards, in_flight):
+    # Like pool.map(_process_shard, shards), which submits every shard up front, but with at most `in_flight`
+    # shards submitted at a time; results are yielded in input order
+    pending = deque()
+    for shard in shards:
+        if len(pending) >= in_flight:
+            yield pending.popleft().result()
+        pending.append(pool.submit(_process_shard, shard))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _process_shard(shard):
+    # Worker entry point: rebuilds each order from its payload, prices it and renders the invoice
+    payloads, discount, vat_rate, order_date = shard
+    results = []
+    for name, loyalty_member, lines in payloads:
+        # Only the attributes used by pricing and invoicing are restored; the rest are left blank
+        customer = Customer(name, "", "", "", "", loyalty_member)
+        cart = ShoppingCart()
+        for isbn, title, genre, publisher, price_cents, quantity in lines:
+            cart.add_item(Ebook(title, "", "", genre, Money.from_cents(price_cents), isbn, publisher, ""), quantity)
+        order = Order(customer, cart, discount)
+        order.vat_rate = vat_rate
+        order.order_date = order_date
+        subtotal, order_discount, vat, total = order.calculate_total()
+        results.append(OrderResult(name, subtotal, order_discount, vat, total, order.generate_invoice()))
+    return results
@@ -0,0 +1,123 @@
+# === Catalog Management ===
+class Catalog:
+    """Owns the store's Ebook instances and indexes them by ISBN, author, genre, publisher, language and year."""
+
+    # Secondary index names mapped to the function that extracts the key from an ebook
+    INDEXED_FIELDS = {
+        "author": lambda ebook: ebook.author,
+        "genre": lambda ebook: ebook.genre,
+        "publisher": lambda ebook: ebook.publisher,
+        "language": lambda ebook: ebook.language,
+        "year": lambda ebook: publication_year(ebook.publication_date),
+    }
+
+    def __init__(self, ebooks=()):
+        # Primary hash index: ISBN -> Ebook, giving O(1) lookups by ISBN
+        self._by_isbn = {}
+        # Secondary indexes: field name -> {key -> {ebook: None}}
+        # The inner dicts act as insertion-ordered sets so removals are O(1)
+        self._indexes = {field: {} for field in self.INDEXED_FIELDS}
+        # Ebook -> {field: key} it is filed under, so it can be unindexed after its attributes change in place
+        self._keys = {}
+        self.add_many(ebooks)
+
+    def __len__(self):
+        # Number of ebooks currently in the catalog
+        return len(self._by_isbn)
+
+    def __iter__(self):
+        # Iterate over ebooks in the order they were added
+        return iter(self._by_isbn.values())
+
+    def __contains__(self, isbn):
+        # Allows `isbn in catalog` checks
+        return isbn in self._by_isbn
+
+    def add(self, ebook):
+        # Adds an ebook to the catalog and every index; ISBNs must be unique
+        isbn = ebook.get_isbn()
+        if isbn in self._by_isbn:
+            raise ValueError(f"Duplicate ISBN in catalog: {isbn}")
+        self._by_isbn[isbn] = ebook
+        self._index(ebook)
+        # Watch the ebook so set_isbn() keeps the primary index in sync
+        ebook.add_watcher(self)
+        return ebook
+
+    def add_many(self, ebooks):
+        # Adds several ebooks at once
+        for ebook in ebooks:
+            self.add(ebook)
+
+    def remove(self, isbn):
+        # Removes and returns the ebook with the given ISBN (KeyError if absent)
+        ebook = self._by_isbn.pop(isbn)
+        self._unindex(ebook)
+        ebook.remove_watcher(self)
+        return ebook
+
+    def update(self, ebook):
+        # Re-indexes an ebook whose author, genre, publisher, language or publication date changed
+        self._unindex(ebook)
+        self._index(ebook)
+
+    def get(self, isbn, default=None):
+        # O(1) lookup of an ebook by ISBN
+        return self._by_isbn.get(isbn, default)
+
+    def isbn_changed(self, ebook, old_isbn):
+        # Called by Ebook.set_isbn() to move the ebook to its new ISBN key
+        new_isbn = ebook.get_isbn()
+        if new_isbn == old_isbn:
+            return
+        if new_isbn in self._by_isbn:
+            raise ValueError(f"Duplicate ISBN in catalog: {new_isbn}")
+        del self._by_isbn[old_isbn]
+        self._by_isbn[new_isbn] = ebook
+
+    def _index(self, ebook):
+        # Files an ebook under its current key in every secondary index
+        keys = self._keys[ebook] = {field: key_of(ebook) for field, key_of in self.INDEXED_FIELDS.items()}
+        for field, key in keys.items():
+            self._indexes[field].setdefault(key, {})[ebook] = None
+
+    def _unindex(self, ebook):
+        # Removes an ebook from the secondary indexes under the keys it was filed with (KeyError if never added)
+        for field, key in self._keys.pop(ebook).items():
+            index = self._indexes[field]
+            bucket = index[key]
+            del bucket[ebook]
+            if not bucket:
+                # Drop empty buckets so the index does not grow with stale keys
+                del index[key]
+
+    def _lookup(self, field, key):
+        # Returns the ebooks stored under `key` in a secondary index, in insertion order
+        return list(self._indexes[field].get(key, ()))
+
+    def by_author(self, author):
+        # All ebooks written by the given author
+        return self._lookup("author", author)
+
+    def by_genre(self, genre):
+        # All ebooks in the given genre
+        return self._lookup("genre", genre)
+
+    def by_publisher(self, publisher):
+        # All ebooks from the given publisher
+        return self._lookup("publisher", publisher)
+
+    def by_language(self, language):
+        # All ebooks in the given language
+        return self._lookup("language", language)
+
+    def by_year(self, year):
+        # All ebooks published in the given year (an int)
+        return self._lookup("year", year)
+
+
+def publication_year(publication_date):
+    # Extracts the year from a publication date string such as "2018" or "2018-05-01"
+    # Returns None when the date does not start with a four-digit year
+    year = str(publication_date)[:4]
+    return int(year) if year.isdigit() else None
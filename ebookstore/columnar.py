@@ -0,0 +1,171 @@
+import sys  # sys.intern to share repeated strings between rows
+from array import array  # Compact typed array for prices
+
+from .core import Item, Ebook  # Reuse Ebook's string formatting and Item's price epoch for row views
+from .money import Money, to_cents  # Prices are stored as integer cents
+
+
+# === Columnar Ebook Storage ===
+class EbookTable:
+    """Stores ebooks column by column: interned strings in lists and prices (in cents) in an array('q')."""
+
+    def __init__(self, ebooks=()):
+        # One list (or array) per attribute; row i of the table is index i in every column
+        self.titles = []
+        self.authors = []
+        self.publication_dates = []
+        self.genres = []
+        self.isbns = []
+        self.publishers = []
+        self.languages = []
+        self.prices = array("q")  # Integer cents, 8 bytes per price instead of an object each
+        self._row_by_isbn = {}  # ISBN -> row number for O(1) lookups
+        # Row number -> watchers (catalogs, search indexes) of that row; kept here because row views come and go
+        self._watchers = {}
+        for ebook in ebooks:
+            self.add_ebook(ebook)
+
+    def __len__(self):
+        # Number of rows in the table
+        return len(self.isbns)
+
+    def __getitem__(self, index):
+        # Returns a lightweight view of row `index`
+        if not -len(self) <= index < len(self):
+            raise IndexError("EbookTable index out of range")
+        return EbookRow(self, index % len(self))
+
+    def __iter__(self):
+        # Iterate over row views in insertion order
+        return (EbookRow(self, index) for index in range(len(self)))
+
+    def append(self, title, author, publication_date, genre, price, isbn, publisher, language):
+        # Adds a row using the same argument order as Ebook() and returns its view
+        if isbn in self._row_by_isbn:
+            raise ValueError(f"Duplicate ISBN in table: {isbn}")
+        index = len(self.isbns)
+        self.titles.append(title)
+        # Low-cardinality columns are interned so every row shares one string object
+        self.authors.append(sys.intern(author))
+        self.publication_dates.append(sys.intern(publication_date))
+        self.genres.append(sys.intern(genre))
+        self.publishers.append(sys.intern(publisher))
+        self.languages.append(sys.intern(language))
+        self.prices.append(to_cents(price))
+        self.isbns.append(isbn)
+        self._row_by_isbn[isbn] = index
+        return EbookRow(self, index)
+
+    def add_ebook(self, ebook):
+        # Copies an existing Ebook object into the table
+        return self.append(ebook.title, ebook.author, ebook.publication_date, ebook.genre, ebook.price,
+                           ebook.get_isbn(), ebook.publisher, ebook.language)
+
+    def get(self, isbn, default=None):
+        # Returns the row view for an ISBN, or `default` if it is not stored
+        index = self._row_by_isbn.get(isbn)
+        return default if index is None else EbookRow(self, index)
+
+    def _rekey(self, index, old_isbn, isbn):
+        # Moves row `index` from old_isbn to isbn in the ISBN column and index
+        del self._row_by_isbn[old_isbn]
+        self._row_by_isbn[isbn] = index
+        self.isbns[index] = isbn
+
+
+class EbookRow:
+    """A view of one EbookTable row that behaves like an Ebook (title, price, get_isbn, __str__ ...)."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+        # A view only remembers which table and row it points at
+        self._table = table
+        self._index = index
+
+    @property
+    def title(self):
+        return self._table.titles[self._index]
+
+    @property
+    def author(self):
+        return self._table.authors[self._index]
+
+    @property
+    def publication_date(self):
+        return self._table.publication_dates[self._index]
+
+    @property
+    def genre(self):
+        return self._table.genres[self._index]
+
+    @property
+    def publisher(self):
+        return self._table.publishers[self._index]
+
+    @property
+    def language(self):
+        return self._table.languages[self._index]
+
+    @property
+    def price(self):
+        return Money.from_cents(self._table.prices[self._index])
+
+    @price.setter
+    def price(self, price):
+        # Price updates are written straight back to the price column
+        self._table.prices[self._index] = to_cents(price)
+        Item._price_epoch += 1  # Same bookkeeping as Item.price so cart totals re-price
+
+    @property
+    def price_cents(self):
+        return self._table.prices[self._index]
+
+    def get_isbn(self):
+        # Accessor for the row's ISBN, matching Ebook.get_isbn()
+        return self._table.isbns[self._index]
+
+    def set_isbn(self, isbn):
+        # Mutator for the row's ISBN that keeps the table's ISBN index and the row's watchers in sync,
+        # rolling everything back like Ebook.set_isbn() if a watcher rejects the new ISBN
+        table = self._table
+        old_isbn = table.isbns[self._index]
+        if isbn != old_isbn and isbn in table._row_by_isbn:
+            raise ValueError(f"Duplicate ISBN in table: {isbn}")
+        table._rekey(self._index, old_isbn, isbn)
+        notified = []
+        try:
+            for watcher in table._watchers.get(self._index, ()):
+                watcher.isbn_changed(self, old_isbn)
+                notified.append(watcher)
+        except ValueError:
+            table._rekey(self._index, isbn, old_isbn)
+            for watcher in notified:
+                watcher.isbn_changed(self, isbn)
+            raise
+
+    def add_watcher(self, watcher):
+        # Same as Ebook.add_watcher(), so rows can be added to a Catalog or SearchIndex
+        watchers = self._table._watchers.get(self._index, ())
+        if watcher not in watchers:
+            self._table._watchers[self._index] = watchers + (watcher,)
+
+    def remove_watcher(self, watcher):
+        # Same as Ebook.remove_watcher() (no-op if it was never added)
+        watchers = tuple(w for w in self._table._watchers.get(self._index, ()) if w is not watcher)
+        if watchers:
+            self._table._watchers[self._index] = watchers
+        else:
+            self._table._watchers.pop(self._index, None)
+
+    # Same text as an Ebook with identical attributes
+    __str__ = Ebook.__str__
+
+    def __eq__(self, other):
+        # Two views are equal when they point at the same row, so they can share a cart line
+        if not isinstance(other, EbookRow):
+            return NotImplemented
+        return self._table is other._table and self._index == other._index
+
+    def __hash__(self):
+        return hash((id(self._table), self._index))
@@ -0,0 +1,151 @@
+import threading  # Stripe and registry locks
+
+from .core import Item, ShoppingCart, Order, NullEventSink  # Plain carts are the snapshots; orders price them
+
+
+# === Concurrent Shopping Cart ===
+class _Stripe:
+    """One lock together with the cart lines it guards and their running totals."""
+
+    __slots__ = ("lock", "items", "subtotal", "total_quantity", "price_epoch")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.items = {}  # ebook -> quantity for the ebooks hashed to this stripe
+        self.subtotal = 0  # Running sum of price * quantity over this stripe's lines, in integer cents
+        self.total_quantity = 0  # Running sum of this stripe's quantities
+        self.price_epoch = Item._price_epoch  # Item price epoch the running subtotal was computed against
+
+    def recalculate(self):
+        # Recomputes the running totals from scratch (used after price changes); caller holds the lock
+        self.subtotal = sum(ebook.price_cents * quantity for ebook, quantity in self.items.items())
+        self.total_quantity = sum(self.items.values())
+        self.price_epoch = Item._price_epoch
+
+
+class ConcurrentShoppingCart(ShoppingCart):
+    """Shopping cart that many threads can update at once; each ebook's line is guarded by one of several locks."""
+
+    __slots__ = ("_stripes",)
+
+    def __init__(self, event_sink=None, stripes=16):
+        # Lines are spread over `stripes` locks by ebook, so updates to different ebooks rarely wait on each other,
+        # while every read-modify-write of one line (and of its stripe's running totals) happens under its lock
+        self.event_sink = event_sink if event_sink is not None else ShoppingCart.default_event_sink
+        self._stripes = [_Stripe() for _ in range(stripes)]
+
+    def _stripe(self, ebook):
+        # The stripe guarding `ebook`'s line
+        return self._stripes[hash(ebook) % len(self._stripes)]
+
+    def add_item(self, ebook, quantity=1):
+        # Adds an ebook to the cart, or increases quantity if already in cart, atomically
+        stripe = self._stripe(ebook)
+        with stripe.lock:
+            items = stripe.items
+            items[ebook] = items.get(ebook, 0) + quantity
+            stripe.subtotal += ebook.price_cents * quantity
+            stripe.total_quantity += quantity
+        self.event_sink.emit("added", ebook, quantity)  # Confirmation event, sent outside the lock
+
+    def remove_item(self, ebook, quantity=1):
+        # Removes a specified quantity of an ebook from the cart, atomically
+        stripe = self._stripe(ebook)
+        with stripe.lock:
+            items = stripe.items
+            current = items.get(ebook)
+            if current is not None:
+                if current - quantity <= 0:
+                    # If quantity reaches zero or below, remove item completely
+                    del items[ebook]
+                    removed = current
+                else:
+                    items[ebook] = current - quantity
+                    removed = quantity
+                stripe.total_quantity -= removed
+                stripe.subtotal -= ebook.price_cents * removed
+        self.event_sink.emit("removed" if current is not None else "not_in_cart", ebook, quantity)
+
+    def snapshot(self):
+        # A plain ShoppingCart holding the contents at one instant: every stripe is locked (always in the same
+        # order, so concurrent snapshots cannot deadlock) while the lines and totals are copied
+        snapshot = ShoppingCart(NullEventSink())
+        stripes = self._stripes
+        for stripe in stripes:
+            stripe.lock.acquire()
+        try:
+            for stripe in stripes:
+                if stripe.price_epoch != Item._price_epoch:
+                    stripe.recalculate()
+                snapshot.items.update(stripe.items)
+                snapshot._subtotal += stripe.subtotal
+                snapshot._total_quantity += stripe.total_quantity
+        finally:
+            for stripe in stripes:
+                stripe.lock.release()
+        snapshot._price_epoch = Item._price_epoch
+        return snapshot
+
+    @property
+    def items(self):
+        # Copy of the cart's {ebook: quantity} lines at one instant; change the cart through add_item/remove_item
+        return self.snapshot().items
+
+    @property
+    def subtotal_cents(self):
+        # The subtotal as integer cents, consistent with the lines at one instant
+        return self.snapshot()._subtotal
+
+    @property
+    def total_quantity(self):
+        # Total number of copies across all lines
+        return self.snapshot()._total_quantity
+
+    def recalculate(self):
+        # Recomputes every stripe's running totals from scratch
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.recalculate()
+
+
+# === Cart Registry ===
+class CartRegistry:
+    """Thread-safe map from customer (by email) to their shared ConcurrentShoppingCart."""
+
+    def __init__(self, stripes=16, event_sink=None):
+        # Carts are created on first use with `stripes` locks each, reporting to `event_sink`
+        self.stripes = stripes
+        self.event_sink = event_sink
+        self._carts = {}  # customer email -> ConcurrentShoppingCart
+        self._lock = threading.Lock()  # Only taken to create or remove a cart
+
+    def __len__(self):
+        # Number of customers with an open cart
+        return len(self._carts)
+
+    def __contains__(self, customer):
+        return customer.get_email() in self._carts
+
+    def cart_for(self, customer):
+        # The customer's cart, created if they have none; every thread asking for the same customer gets the same cart
+        key = customer.get_email()
+        cart = self._carts.get(key)  # Lock-free for carts that already exist
+        if cart is None:
+            with self._lock:
+                cart = self._carts.get(key)
+                if cart is None:
+                    cart = self._carts[key] = ConcurrentShoppingCart(self.event_sink, self.stripes)
+        return cart
+
+    def discard(self, customer):
+        # Drops the customer's cart (if any) and returns it
+        with self._lock:
+            return self._carts.pop(customer.get_email(), None)
+
+    def checkout(self, customer, discount=None):
+        # Closes the customer's cart and returns an Order for a snapshot of it, or None if they have no cart;
+        # updates still in flight on other threads land in the discarded cart, never in the order
+        cart = self.discard(customer)
+        if cart is None:
+            return None
+        return Order(customer, cart.snapshot(), discount)
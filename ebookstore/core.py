@@ -0,0 +1,572 @@
+import time  # Timestamp structured cart events
+from datetime import datetime  # Import datetime to record order dates and times
+from decimal import ROUND_HALF_UP  # Default rounding mode for discounts and VAT
+
+from .money import Money, to_cents, rate_units, reduce_units, divide  # Exact integer-cents money arithmetic
+
+
+# === Ebook Management ===
+class Item:
+    """Base class for any store item, representing common attributes like title and price."""
+
+    # Fixed attribute layout instead of a per-instance __dict__ (much smaller when loading millions of records)
+    __slots__ = ("title", "_price_cents")
+
+    # Bumped whenever any item's price changes, so running cart totals know to re-price
+    _price_epoch = 0
+
+    def __init__(self, title, price):
+        # Initialize the item with a title and price
+        self.title = title  # Title of the item (e.g., ebook title)
+        # Price of the item, kept as integer cents; accepts Money, float, str or Decimal
+        self._price_cents = to_cents(price)
+
+    @property
+    def price(self):
+        # Accessor for the item's price as Money
+        return Money.from_cents(self._price_cents)
+
+    @price.setter
+    def price(self, price):
+        # Mutator for the price; records the change so carts holding this item recompute their subtotal
+        self._price_cents = to_cents(price)
+        Item._price_epoch += 1
+
+    @property
+    def price_cents(self):
+        # The price as integer cents, for hot paths that should not build Money objects
+        return self._price_cents
+
+    def __str__(self):
+        # Returns a string representation of the item
+        # Useful for displaying item details in a readable format
+        return f"Title: '{self.title}', Price: ${self.price:.2f}"
+
+
+class Ebook(Item):
+    """Represents an Ebook, inheriting properties from Item and adding specific attributes."""
+
+    __slots__ = ("author", "publication_date", "genre", "_isbn", "publisher", "language", "_watchers")
+
+    def __init__(self, title, author, publication_date, genre, price, isbn, publisher, language):
+        # Call the parent class (Item) initializer to set title and price
+        super().__init__(title, price)
+        # Initialize additional attributes unique to an Ebook
+        self.author = author  # Author of the ebook
+        self.publication_date = publication_date  # Publication date as a string
+        self.genre = genre  # Genre or category of the ebook
+        self._isbn = isbn  # ISBN (protected), a unique identifier for the book
+        self.publisher = publisher  # Publisher of the ebook
+        self.language = language  # Language of the ebook content
+        self._watchers = ()  # Catalogs/indexes to notify when the ISBN changes (protected)
+
+    def __str__(self):
+        # Returns a comprehensive string representation of the Ebook,
+        # including author, publisher, language, and price
+        return f"Title: '{self.title}', Author: {self.author}, Publisher: {self.publisher}, Language: {self.language}, Price: ${self.price:.2f}"
+
+    def get_isbn(self):
+        # Accessor (getter) for the protected ISBN attribute
+        # Allows other parts of the program to read the ISBN value safely
+        return self._isbn
+
+    def set_isbn(self, isbn):
+        # Mutator (setter) for the protected ISBN attribute
+        # Allows controlled modification of the ISBN value if needed
+        old_isbn = self._isbn
+        self._isbn = isbn
+        notified = []
+        try:
+            # Let every catalog or index holding this ebook re-key it under the new ISBN
+            for watcher in self._watchers:
+                watcher.isbn_changed(self, old_isbn)
+                notified.append(watcher)
+        except ValueError:
+            # A watcher rejected the new ISBN (e.g. duplicate key), so restore the old one everywhere
+            self._isbn = old_isbn
+            for watcher in notified:
+                watcher.isbn_changed(self, isbn)
+            raise
+
+    def add_watcher(self, watcher):
+        # Registers an object with an isbn_changed(ebook, old_isbn) method to be told about ISBN changes
+        if watcher not in self._watchers:
+            self._watchers = self._watchers + (watcher,)
+
+    def remove_watcher(self, watcher):
+        # Unregisters a previously added watcher (no-op if it was never added)
+        self._watchers = tuple(w for w in self._watchers if w is not watcher)
+
+
+# === Customer Management ===
+class Customer:
+    """Represents a customer with personal details and loyalty status."""
+
+    __slots__ = ("name", "_email", "_contact_number", "address", "payment_method", "loyalty_member")
+
+    def __init__(self, name, email, contact_number, address, payment_method, loyalty_member=False):
+        # Initialize customer details with essential information
+        self.name = name  # Customer's full name
+        self._email = email  # Email (protected for restricted access)
+        self._contact_number = contact_number  # Contact number (protected)
+        self.address = address  # Customer's physical address
+        self.payment_method = payment_method  # Payment method chosen by the customer
+        self.loyalty_member = loyalty_member  # Boolean indicating if the customer is a loyalty program member
+
+    def __str__(self):
+        # Returns a formatted string containing customer details
+        # Displays loyalty status as "Yes" or "No" based on loyalty_member attribute
+        return (f"Customer Name: {self.name}, Contact: {self._email}, Address: {self.address}, "
+                f"Payment Method: {self.payment_method}, Loyalty Member: {'Yes' if self.loyalty_member else 'No'}")
+
+    def get_email(self):
+        # Accessor for the protected email attribute
+        return self._email
+
+    def set_email(self, email):
+        # Mutator to update the protected email attribute
+        self._email = email
+
+    def get_contact_number(self):
+        # Accessor for the protected contact number attribute
+        return self._contact_number
+
+    def set_contact_number(self, contact_number):
+        # Mutator to update the protected contact number attribute
+        self._contact_number = contact_number
+
+
+# === Cart Event Sinks ===
+class NullEventSink:
+    """Discards cart events; the default for library use so mutations do no I/O."""
+
+    def emit(self, event, ebook, quantity):
+        # Called by ShoppingCart with event "added", "removed" or "not_in_cart"
+        pass
+
+
+class PrintEventSink:
+    """Prints a confirmation message for every cart event (the original console behaviour)."""
+
+    def emit(self, event, ebook, quantity):
+        # Prints the same messages ShoppingCart has always shown
+        if event == "added":
+            print(f"Added {ebook.title} - Quantity: {quantity}")
+        elif event == "removed":
+            print(f"Removed {quantity} of {ebook.title}")
+        else:
+            print(f"{ebook.title} not in cart.")
+
+
+class BufferedLogSink:
+    """Collects cart events in memory and writes them to a file as JSON lines in batches."""
+
+    def __init__(self, path, batch_size=1000):
+        # Open the log file for appending; events are written every `batch_size` events
+        import json  # Only structured logging needs JSON (and the regex engine behind it), so load it here
+        self._encode = json.JSONEncoder().encode  # Encodes one value (e.g. a title) as a JSON literal
+        self._file = open(path, "a", encoding="utf-8")
+        self.batch_size = batch_size
+        self._pending = []  # Buffered (timestamp, event, isbn, title, quantity) tuples
+
+    def emit(self, event, ebook, quantity):
+        # Buffers one event; only tuples are built here, serialization happens in flush()
+        self._pending.append((time.time(), event, ebook.get_isbn(), ebook.title, quantity))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        # Writes every buffered event as one JSON object per line
+        if self._pending:
+            # Only the free-text fields need JSON escaping; building the rest by hand is several times faster
+            encode = self._encode
+            self._file.write("".join(
+                f'{{"ts":{ts!r},"event":"{event}","isbn":{encode(isbn)},"title":{encode(title)},"quantity":{quantity}}}\n'
+                for ts, event, isbn, title, quantity in self._pending))
+            self._pending.clear()
+        self._file.flush()
+
+    def close(self):
+        # Flushes remaining events and closes the log file
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# === Shopping Cart Management ===
+class ShoppingCart:
+    """Manages the eBooks added to the cart and their quantities."""
+
+    # Sink used by carts created without one; set to PrintEventSink() for console confirmations
+    default_event_sink = NullEventSink()
+
+    # Fixed attribute layout, like Item and Customer: carts are created per order and their totals read on every price
+    __slots__ = ("event_sink", "items", "_subtotal", "_total_quantity", "_price_epoch")
+
+    def __init__(self, event_sink=None):
+        # Where add/remove events are reported (see the Cart Event Sinks section)
+        self.event_sink = event_sink if event_sink is not None else ShoppingCart.default_event_sink
+        # Initialize an empty dictionary to store cart items and quantities
+        # Always change it through add_item/remove_item so the running totals below stay correct
+        self.items = {}  # Dictionary where key=ebook instance, value=quantity
+        self._subtotal = 0  # Running sum of price * quantity over all lines, in integer cents
+        self._total_quantity = 0  # Running sum of all quantities
+        self._price_epoch = Item._price_epoch  # Item price epoch the running subtotal was computed against
+
+    def add_item(self, ebook, quantity=1):
+        # Adds an ebook to the cart, or increases quantity if already in cart
+        if ebook in self.items:
+            # If ebook is already in the cart, increase its quantity
+            self.items[ebook] += quantity
+        else:
+            # If ebook is not in the cart, add it with specified quantity
+            self.items[ebook] = quantity
+        # Keep the running totals up to date in O(1)
+        self._subtotal += ebook.price_cents * quantity
+        self._total_quantity += quantity
+        self.event_sink.emit("added", ebook, quantity)  # Confirmation event
+
+    def remove_item(self, ebook, quantity=1):
+        # Removes a specified quantity of an ebook from the cart
+        if ebook in self.items:
+            # If ebook is found in the cart, decrease its quantity
+            current = self.items[ebook]
+            if current - quantity <= 0:
+                # If quantity reaches zero or below, remove item completely
+                del self.items[ebook]
+                removed = current
+            else:
+                self.items[ebook] = current - quantity
+                removed = quantity
+            # Take the removed copies off the running totals
+            self._total_quantity -= removed
+            self._subtotal -= ebook.price_cents * removed
+            self.event_sink.emit("removed", ebook, quantity)  # Confirmation event
+        else:
+            # If ebook is not in the cart, report it
+            self.event_sink.emit("not_in_cart", ebook, quantity)
+
+    @property
+    def subtotal(self):
+        # Sum of price * quantity over the cart as Money, in O(1) unless a price changed since the last call
+        return Money.from_cents(self.subtotal_cents)
+
+    @property
+    def subtotal_cents(self):
+        # The subtotal as integer cents
+        if self._price_epoch != Item._price_epoch:
+            self.recalculate()
+        return self._subtotal
+
+    @property
+    def line_count(self):
+        # Number of distinct ebooks in the cart
+        return len(self.items)
+
+    @property
+    def total_quantity(self):
+        # Total number of copies across all lines
+        return self._total_quantity
+
+    def recalculate(self):
+        # Recomputes the running totals from scratch (used after price changes)
+        self._subtotal = sum(ebook.price_cents * quantity for ebook, quantity in self.items.items())
+        self._total_quantity = sum(self.items.values())
+        self._price_epoch = Item._price_epoch
+
+    def snapshot(self):
+        # The contents an Order prices and invoices, with its running totals brought up to date; a plain cart is
+        # used from one thread at a time, so it is its own snapshot (concurrent_cart.ConcurrentShoppingCart returns
+        # a frozen copy instead)
+        if self._price_epoch != Item._price_epoch:
+            self.recalculate()
+        return self
+
+    def copy(self):
+        # An independent plain cart holding this cart's current lines and totals; its events go nowhere
+        source = self.snapshot()
+        copy = ShoppingCart(NullEventSink())
+        copy.items.update(source.items)
+        copy._subtotal = source._subtotal
+        copy._total_quantity = source._total_quantity
+        copy._price_epoch = source._price_epoch
+        return copy
+
+    def __str__(self):
+        # Returns a formatted string listing all ebooks and their quantities in the cart
+        # Each line displays the ebook title and quantity in the cart
+        return "\n".join(f"{ebook.title} - Quantity: {quantity}" for ebook, quantity in self.items.items())
+
+
+# === Discount Management ===
+def _rounding_fraction(units):
+    # A rate (units over RATE_SCALE) as (2n, d, 2d) for its reduced fraction n/d: amount * 2n / 2d is the exact
+    # product, and (amount * 2n + d) // 2d rounds it half up with one multiply, one add and one floor division
+    numerator, denominator = reduce_units(units)
+    return 2 * numerator, denominator, 2 * denominator
+
+
+def _discount_fractions(loyalty_units, bulk_units):
+    # Combined discount rate as a rounding fraction for: no discount, loyalty only, bulk only, both
+    return tuple(_rounding_fraction(units) for units in (0, loyalty_units, bulk_units, loyalty_units + bulk_units))
+
+
+class Discount:
+    """Handles application of discounts based on loyalty status or bulk purchases."""
+
+    # Default settings, shared by every instance until loyalty_discount, bulk_discount, bulk_threshold or rounding
+    # is set on it. The rates are kept alongside their exact fractions, so building a Discount per order costs nothing
+    # extra.
+    _loyalty_discount = 0.1  # Loyalty member discount (10%)
+    _bulk_discount = 0.2     # Bulk purchase discount (20% if 5 or more items)
+    _bulk_threshold = 5      # Minimum bulk quantity that earns the bulk discount
+    _rounding = ROUND_HALF_UP  # How the discount is rounded to whole cents (any decimal.ROUND_* mode)
+    _loyalty_units = rate_units(_loyalty_discount)
+    _bulk_units = rate_units(_bulk_discount)
+    _fractions = _discount_fractions(_loyalty_units, _bulk_units)
+    # Everything apply_discount_cents() reads besides its arguments, replaced by every setter, so Order can tell
+    # whether the settings changed with one comparison
+    _settings = (_fractions, _bulk_threshold, _rounding)
+    # Whether apply_discount_cents() reads each line's genre and publisher, not just the cart's subtotal and quantity;
+    # cached prices (see pricing_cache) must then be keyed on those line details too
+    reads_line_details = False
+
+    # True while apply_discount_cents() is this class's own, which reads nothing but the cart's subtotal and quantity,
+    # the loyalty flag and the rate attributes; Order.calculate_total() only reuses earlier results for such discounts
+    _prices_from_totals = True
+
+    def __init_subclass__(cls, **kwargs):
+        # Worked out per subclass, so one that overrides apply_discount_cents() is never served a stale price
+        super().__init_subclass__(**kwargs)
+        cls._prices_from_totals = cls.apply_discount_cents is Discount.apply_discount_cents
+
+    @property
+    def loyalty_discount(self):
+        # Accessor for the loyalty discount rate
+        return self._loyalty_discount
+
+    @loyalty_discount.setter
+    def loyalty_discount(self, rate):
+        # Mutator for the loyalty rate; converts it to an exact fraction once instead of on every order
+        self._loyalty_units = rate_units(rate)
+        self._loyalty_discount = rate
+        self._update_settings()
+
+    @property
+    def bulk_discount(self):
+        # Accessor for the bulk discount rate
+        return self._bulk_discount
+
+    @bulk_discount.setter
+    def bulk_discount(self, rate):
+        # Mutator for the bulk rate; converts it to an exact fraction once instead of on every order
+        self._bulk_units = rate_units(rate)
+        self._bulk_discount = rate
+        self._update_settings()
+
+    @property
+    def bulk_threshold(self):
+        # Accessor for the minimum bulk quantity
+        return self._bulk_threshold
+
+    @bulk_threshold.setter
+    def bulk_threshold(self, quantity):
+        # Mutator for the minimum bulk quantity
+        self._bulk_threshold = quantity
+        self._update_settings()
+
+    @property
+    def rounding(self):
+        # Accessor for the discount rounding mode
+        return self._rounding
+
+    @rounding.setter
+    def rounding(self, mode):
+        # Mutator for the discount rounding mode
+        self._rounding = mode
+        self._update_settings()
+
+    def _update_settings(self):
+        # Recomputes the combined rate fractions and the settings tuple after any setting changes
+        self._fractions = _discount_fractions(self._loyalty_units, self._bulk_units)
+        self._settings = (self._fractions, self._bulk_threshold, self._rounding)
+
+    def apply_discount(self, subtotal, is_loyalty_member, bulk_quantity, shopping_cart=None, when=None):
+        # Calculate total discount as Money; subtotal may be Money, a Decimal, a string or a float
+        return Money.from_cents(self.apply_discount_cents(to_cents(subtotal), is_loyalty_member, bulk_quantity,
+                                                          shopping_cart, when))
+
+    def apply_discount_cents(self, subtotal_cents, is_loyalty_member, bulk_quantity, shopping_cart=None, when=None):
+        # Integer-cents version of apply_discount(), used by Order.calculate_total(); subclasses override this one
+        # shopping_cart and when (the order date) are unused here; rule-based subclasses price individual lines
+        combination = 0  # Index into _fractions
+        if is_loyalty_member:
+            # Apply loyalty discount if customer is a member
+            combination = 1
+        if bulk_quantity >= self._bulk_threshold:
+            # Apply bulk discount if cart has 5 or more items
+            combination += 2
+        elif not combination:
+            return 0  # Neither discount applies (the most common order)
+        numerator, half, denominator = self._fractions[combination]
+        if not numerator:
+            return 0
+        # The combined rate is applied once, so the discount is rounded to cents exactly once
+        scaled = subtotal_cents * numerator
+        if scaled >= 0 and self._rounding == ROUND_HALF_UP:
+            return (scaled + half) // denominator  # Default mode, inlined for speed
+        return divide(scaled, denominator, self._rounding)
+
+    def cache_key(self, when=None):
+        # Everything apply_discount() depends on besides the cart, so cached prices can be keyed by it;
+        # reconfiguring any rate or the rounding mode gives a new key
+        return self.loyalty_discount, self.bulk_discount, self.bulk_threshold, self.rounding
+
+
+# === Order Processing ===
+class Order:
+    """Processes an order with customer details, applies discounts, calculates taxes, and generates an invoice."""
+
+    # Default VAT rate with its exact fraction and invoice label, and the VAT rounding mode, shared by every order
+    # until vat_rate or vat_rounding is set on it
+    _vat_rate = 0.08
+    _vat_label = f"VAT ({_vat_rate * 100}%)"
+    # (rounding fraction of the rate, rounding mode): everything VAT depends on, replaced by both setters
+    _vat_settings = (_rounding_fraction(rate_units(_vat_rate)), ROUND_HALF_UP)
+    # (pricing inputs, Money totals) of the last calculate_total() call; the totals are kept once priced twice
+    _cached_total = None
+
+    def __init__(self, customer, shopping_cart, discount=None):
+        # Initialize the order with customer and shopping cart instances
+        self.customer = customer  # Customer who placed the order
+        self.shopping_cart = shopping_cart  # ShoppingCart instance containing the ordered items
+        self.order_date = datetime.now()  # Record the date and time of order creation
+        # Discount instance to manage discount calculations (e.g. a promotions.RuleBasedDiscount)
+        self.discount = discount if discount is not None else Discount()
+        # vat_rate (8%, applied on the discounted subtotal) and vat_rounding (how VAT is rounded to whole cents, any
+        # decimal.ROUND_* mode; ROUND_HALF_UP by default) start at the class defaults above
+
+    @property
+    def vat_rate(self):
+        # Accessor for the VAT rate
+        return self._vat_rate
+
+    @vat_rate.setter
+    def vat_rate(self, rate):
+        # Mutator for the VAT rate; converts it to an exact fraction once instead of on every calculation
+        self._vat_settings = (_rounding_fraction(rate_units(rate)), self._vat_settings[1])
+        self._vat_rate = rate
+        self._vat_label = f"VAT ({rate * 100}%)"  # Invoice label, built once per rate instead of per invoice
+
+    @property
+    def vat_rounding(self):
+        # Accessor for the VAT rounding mode
+        return self._vat_settings[1]
+
+    @vat_rounding.setter
+    def vat_rounding(self, mode):
+        # Mutator for the VAT rounding mode
+        self._vat_settings = (self._vat_settings[0], mode)
+
+    def calculate_total(self):
+        # Calculate subtotal, discount, VAT, and final total for the order, all as exact Money amounts
+        # Building four Money objects costs more than the pricing itself, so an order priced again with unchanged
+        # inputs (checkout, invoice, ledger) keeps its Money totals and returns them from then on. Hot loops over
+        # fresh orders should call calculate_total_cents() instead
+        shopping_cart = self.shopping_cart.snapshot()
+        discount = self.discount
+        if not discount._prices_from_totals:
+            # Promotional and custom discounts may read the cart lines or the date, so they are priced every time
+            return self._to_money(self.calculate_total_cents(shopping_cart))
+        inputs = (shopping_cart._subtotal, shopping_cart._total_quantity, self.customer.loyalty_member,
+                  discount._settings, self._vat_settings)
+        cached = self._cached_total
+        if cached is None or cached[0] != inputs:
+            # First price for these inputs: only the inputs are kept. A tuple of plain values is soon dropped from the
+            # garbage collector's tracking, so an order that is priced once pays little for the cache
+            self._cached_total = (inputs, None)
+            return self._to_money(self.calculate_total_cents(shopping_cart))
+        totals = cached[1]
+        if totals is None:
+            # Priced again with nothing changed: keep the Money totals for every later call
+            totals = self._to_money(self.calculate_total_cents(shopping_cart))
+            self._cached_total = (inputs, totals)  # One attribute, so the inputs and totals are replaced together
+        return totals
+
+    @staticmethod
+    def _to_money(totals):
+        # (subtotal, discount, vat, total) in cents as Money amounts
+        subtotal, discount, vat, total = totals
+        from_cents = Money.from_cents
+        return from_cents(subtotal), from_cents(discount), from_cents(vat), from_cents(total)
+
+    def calculate_total_cents(self, shopping_cart=None):
+        # Integer-cents version of calculate_total(): the public fast path for bulk pricing and invoicing
+        # Prices a consistent snapshot of the cart unless one is given (iter_invoice passes the one it lists)
+        if shopping_cart is None:
+            shopping_cart = self.shopping_cart.snapshot()
+        # Subtotal is the sum of all items' (price * quantity) in the cart, kept up to date by the cart
+        # (a snapshot's running totals are current, so they are read directly)
+        subtotal = shopping_cart._subtotal
+        # Calculate applicable discount based on customer's loyalty status and total number of copies
+        discount = self.discount.apply_discount_cents(subtotal, self.customer.loyalty_member,
+                                                      shopping_cart._total_quantity, shopping_cart, self.order_date)
+        # Calculate VAT based on the subtotal after discount, rounded to cents with vat_rounding
+        discounted = subtotal - discount
+        (numerator, half, denominator), vat_rounding = self._vat_settings
+        scaled = discounted * numerator
+        if scaled >= 0 and vat_rounding == ROUND_HALF_UP:
+            vat = (scaled + half) // denominator  # Default mode, inlined for speed
+        else:
+            vat = divide(scaled, denominator, vat_rounding)
+        # Final total is subtotal after discounts plus VAT
+        return subtotal, discount, vat, discounted + vat
+
+    def _invoice_sections(self):
+        # The invoice as (header, item lines, totals), all priced from one snapshot of the cart; the item lines are
+        # produced lazily, so large carts never build one giant string
+        # Amounts are formatted from integer cents: cents / 100 is the float nearest the exact amount, so ".2f"
+        # prints the exact cents (for anything below $90 trillion) at C speed
+        shopping_cart = self.shopping_cart.snapshot()  # The lines listed are exactly the lines priced
+        subtotal, discount, vat, total = self.calculate_total_cents(shopping_cart)
+        # Start the invoice with customer name and itemized list
+        header = f"=== Invoice ===\nCustomer Name: {self.customer.name}\n"
+        # List each ebook in the cart with quantity and cost
+        lines = (f" - {ebook.title} (x{quantity}): ${ebook.price_cents * quantity / 100:.2f}\n"
+                 for ebook, quantity in shopping_cart.items.items())
+        # Append the subtotal, discount, VAT, and final total to the invoice
+        totals = (f"Subtotal after discounts: ${(subtotal - discount) / 100:.2f}\n"
+                  f"{self._vat_label}: ${vat / 100:.2f}\n"
+                  f"Total with VAT: ${total / 100:.2f}\n")
+        return header, lines, totals
+
+    def iter_invoice(self):
+        # Yields the invoice text piece by piece (header, each item line, totals) for streaming into a file
+        header, lines, totals = self._invoice_sections()
+        yield header
+        yield from lines
+        yield totals
+
+    def write_invoice(self, fp):
+        # Streams the invoice straight into a text file-like object (file, socket makefile, StringIO ...)
+        fp.writelines(self.iter_invoice())
+
+    def generate_invoice(self):
+        # Generates a formatted invoice including customer details, itemized purchases, and cost breakdown
+        # Joined directly rather than through iter_invoice(), which saves a generator step per section
+        header, lines, totals = self._invoice_sections()
+        return header + "".join(lines) + totals  # Return the completed invoice text
+
+
+def write_invoices(orders, fp, separator="\n"):
+    # Bulk mode: streams the invoices of many orders into one file, separated by `separator`
+    # Only one order's lines are in flight at a time, so memory stays flat however many orders there are
+    for index, order in enumerate(orders):
+        if index and separator:
+            fp.write(separator)
+        order.write_invoice(fp)
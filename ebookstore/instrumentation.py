@@ -0,0 +1,222 @@
+import cProfile  # Whole-block profiles
+import functools  # Keep names and docstrings on the timing wrappers
+import json  # JSON snapshots
+import pstats  # Printed profile summaries
+import time  # Nanosecond call timing
+from bisect import bisect_left  # Histogram bucket lookup
+from contextlib import contextmanager  # Scoped instrumentation and profiling
+
+from .core import ShoppingCart, Discount, Order  # The classes whose hot paths are instrumented
+
+# Methods timed by enable(), per base class; subclasses that override one (e.g. RuleBasedDiscount) are timed too.
+# Timings are inclusive, so Order.calculate_total contains Order.calculate_total_cents, which contains the
+# discount's apply_discount_cents; the VAT step is calculate_total_cents minus apply_discount_cents, and invoice
+# rendering is generate_invoice minus calculate_total_cents.
+TARGETS = [
+    (ShoppingCart, ("add_item", "remove_item")),
+    (Discount, ("apply_discount", "apply_discount_cents")),
+    (Order, ("calculate_total", "calculate_total_cents", "generate_invoice")),
+]
+
+# Histogram bucket upper bounds in nanoseconds: 1-2.5-5 steps from 100ns to 10s
+BUCKET_BOUNDS = [int(step * 10 ** exponent) for exponent in range(2, 10) for step in (1, 2.5, 5)] + [10 ** 10]
+
+
+# === Metrics ===
+class Histogram:
+    """Call counter and latency histogram for one instrumented method."""
+
+    __slots__ = ("errors", "total_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.errors = 0  # Calls that raised
+        self.total_ns = 0  # Sum of all call durations
+        self.max_ns = 0  # Slowest call
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)  # Calls per bucket (not cumulative); the last one is overflow
+
+    @property
+    def count(self):
+        # Calls recorded
+        return sum(self.buckets)
+
+    def record(self, ns):
+        # Adds one call that took `ns` nanoseconds (the timing wrappers inline this)
+        self.buckets[bisect_left(BUCKET_BOUNDS, ns)] += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def percentile(self, fraction):
+        # Upper bound of the bucket holding the given fraction of calls (e.g. 0.99), capped at the slowest call
+        count = self.count
+        if not count:
+            return None
+        rank = fraction * count
+        seen = 0
+        for bound, calls in zip(BUCKET_BOUNDS, self.buckets):
+            seen += calls
+            if seen >= rank:
+                return min(bound, self.max_ns)
+        return self.max_ns
+
+    def snapshot(self):
+        # Plain-dict view of the histogram, for JSON export
+        count = self.count
+        return {
+            "count": count,
+            "errors": self.errors,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns / count if count else None,
+            "max_ns": self.max_ns,
+            "p50_ns": self.percentile(0.5),
+            "p90_ns": self.percentile(0.9),
+            "p99_ns": self.percentile(0.99),
+            "buckets": {str(bound): calls for bound, calls in zip(BUCKET_BOUNDS + ["+Inf"], self.buckets) if calls},
+        }
+
+
+class Metrics:
+    """Histograms for every instrumented method, keyed by "Class.method"."""
+
+    def __init__(self):
+        self.histograms = {}
+
+    def histogram(self, name):
+        # The histogram for `name`, created on first use
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        return histogram
+
+    def reset(self):
+        # Zeroes every histogram in place, so active wrappers keep recording into them
+        for histogram in self.histograms.values():
+            histogram.errors = histogram.total_ns = histogram.max_ns = 0
+            histogram.buckets[:] = [0] * len(histogram.buckets)
+
+    def snapshot(self):
+        # {name: histogram snapshot} for every method called at least once
+        return {name: histogram.snapshot() for name, histogram in sorted(self.histograms.items()) if histogram.count}
+
+    def to_json(self, indent=2):
+        # Snapshot as JSON text
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix="ebook_store"):
+        # Snapshot in the Prometheus text exposition format: one histogram and one error counter per method
+        name = f"{prefix}_call_duration_seconds"
+        lines = [f"# HELP {name} Time spent in instrumented Order/ShoppingCart/Discount methods.",
+                 f"# TYPE {name} histogram"]
+        errors = [f"# HELP {prefix}_call_errors_total Instrumented calls that raised an exception.",
+                  f"# TYPE {prefix}_call_errors_total counter"]
+        for method, histogram in sorted(self.histograms.items()):
+            if not histogram.count:
+                continue
+            label = f'method="{method}"'
+            cumulative = 0
+            for bound, calls in zip(BUCKET_BOUNDS, histogram.buckets):
+                cumulative += calls
+                lines.append(f'{name}_bucket{{{label},le="{bound / 1e9:g}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{label},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{label}}} {histogram.total_ns / 1e9:.9f}")
+            lines.append(f"{name}_count{{{label}}} {histogram.count}")
+            errors.append(f"{prefix}_call_errors_total{{{label}}} {histogram.errors}")
+        return "\n".join(lines + errors) + "\n"
+
+    def export(self, path, format="json"):
+        # Writes a snapshot to `path` as "json" or "prometheus" text
+        if format not in ("json", "prometheus"):
+            raise ValueError(f"Unknown export format: {format!r}")
+        with open(path, "w") as export_file:
+            export_file.write(self.to_json() if format == "json" else self.to_prometheus())
+
+
+# === Instrumentation Switch ===
+# While disabled the original methods are in place, so there is no cost at all on the hot paths
+_originals = {}  # (class, method name) -> original function, for every method currently wrapped
+metrics = Metrics()  # Where the wrappers record by default
+
+
+def _timed(function, histogram):
+    # Wraps `function` so each call is counted and timed into `histogram`
+    # Histogram.record() is inlined and everything it needs is bound to locals: the wrapper itself is the overhead
+    perf_counter_ns = time.perf_counter_ns
+    buckets = histogram.buckets
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        except BaseException:
+            histogram.errors += 1
+            raise
+        finally:
+            ns = perf_counter_ns() - start
+            buckets[bisect_left(BUCKET_BOUNDS, ns)] += 1
+            histogram.total_ns += ns
+            if ns > histogram.max_ns:
+                histogram.max_ns = ns
+    return wrapper
+
+
+def _classes(base):
+    # `base` and every subclass currently defined
+    classes = [base]
+    for cls in classes:
+        classes.extend(subclass for subclass in cls.__subclasses__() if subclass not in classes)
+    return classes
+
+
+def enable(registry=None):
+    # Starts timing every TARGETS method (and overrides in subclasses defined so far) into `registry`
+    # (the module-level `metrics` by default) and returns the registry; calling it again re-targets the wrappers
+    registry = registry if registry is not None else metrics
+    disable()
+    for base, names in TARGETS:
+        for cls in _classes(base):
+            for name in names:
+                function = cls.__dict__.get(name)
+                if function is None:
+                    continue  # Inherited; the defining class's wrapper covers it
+                _originals[cls, name] = function
+                setattr(cls, name, _timed(function, registry.histogram(f"{cls.__name__}.{name}")))
+    return registry
+
+
+def disable():
+    # Puts the original methods back; recorded metrics are kept
+    while _originals:
+        (cls, name), function = _originals.popitem()
+        setattr(cls, name, function)
+
+
+def is_enabled():
+    # True while the hot paths are being timed
+    return bool(_originals)
+
+
+@contextmanager
+def instrumented(registry=None):
+    # Times the hot paths for the duration of a with-block and yields the registry being recorded into
+    registry = enable(registry)
+    try:
+        yield registry
+    finally:
+        disable()
+
+
+# === Profiling ===
+@contextmanager
+def profiled(path, sort="cumulative", top=0, stream=None):
+    # Runs a with-block under cProfile and writes the profile to `path` (open it with pstats, snakeviz ...);
+    # with top > 0 the `top` most expensive functions, ordered by `sort`, are also printed to `stream`
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        if top:
+            pstats.Stats(profiler, stream=stream).sort_stats(sort).print_stats(top)
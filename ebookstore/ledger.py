@@ -0,0 +1,312 @@
+import json  # Journal lines and snapshots are JSON
+import os  # Atomic snapshot replacement, fsync and journal recovery
+from bisect import bisect_left, insort  # The bestseller list is kept sorted
+from collections import namedtuple  # Lightweight entry records
+from datetime import date, datetime  # Order timestamps and day keys
+from heapq import nlargest, nsmallest  # Top-n queries that are not maintained incrementally
+
+# One completed order as recorded in the ledger; amounts are integer cents, as in Order.calculate_total_cents()
+LedgerEntry = namedtuple("LedgerEntry", ["sequence", "order_date", "customer", "lines", "subtotal", "discount",
+                                         "vat", "total"])
+# One cart line of a LedgerEntry; the ebook's attributes are copied at sale time, so history never depends on
+# the current catalog. `amount` is price * quantity in integer cents.
+LedgerLine = namedtuple("LedgerLine", ["isbn", "title", "author", "genre", "publisher", "quantity", "amount"])
+
+SNAPSHOT_VERSION = 1
+DIMENSIONS = ("genre", "publisher", "author")  # Line attributes with a gross sales rollup
+_DAY_FIELDS = ("orders", "copies", "subtotal", "discount", "vat", "total")
+
+
+# === Sales Rollups ===
+class _DayTree:
+    """Fenwick tree of per-day totals, so the totals of any date range are summed in O(log days)."""
+
+    def __init__(self, days=None):
+        # Covers every day in `days` ({ISO day: totals}) with room to grow into later days
+        ordinals = {date.fromisoformat(day).toordinal(): values for day, values in (days or {}).items()}
+        self.base = min(ordinals, default=date.today().toordinal())  # Ordinal of the day at index 0
+        span = max(ordinals, default=self.base) - self.base + 1
+        self.capacity = 1 << max(6, (2 * span).bit_length())
+        self.nodes = [[0] * len(_DAY_FIELDS) for _ in range(self.capacity + 1)]  # 1-based
+        for ordinal, values in ordinals.items():
+            self.add(ordinal, values)
+
+    def add(self, ordinal, values):
+        # Adds `values` to one day; returns False (changing nothing) if the day is outside the tree
+        index = ordinal - self.base + 1
+        if not 0 < index <= self.capacity:
+            return False
+        nodes, capacity = self.nodes, self.capacity
+        while index <= capacity:
+            node = nodes[index]
+            for field, value in enumerate(values):
+                node[field] += value
+            index += index & -index
+        return True
+
+    def prefix(self, ordinal):
+        # Totals of every day up to and including `ordinal`
+        totals = [0] * len(_DAY_FIELDS)
+        index = min(ordinal - self.base + 1, self.capacity)
+        nodes = self.nodes
+        while index > 0:
+            for field, value in enumerate(nodes[index]):
+                totals[field] += value
+            index -= index & -index
+        return totals
+
+
+class SalesRollups:
+    """Running sales aggregates, updated per order so dashboard queries never scan the order history."""
+
+    def __init__(self, top_size=100):
+        # Bestseller queries up to `top_size` titles are answered from a list kept sorted as orders arrive
+        self.top_size = top_size
+        self.orders = 0
+        self.days = {}  # ISO day -> [orders, copies, subtotal, discount, vat, total]
+        self._day_tree = _DayTree()  # The same per-day totals, indexed for date range queries
+        self.dimensions = {dimension: {} for dimension in DIMENSIONS}  # dimension -> value -> [copies, gross]
+        self.titles = {}  # ISBN -> [copies, gross, title]
+        self._top = []  # (-copies, isbn) of the best-selling titles, best first, at most top_size long
+
+    def add(self, entry):
+        # Folds one LedgerEntry into every aggregate
+        self.orders += 1
+        copies = 0
+        genres, publishers, authors = (self.dimensions[dimension] for dimension in DIMENSIONS)
+        titles = self.titles
+        for isbn, title, author, genre, publisher, quantity, amount in entry.lines:
+            copies += quantity
+            _accumulate(genres, genre, quantity, amount)
+            _accumulate(publishers, publisher, quantity, amount)
+            _accumulate(authors, author, quantity, amount)
+            totals = titles.get(isbn)
+            if totals is None:
+                totals = titles[isbn] = [0, 0, title]
+            previous = totals[0]
+            totals[0] += quantity
+            totals[1] += amount
+            self._promote(isbn, previous, totals[0])
+        values = (1, copies, entry.subtotal, entry.discount, entry.vat, entry.total)
+        order_day = entry.order_date.date()
+        day_key = order_day.isoformat()
+        day = self.days.get(day_key)
+        if day is None:
+            day = self.days[day_key] = [0] * len(_DAY_FIELDS)
+        for field, value in enumerate(values):
+            day[field] += value
+        if not self._day_tree.add(order_day.toordinal(), values):
+            self._day_tree = _DayTree(self.days)  # A day outside the tree; rebuild it around every day so far
+
+    def _promote(self, isbn, previous, copies):
+        # Keeps _top equal to the first top_size titles by (-copies, isbn). Sales only ever grow a title's
+        # count, so only the title just sold can move, and only towards the front: O(top_size) at worst.
+        top = self._top
+        key = (-copies, isbn)
+        if len(top) >= self.top_size and key >= top[-1]:
+            return  # Still outside the list
+        if previous:
+            old = (-previous, isbn)
+            index = bisect_left(top, old)
+            if index < len(top) and top[index] == old:
+                del top[index]
+        insort(top, key)
+        if len(top) > self.top_size:
+            top.pop()
+
+    # --- Queries ---
+    def day(self, day):
+        # Totals for one day (a date or ISO string) as a dict; O(1)
+        values = self.days.get(day.isoformat() if isinstance(day, date) else day)
+        return dict(zip(_DAY_FIELDS, values or [0] * len(_DAY_FIELDS)))
+
+    def between(self, start, end):
+        # Totals summed over the days from `start` to `end` (dates or ISO strings), inclusive; O(log d)
+        start, end = (value if isinstance(value, date) else date.fromisoformat(value) for value in (start, end))
+        if end < start:
+            return dict(zip(_DAY_FIELDS, [0] * len(_DAY_FIELDS)))
+        tree = self._day_tree
+        upper, lower = tree.prefix(end.toordinal()), tree.prefix(start.toordinal() - 1)
+        return dict(zip(_DAY_FIELDS, (total - before for total, before in zip(upper, lower))))
+
+    def sales(self, dimension, value):
+        # (copies, gross cents) sold for one genre, publisher or author; O(1)
+        return tuple(self.dimensions[dimension].get(value, (0, 0)))
+
+    def revenue_by(self, dimension, n=None):
+        # {value: gross cents} for every genre, publisher or author (or only the top `n`), highest first
+        revenue = ((key, value[1]) for key, value in self.dimensions[dimension].items())
+        if n is not None:
+            return dict(nlargest(n, revenue, key=lambda item: item[1]))
+        return dict(sorted(revenue, key=lambda item: -item[1]))
+
+    def bestsellers(self, n=10):
+        # [(isbn, title, copies)] for the `n` best-selling titles; O(n) up to top_size, a full scan beyond it
+        if n <= self.top_size:
+            keys = self._top[:n]
+        else:
+            keys = nsmallest(n, ((-copies, isbn) for isbn, (copies, _, _) in self.titles.items()))
+        return [(isbn, self.titles[isbn][2], -negative_copies) for negative_copies, isbn in keys]
+
+    # --- Snapshots ---
+    def to_dict(self):
+        # JSON-ready state (the bestseller list is rebuilt on load)
+        return {"orders": self.orders, "days": self.days, "dimensions": self.dimensions, "titles": self.titles}
+
+    @classmethod
+    def from_dict(cls, state, top_size=100):
+        # Rebuilds rollups saved by to_dict()
+        rollups = cls(top_size)
+        rollups.orders = state["orders"]
+        rollups.days = state["days"]
+        rollups._day_tree = _DayTree(rollups.days)
+        rollups.dimensions = {dimension: state["dimensions"].get(dimension, {}) for dimension in DIMENSIONS}
+        rollups.titles = state["titles"]
+        rollups._top = nsmallest(top_size, ((-copies, isbn) for isbn, (copies, _, _) in rollups.titles.items()))
+        return rollups
+
+
+# === Order Ledger ===
+class OrderLedger:
+    """Append-only history of completed orders with incrementally maintained sales rollups."""
+
+    # The directory holds the journal, one JSON line per order that is never rewritten, and a compacted snapshot
+    # of the rollups as of some journal offset; opening the ledger loads the snapshot and replays only the
+    # journal after it. Only one process may write to a ledger directory at a time.
+    JOURNAL = "orders.jsonl"
+    SNAPSHOT = "snapshot.json"
+
+    def __init__(self, directory, snapshot_every=10_000, flush_every=1, fsync=False, top_size=100):
+        # snapshot_every - orders between compacted snapshots (0 = only on close)
+        # flush_every    - orders buffered before the journal is flushed to the OS (1 = every order)
+        # fsync          - also fsync the journal on every flush, for durability across power loss
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.snapshot_every = snapshot_every
+        self.flush_every = flush_every
+        self.fsync = fsync
+        self._journal_path = os.path.join(directory, self.JOURNAL)
+        self._snapshot_path = os.path.join(directory, self.SNAPSHOT)
+        self._pending = []  # Encoded journal lines not yet written
+        self.rollups, self.sequence, self._offset = self._load(top_size)
+        self._snapshot_sequence = self.sequence
+        self._file = open(self._journal_path, "ab")
+
+    def __len__(self):
+        # Number of orders recorded, across every session
+        return self.sequence
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def record(self, order):
+        # Appends a completed Order and updates the rollups; returns its LedgerEntry
+        # Prices a snapshot of the cart, so the lines recorded are exactly the lines priced
+        shopping_cart = order.shopping_cart.snapshot()
+        subtotal, discount, vat, total = order.calculate_total_cents(shopping_cart)
+        lines = tuple(LedgerLine(str(ebook.get_isbn()), ebook.title, ebook.author, ebook.genre, ebook.publisher,
+                                 quantity, ebook.price_cents * quantity)
+                      for ebook, quantity in shopping_cart.items.items())
+        self.sequence += 1
+        entry = LedgerEntry(self.sequence, order.order_date, order.customer.get_email(), lines, subtotal, discount,
+                            vat, total)
+        self._pending.append(_encode(entry))
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+        self.rollups.add(entry)
+        if self.snapshot_every and self.sequence - self._snapshot_sequence >= self.snapshot_every:
+            self.snapshot()
+        return entry
+
+    def flush(self):
+        # Writes buffered orders to the journal
+        if self._pending:
+            data = b"".join(self._pending)
+            self._file.write(data)
+            self._offset += len(data)
+            self._pending.clear()
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def snapshot(self):
+        # Writes the rollups and the journal offset they cover; replaces the previous snapshot atomically
+        self.flush()
+        state = {"version": SNAPSHOT_VERSION, "sequence": self.sequence, "offset": self._offset,
+                 "rollups": self.rollups.to_dict()}
+        temporary_path = f"{self._snapshot_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as snapshot_file:
+            json.dump(state, snapshot_file, separators=(",", ":"))
+            if self.fsync:
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+        os.replace(temporary_path, self._snapshot_path)  # Readers never see a half-written snapshot
+        self._snapshot_sequence = self.sequence
+
+    def close(self):
+        # Flushes the journal, writes a final snapshot and closes the file
+        if self.sequence != self._snapshot_sequence:
+            self.snapshot()
+        self.flush()
+        self._file.close()
+
+    def entries(self, start=1):
+        # Iterates over every recorded LedgerEntry from sequence number `start`, reading the journal from disk
+        self.flush()
+        with open(self._journal_path, "rb") as journal:
+            for line in journal:
+                entry = _decode(line)
+                if entry.sequence >= start:
+                    yield entry
+
+    def _load(self, top_size):
+        # Rollups, sequence and journal offset from the snapshot (if any) plus a replay of the journal after it
+        rollups, sequence, offset = SalesRollups(top_size), 0, 0
+        if os.path.exists(self._snapshot_path):
+            with open(self._snapshot_path, encoding="utf-8") as snapshot_file:
+                state = json.load(snapshot_file)
+            if state.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"{self._snapshot_path} is not a version {SNAPSHOT_VERSION} ledger snapshot")
+            rollups = SalesRollups.from_dict(state["rollups"], top_size)
+            sequence, offset = state["sequence"], state["offset"]
+        if not os.path.exists(self._journal_path):
+            return rollups, sequence, offset
+        with open(self._journal_path, "r+b") as journal:
+            journal.seek(offset)
+            for line in journal:
+                if not line.endswith(b"\n"):
+                    # A torn write from a crash: drop the partial order, it was never acknowledged
+                    journal.truncate(offset)
+                    break
+                entry = _decode(line)
+                rollups.add(entry)
+                sequence = entry.sequence
+                offset += len(line)
+        return rollups, sequence, offset
+
+
+def _accumulate(totals, key, quantity, amount):
+    # Adds one line's copies and gross cents to the [copies, gross] running total for `key`
+    value = totals.get(key)
+    if value is None:
+        totals[key] = [quantity, amount]
+    else:
+        value[0] += quantity
+        value[1] += amount
+
+
+def _encode(entry):
+    # One journal line for a LedgerEntry
+    return (json.dumps([entry.sequence, entry.order_date.isoformat(), entry.customer, entry.lines, entry.subtotal,
+                        entry.discount, entry.vat, entry.total], ensure_ascii=False, separators=(",", ":"))
+            + "\n").encode("utf-8")
+
+
+def _decode(line):
+    # The LedgerEntry stored in one journal line
+    sequence, order_date, customer, lines, subtotal, discount, vat, total = json.loads(line)
+    return LedgerEntry(sequence, datetime.fromisoformat(order_date), customer,
+                       tuple(LedgerLine(*values) for values in lines), subtotal, discount, vat, total)
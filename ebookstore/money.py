@@ -0,0 +1,233 @@
+from decimal import (Decimal, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN, ROUND_HALF_EVEN,
+                     ROUND_HALF_UP, ROUND_UP)  # Decimal interop and the rounding mode names used throughout
+from math import gcd  # Reducing rate fractions keeps the hot-path integers small
+
+# Rates (discounts, VAT) are applied as exact integers over this scale, so 0.08 becomes 80_000_000_000 / 10**12.
+# Twelve decimal places is far more precision than any tax or promotion rate needs.
+RATE_SCALE = 10 ** 12
+_CENT = Decimal("0.01")
+_FLOAT_EXACT = 2 ** 53  # Below this many cents, cents / 100 formats to exactly two correct decimals
+_rate_units_cache = {}  # rate -> integer numerator over RATE_SCALE
+
+
+def to_cents(amount):
+    # Converts an amount (Money, int units, float, str or Decimal) to integer cents, rounding half to even
+    if isinstance(amount, Money):
+        return amount.cents
+    if isinstance(amount, int):
+        return amount * 100
+    if isinstance(amount, float):
+        # Fast path: prices with at most two decimals land within float noise of a whole number of cents
+        cents = round(amount * 100)
+        if abs(amount * 100 - cents) < 1e-6:
+            return cents
+        amount = repr(amount)
+    return int(Decimal(amount).quantize(_CENT, rounding=ROUND_HALF_EVEN).scaleb(2))
+
+
+def rate_units(rate):
+    # Exact numerator of a rate over RATE_SCALE; floats are read by their shortest repr, so 0.1 means 1/10
+    units = _rate_units_cache.get(rate)
+    if units is None:
+        scaled = Decimal(repr(rate) if isinstance(rate, float) else rate) * RATE_SCALE
+        if scaled != scaled.to_integral_value():
+            raise ValueError(f"Rate {rate!r} has more than 12 decimal places")
+        units = _rate_units_cache[rate] = int(scaled)
+    return units
+
+
+def reduce_units(units):
+    # A rate in units over RATE_SCALE as the smallest equal (numerator, denominator) pair, e.g. 0.08 -> (2, 25)
+    common = gcd(units, RATE_SCALE)
+    return units // common, RATE_SCALE // common
+
+
+def divide(numerator, denominator, rounding):
+    # Integer division of numerator by a positive denominator, rounded with a decimal rounding mode
+    if rounding == ROUND_HALF_UP and numerator >= 0:
+        # Fast path for the default mode (every discount and VAT amount is non-negative)
+        return (2 * numerator + denominator) // (2 * denominator)
+    quotient, remainder = divmod(numerator, denominator)  # Floor division; remainder is never negative
+    if not remainder:
+        return quotient
+    if rounding == ROUND_HALF_UP or rounding == ROUND_HALF_EVEN or rounding == ROUND_HALF_DOWN:
+        twice = 2 * remainder
+        if twice > denominator:
+            return quotient + 1
+        if twice < denominator:
+            return quotient
+        # Exactly half way between quotient and quotient + 1
+        if rounding == ROUND_HALF_UP:
+            return quotient + 1 if numerator > 0 else quotient
+        if rounding == ROUND_HALF_DOWN:
+            return quotient if numerator > 0 else quotient + 1
+        return quotient + (quotient & 1)
+    if rounding == ROUND_FLOOR:
+        return quotient
+    if rounding == ROUND_CEILING:
+        return quotient + 1
+    if rounding == ROUND_DOWN:
+        return quotient if numerator > 0 else quotient + 1
+    if rounding == ROUND_UP:
+        return quotient + 1 if numerator > 0 else quotient
+    raise ValueError(f"Unsupported rounding mode: {rounding!r}")
+
+
+# === Money ===
+class Money:
+    """An exact amount of money stored as integer cents, with Decimal at the edges."""
+
+    __slots__ = ("cents",)
+
+    def __init__(self, amount=0):
+        # Accepts Money, whole units as int, float, str or Decimal (e.g. Money("29.99"), Money(Decimal("5")))
+        self.cents = to_cents(amount)
+
+    @classmethod
+    def from_cents(cls, cents):
+        # Builds Money straight from integer cents without any conversion
+        money = object.__new__(cls)
+        money.cents = cents
+        return money
+
+    def to_decimal(self):
+        # The amount as a Decimal with two places, e.g. Decimal('29.99')
+        return Decimal(self.cents).scaleb(-2)
+
+    def apply_rate(self, rate, rounding=ROUND_HALF_UP):
+        # self * rate (e.g. a discount or VAT rate), rounded to whole cents with the given mode
+        numerator, denominator = reduce_units(rate_units(rate))
+        return Money.from_cents(divide(self.cents * numerator, denominator, rounding))
+
+    def _other_cents(self, other):
+        # Cents of a Money or whole-unit int operand, or None for anything else (Decimals go through to_decimal())
+        if isinstance(other, Money):
+            return other.cents
+        if isinstance(other, int):
+            return other * 100
+        return None
+
+    def __add__(self, other):
+        # Money + Money or whole units (int) stays exact Money; Money + Decimal gives the exact Decimal sum
+        cents = self._other_cents(other)
+        if cents is not None:
+            return Money.from_cents(self.cents + cents)
+        if isinstance(other, Decimal):
+            return self.to_decimal() + other
+        return NotImplemented
+
+    __radd__ = __add__  # Also lets sum() start from the integer 0
+
+    def __sub__(self, other):
+        cents = self._other_cents(other)
+        if cents is not None:
+            return Money.from_cents(self.cents - cents)
+        if isinstance(other, Decimal):
+            return self.to_decimal() - other
+        return NotImplemented
+
+    def __rsub__(self, other):
+        cents = self._other_cents(other)
+        if cents is not None:
+            return Money.from_cents(cents - self.cents)
+        if isinstance(other, Decimal):
+            return other - self.to_decimal()
+        return NotImplemented
+
+    def __mul__(self, other):
+        # Whole quantities multiply exactly into Money; a Decimal factor gives the exact Decimal product
+        # (use apply_rate() to get a rate applied and rounded back to cents)
+        if isinstance(other, int):
+            return Money.from_cents(self.cents * other)
+        if isinstance(other, Decimal):
+            return self.to_decimal() * other
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        # Division leaves whole cents, so it gives a Decimal, as Decimal division would
+        if isinstance(other, (int, Decimal)):
+            return self.to_decimal() / other
+        return NotImplemented
+
+    def __neg__(self):
+        return Money.from_cents(-self.cents)
+
+    def __abs__(self):
+        return Money.from_cents(abs(self.cents))
+
+    def __round__(self, ndigits=None):
+        # Like round() on a Decimal: half to even, an int without ndigits, otherwise Money rounded to 10**-ndigits
+        if ndigits is None:
+            return divide(self.cents, 100, ROUND_HALF_EVEN)
+        if ndigits >= 2:
+            return self
+        step = 10 ** (2 - ndigits)
+        return Money.from_cents(divide(self.cents, step, ROUND_HALF_EVEN) * step)
+
+    def __bool__(self):
+        return self.cents != 0
+
+    def __eq__(self, other):
+        # Equal to any Money, int or Decimal of the same value, e.g. Money("10.00") == Decimal("10") == 10
+        cents = self._other_cents(other)
+        if cents is not None:
+            return self.cents == cents
+        if isinstance(other, Decimal):
+            return self.to_decimal() == other
+        return NotImplemented
+
+    def __hash__(self):
+        # Equal values hash alike across Money, int and Decimal
+        if self.cents % 100:
+            return hash(self.to_decimal())
+        return hash(self.cents // 100)
+
+    def __lt__(self, other):
+        cents = self._other_cents(other)
+        if cents is not None:
+            return self.cents < cents
+        if isinstance(other, Decimal):
+            return self.to_decimal() < other
+        return NotImplemented
+
+    def __le__(self, other):
+        cents = self._other_cents(other)
+        if cents is not None:
+            return self.cents <= cents
+        if isinstance(other, Decimal):
+            return self.to_decimal() <= other
+        return NotImplemented
+
+    def __gt__(self, other):
+        cents = self._other_cents(other)
+        if cents is not None:
+            return self.cents > cents
+        if isinstance(other, Decimal):
+            return self.to_decimal() > other
+        return NotImplemented
+
+    def __ge__(self, other):
+        cents = self._other_cents(other)
+        if cents is not None:
+            return self.cents >= cents
+        if isinstance(other, Decimal):
+            return self.to_decimal() >= other
+        return NotImplemented
+
+    def __float__(self):
+        return self.cents / 100
+
+    def __format__(self, spec):
+        # ".2f" is formatted from cents / 100, the float nearest the exact amount, which prints exactly below
+        # $90 trillion; other specs (and larger amounts) go through Decimal
+        if spec == ".2f" and -_FLOAT_EXACT < self.cents < _FLOAT_EXACT:
+            return format(self.cents / 100, spec)
+        return format(self.to_decimal(), spec)
+
+    def __str__(self):
+        return format(self, ".2f")
+
+    def __repr__(self):
+        return f"Money('{self}')"
@@ -0,0 +1,147 @@
+import asyncio  # Queues and tasks for the pipeline stages
+
+from .core import Order, Discount  # Orders are built, priced and invoiced inside the pipeline
+from .bulk_orders import OrderResult  # Same result record as bulk processing
+
+
+# === Persistence Sinks ===
+class MemorySink:
+    """Local fake sink that keeps persisted results in a list, optionally simulating write latency."""
+
+    def __init__(self, delay=0.0):
+        # `delay` seconds are awaited on every write, standing in for a database round trip
+        self.delay = delay
+        self.records = []  # Persisted OrderResult records, in completion order
+
+    async def write(self, result):
+        # Sink interface: persist one OrderResult
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.records.append(result)
+
+
+# === Async Order Pipeline ===
+class _Job:
+    """One submitted order travelling through the pipeline."""
+
+    __slots__ = ("customer", "shopping_cart", "order", "totals", "invoice", "future")
+
+    def __init__(self, customer, shopping_cart, future):
+        self.customer = customer
+        self.shopping_cart = shopping_cart  # Replaced by a frozen copy in the validation stage
+        self.order = None  # Built by the pricing stage
+        self.totals = None  # (subtotal, discount, vat, total) from Order.calculate_total()
+        self.invoice = None  # Invoice text from Order.generate_invoice()
+        self.future = future  # Resolved with the OrderResult once persisted (or with the stage's error)
+
+
+class OrderPipeline:
+    """Validates, prices, invoices and persists orders through bounded queues with per-stage concurrency."""
+
+    def __init__(self, sink, queue_size=100, validate_workers=1, price_workers=1, render_workers=1,
+                 persist_workers=4, discount=None, vat_rate=0.08, executor=None):
+        # Each stage reads from a queue of at most `queue_size` jobs, so a slow stage (usually the sink)
+        # makes submit() wait instead of letting work pile up in memory
+        self.sink = sink  # Any object with an async write(result) method
+        self.queue_size = queue_size
+        self.discount = discount if discount is not None else Discount()
+        self.vat_rate = vat_rate
+        # concurrent.futures executor that runs the CPU-bound pricing and rendering, so they never block the event
+        # loop and up to price_workers/render_workers of them run at once (None: the loop's default thread pool;
+        # a ProcessPoolExecutor gives them more than one core)
+        self.executor = executor
+        self._stages = [(self._validate, validate_workers), (self._price, price_workers),
+                        (self._render, render_workers), (self._persist, persist_workers)]
+        self._queues = None
+        self._runner = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.drain()
+
+    async def start(self):
+        # Creates the stage queues and worker tasks
+        if self._runner is not None:
+            raise RuntimeError("OrderPipeline already started")
+        self._queues = [asyncio.Queue(self.queue_size) for _ in self._stages]
+        self._runner = asyncio.gather(*(
+            self._run_stage(handler, workers, self._queues[index],
+                            self._queues[index + 1] if index + 1 < len(self._queues) else None,
+                            self._stages[index + 1][1] if index + 1 < len(self._stages) else 0)
+            for index, (handler, workers) in enumerate(self._stages)))
+
+    async def submit(self, customer, shopping_cart):
+        # Queues an order and returns a future for its OrderResult; waits while the first queue is full
+        if self._runner is None:
+            raise RuntimeError("OrderPipeline is not running")
+        job = _Job(customer, shopping_cart, asyncio.get_running_loop().create_future())
+        await self._queues[0].put(job)
+        return job.future
+
+    async def drain(self):
+        # Graceful shutdown: stop accepting work, let every queued order finish, then stop the workers
+        if self._runner is None:
+            return
+        for _ in range(self._stages[0][1]):
+            await self._queues[0].put(None)
+        await self._runner
+        self._runner = None
+
+    async def _run_stage(self, handler, workers, inbox, outbox, next_workers):
+        # Runs `workers` copies of a stage; once all of them have stopped, tells the next stage to stop
+        async def worker():
+            while True:
+                job = await inbox.get()
+                if job is None:
+                    return
+                try:
+                    await handler(job)
+                except Exception as error:
+                    # A failed order is reported through its future and leaves the pipeline
+                    if not job.future.done():
+                        job.future.set_exception(error)
+                    continue
+                if outbox is not None:
+                    await outbox.put(job)
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        if outbox is not None:
+            for _ in range(next_workers):
+                await outbox.put(None)
+
+    async def _validate(self, job):
+        # Stage 1: freeze the cart, then reject carts that cannot be priced
+        # The later stages all work on this one copy, so the totals always match the invoice even if the caller
+        # keeps changing the cart while the order is in flight
+        job.shopping_cart = job.shopping_cart.copy()
+        items = job.shopping_cart.items
+        if not items:
+            raise ValueError(f"Empty cart for {job.customer.name}")
+        for ebook, quantity in items.items():
+            if quantity <= 0 or ebook.price_cents < 0:
+                raise ValueError(f"Invalid cart line for {job.customer.name}: {ebook.title} (x{quantity})")
+
+    async def _price(self, job):
+        # Stage 2: build the Order on the frozen cart and calculate its totals in the executor
+        job.order = Order(job.customer, job.shopping_cart, self.discount)
+        job.order.vat_rate = self.vat_rate
+        job.totals = await self._run_in_executor(job.order.calculate_total)
+
+    async def _render(self, job):
+        # Stage 3: render the invoice text in the executor
+        job.invoice = await self._run_in_executor(job.order.generate_invoice)
+
+    def _run_in_executor(self, function):
+        # Runs blocking stage work on self.executor; the stage worker awaits it while the loop serves everyone else
+        return asyncio.get_running_loop().run_in_executor(self.executor, function)
+
+    async def _persist(self, job):
+        # Stage 4: hand the result to the sink and resolve the caller's future
+        subtotal, discount, vat, total = job.totals
+        result = OrderResult(job.customer.name, subtotal, discount, vat, total, job.invoice)
+        await self.sink.write(result)
+        if not job.future.done():
+            job.future.set_result(result)
@@ -0,0 +1,77 @@
+from collections import OrderedDict  # LRU ordering of cached prices
+
+from .core import Item  # The item price epoch tells the cache when any price changed
+from .money import Money  # Cached totals are Money, like Order.calculate_total()
+
+
+def cart_fingerprint(shopping_cart, line_details=False):
+    # Canonical, hashable description of a cart's contents: sorted (ISBN, price in cents, quantity) lines, plus each
+    # line's genre and publisher when `line_details` is set (for discounts whose rules match on them).
+    # Prices are part of the key, so a different Ebook object under a known ISBN never gets another price's totals
+    items = shopping_cart.items
+    if line_details:
+        lines = [(ebook.get_isbn(), ebook.price_cents, quantity, ebook.genre, ebook.publisher)
+                 for ebook, quantity in items.items()]
+    elif len(items) == 1:
+        # Single-title carts are the common case and need no sorting
+        for ebook, quantity in items.items():
+            return ((ebook.get_isbn(), ebook.price_cents, quantity),)
+    else:
+        lines = [(ebook.get_isbn(), ebook.price_cents, quantity) for ebook, quantity in items.items()]
+    return tuple(sorted(lines))
+
+
+# === Pricing Cache ===
+class PricingCache:
+    """Bounded LRU cache of Order.calculate_total() results keyed by cart contents, loyalty flag, VAT and discount."""
+
+    def __init__(self, maxsize=100_000):
+        # Keep at most `maxsize` priced carts; the least recently used one is evicted first
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # key -> (subtotal, discount, vat, total)
+        self._price_epoch = Item._price_epoch  # Item price epoch the cached entries were computed against
+        self.hits = 0  # Lookups answered from the cache
+        self.misses = 0  # Lookups that had to be priced
+        self.evictions = 0  # Entries dropped because the cache was full
+        self.invalidations = 0  # Times the whole cache was dropped because a price changed
+
+    def __len__(self):
+        # Number of cached prices
+        return len(self._entries)
+
+    def price_order(self, order):
+        # Same result as order.calculate_total(), served from the cache when an identical cart was priced before
+        if self._price_epoch != Item._price_epoch:
+            # Some ebook's price changed; entries for the old price can never be hit again, so free them
+            self.clear()
+            self.invalidations += 1
+        discount = order.discount
+        # One snapshot is both fingerprinted and priced, so a cart changed in between (e.g. a ConcurrentShoppingCart)
+        # can never store the totals of other contents under its key
+        shopping_cart = order.shopping_cart.snapshot()
+        key = (cart_fingerprint(shopping_cart, discount.reads_line_details),
+               bool(order.customer.loyalty_member), order.vat_rate, order.vat_rounding,
+               discount.cache_key(order.order_date))
+        entries = self._entries
+        totals = entries.get(key)
+        if totals is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return totals
+        self.misses += 1
+        totals = entries[key] = tuple(map(Money.from_cents, order.calculate_total_cents(shopping_cart)))
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return totals
+
+    def clear(self):
+        # Drops every cached price (counters are kept)
+        self._entries.clear()
+        self._price_epoch = Item._price_epoch
+
+    def stats(self):
+        # Snapshot of the cache counters
+        lookups = self.hits + self.misses
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "invalidations": self.invalidations, "hit_rate": self.hits / lookups if lookups else 0.0}
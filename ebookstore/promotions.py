@@ -0,0 +1,180 @@
+from datetime import datetime  # Default evaluation time for date-windowed rules
+from decimal import ROUND_HALF_UP  # Default rounding mode for promotional discounts
+
+from .core import Discount  # Loyalty and bulk discounts still apply underneath the promotional rules
+from .money import Money, rate_units, divide, RATE_SCALE  # Promotions are summed exactly and rounded once
+
+
+# === Promotional Rules ===
+class PromotionRule:
+    """A declarative promotion: a percentage off the cart lines matching genre/publisher/ISBN filters."""
+
+    def __init__(self, name, rate=None, tiers=None, genre=None, publisher=None, isbn=None,
+                 starts=None, ends=None):
+        # Either a flat `rate` or quantity `tiers` [(min_quantity, rate), ...] must be given
+        if (rate is None) == (tiers is None):
+            raise ValueError(f"Rule {name!r} needs exactly one of rate or tiers")
+        self.name = name  # Label shown in reports
+        # Tiers sorted by minimum quantity; a flat rate is a single tier starting at one copy
+        self.tiers = sorted(tiers) if tiers is not None else [(1, rate)]
+        self.genre = genre  # Only lines in this genre match (None = any genre)
+        self.publisher = publisher  # Only lines from this publisher match (None = any publisher)
+        self.isbn = isbn  # Only this ISBN matches (None = any ISBN)
+        self.starts = starts  # First date (datetime.date) the rule is active, or None
+        self.ends = ends  # Last date (datetime.date) the rule is active, or None
+
+    def __str__(self):
+        # Returns a short description of the rule
+        return f"Rule '{self.name}' ({', '.join(f'{rate:.0%} from {qty}' for qty, rate in self.tiers)})"
+
+    def matches(self, ebook):
+        # True when the ebook passes every filter set on this rule
+        return ((self.isbn is None or ebook.get_isbn() == self.isbn)
+                and (self.genre is None or ebook.genre == self.genre)
+                and (self.publisher is None or ebook.publisher == self.publisher))
+
+    def is_active(self, day):
+        # True when `day` (a datetime.date) falls inside the rule's date window
+        return (self.starts is None or self.starts <= day) and (self.ends is None or day <= self.ends)
+
+    def rate_for(self, quantity):
+        # Highest tier rate whose minimum quantity is reached (0 if none is)
+        rate = 0.0
+        for min_quantity, tier_rate in self.tiers:
+            if quantity < min_quantity:
+                break
+            rate = tier_rate
+        return rate
+
+    def discount_for(self, matched_subtotal, matched_quantity, rounding=ROUND_HALF_UP):
+        # Discount earned by the matching lines of a cart (matched_subtotal is Money), rounded to cents
+        return matched_subtotal.apply_rate(self.rate_for(matched_quantity), rounding)
+
+    def units_for(self, quantity):
+        # rate_for() as exact units over RATE_SCALE, for summing several rules before rounding
+        return rate_units(self.rate_for(quantity))
+
+
+class RulePlan:
+    """Rules compiled into indexes keyed by ISBN, publisher/genre, publisher and genre for fast per-cart evaluation."""
+
+    def __init__(self, rules):
+        # The rule list is compiled lazily, once per calendar day, so date windows are resolved up front
+        self.rules = list(rules)
+        self._compiled = {}  # datetime.date -> compiled plan for that day
+
+    def _compile(self, day):
+        # Builds the evaluation plan for the rules active on `day`
+        # Rules are filed under their most selective key, so a cart only ever touches rules that can match it.
+        # Except for ISBN rules, a bucket is [sum of flat rate units, [tiered rules]]: flat-rate rules sharing a
+        # key collapse into one multiplication
+        by_isbn = {}  # ISBN -> [rules] (checked against the line's other filters)
+        by_publisher_genre = {}  # (publisher, genre) -> bucket
+        by_publisher = {}  # publisher -> bucket
+        by_genre = {}  # genre -> bucket
+        cart_wide = [0, []]  # Rules without filters apply to the whole cart
+        for rule in self.rules:
+            if not rule.is_active(day):
+                continue
+            if rule.isbn is not None:
+                by_isbn.setdefault(rule.isbn, []).append(rule)
+                continue
+            if rule.publisher is not None and rule.genre is not None:
+                bucket = by_publisher_genre.setdefault((rule.publisher, rule.genre), [0, []])
+            elif rule.publisher is not None:
+                bucket = by_publisher.setdefault(rule.publisher, [0, []])
+            elif rule.genre is not None:
+                bucket = by_genre.setdefault(rule.genre, [0, []])
+            else:
+                bucket = cart_wide
+            if len(rule.tiers) == 1 and rule.tiers[0][0] <= 1:
+                bucket[0] += rate_units(rule.tiers[0][1])
+            else:
+                bucket[1].append(rule)
+        if len(self._compiled) >= 32:
+            self._compiled.clear()  # Keep the per-day cache small for long-running processes
+        plan = self._compiled[day] = (by_isbn, by_publisher_genre, by_publisher, by_genre, cart_wide)
+        return plan
+
+    def evaluate(self, shopping_cart, when=None, rounding=ROUND_HALF_UP):
+        # Total promotional discount (Money) for a cart on the date of `when` (default: now)
+        # Every matching rule's share is summed exactly as cents * rate units, then rounded to cents once
+        day = (when or datetime.now()).date()
+        plan = self._compiled.get(day)
+        if plan is None:
+            plan = self._compile(day)
+        by_isbn, by_publisher_genre, by_publisher, by_genre, cart_wide = plan
+        scaled = 0  # Discount in cents * RATE_SCALE
+        # Matching lines are summed per key first, so each bucket is priced once per cart
+        publisher_genre_totals, publisher_totals, genre_totals = {}, {}, {}
+        for ebook, quantity in shopping_cart.items.items():
+            line_total = ebook.price_cents * quantity
+            isbn_rules = by_isbn.get(ebook.get_isbn()) if by_isbn else None
+            if isbn_rules:
+                for rule in isbn_rules:
+                    if rule.matches(ebook):
+                        scaled += line_total * rule.units_for(quantity)
+            if by_publisher_genre:
+                _accumulate(publisher_genre_totals, by_publisher_genre, (ebook.publisher, ebook.genre),
+                            line_total, quantity)
+            if by_publisher:
+                _accumulate(publisher_totals, by_publisher, ebook.publisher, line_total, quantity)
+            if by_genre:
+                _accumulate(genre_totals, by_genre, ebook.genre, line_total, quantity)
+        for index, totals in ((by_publisher_genre, publisher_genre_totals), (by_publisher, publisher_totals),
+                              (by_genre, genre_totals)):
+            for key, (subtotal, quantity) in totals.items():
+                scaled += _bucket_discount(index[key], subtotal, quantity)
+        if cart_wide[0] or cart_wide[1]:
+            scaled += _bucket_discount(cart_wide, shopping_cart.subtotal_cents, shopping_cart.total_quantity)
+        return Money.from_cents(divide(scaled, RATE_SCALE, rounding))
+
+
+def _accumulate(totals, index, key, line_total, quantity):
+    # Adds a line to the running [subtotal, quantity] for `key`, but only if some rule is filed under it
+    if key in index:
+        entry = totals.get(key)
+        if entry is None:
+            totals[key] = [line_total, quantity]
+        else:
+            entry[0] += line_total
+            entry[1] += quantity
+
+
+def _bucket_discount(bucket, subtotal, quantity):
+    # Unrounded discount (cents * RATE_SCALE) from one compiled bucket: the summed flat rates plus each tiered rule
+    flat_units, tiered_rules = bucket
+    for rule in tiered_rules:
+        flat_units += rule.units_for(quantity)
+    return subtotal * flat_units
+
+
+class RuleBasedDiscount(Discount):
+    """Discount that adds compiled promotional rules on top of the loyalty and bulk discounts."""
+
+    reads_line_details = True  # Rules match lines by genre and publisher
+
+    def __init__(self, rules=()):
+        # Initialize the base rates, then compile the rules into an evaluation plan
+        super().__init__()
+        self.set_rules(rules)
+
+    def set_rules(self, rules):
+        # Replaces the rule set; the plan is compiled once per day on first use, never per cart
+        self.plan = RulePlan(rules)
+
+    def rule_discount(self, shopping_cart, when=None):
+        # Promotional part of the discount for a cart, rounded with this discount's rounding mode
+        return self.plan.evaluate(shopping_cart, when, self.rounding)
+
+    def apply_discount_cents(self, subtotal_cents, is_loyalty_member, bulk_quantity, shopping_cart=None,
+                             when=None):
+        # Loyalty/bulk discount plus every matching promotion, never more than the subtotal itself
+        discount = super().apply_discount_cents(subtotal_cents, is_loyalty_member, bulk_quantity)
+        if shopping_cart is not None:
+            discount = min(discount + self.rule_discount(shopping_cart, when).cents, subtotal_cents)
+        return discount
+
+    def cache_key(self, when=None):
+        # Base rates plus the compiled plan (replaced by set_rules) and the day, which decides the active rules
+        return super().cache_key(when) + (self.plan, (when or datetime.now()).date())
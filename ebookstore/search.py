@@ -0,0 +1,181 @@
+import bisect  # Prefix ranges over the sorted vocabulary
+import heapq  # Top-k selection without sorting every match
+import math  # Inverse document frequency
+import re  # Tokenization
+
+_TOKEN = re.compile(r"\w+")
+_HYPHENATED_NUMBER = re.compile(r"\b\d[\dX]*(?:-[\dX]+)+\b", re.IGNORECASE)  # e.g. an ISBN: 978-0-7352-1129-2
+
+
+def tokenize(text):
+    # Splits text into lowercase word tokens ("The Silent Patient" -> ["the", "silent", "patient"])
+    return _TOKEN.findall(str(text).lower())
+
+
+# === Full-Text Search ===
+class SearchIndex:
+    """Inverted index over ebook titles, authors, publishers, genres and ISBNs with ranked top-k search."""
+
+    # How much a token counts towards the score depending on the field it came from
+    FIELD_WEIGHTS = {
+        "title": 3.0,
+        "author": 2.0,
+        "publisher": 1.0,
+        "genre": 1.0,
+    }
+    ISBN_WEIGHT = 5.0  # An ISBN typed into the search box is almost certainly the book wanted
+
+    def __init__(self, ebooks=()):
+        # token -> {ebook: weight}; ebook -> {token: weight} so an ebook can be removed or re-indexed
+        self._postings = {}
+        self._tokens_of = {}
+        self._vocabulary = []  # Sorted tokens for prefix queries, kept in order as tokens come and go
+        self.add_many(ebooks)
+
+    def __len__(self):
+        # Number of indexed ebooks
+        return len(self._tokens_of)
+
+    def __contains__(self, ebook):
+        # Allows `ebook in index` checks
+        return ebook in self._tokens_of
+
+    def add(self, ebook):
+        # Indexes an ebook and watches it so set_isbn() re-indexes its ISBN token
+        if ebook in self._tokens_of:
+            raise ValueError(f"Ebook already indexed: {ebook.get_isbn()}")
+        self._index(ebook)
+        ebook.add_watcher(self)
+
+    def add_many(self, ebooks):
+        # Indexes several ebooks; their new tokens are merged into the vocabulary with one sort, not one insert each
+        new_tokens = []
+        try:
+            for ebook in ebooks:
+                if ebook in self._tokens_of:
+                    raise ValueError(f"Ebook already indexed: {ebook.get_isbn()}")
+                self._index(ebook, new_tokens)
+                ebook.add_watcher(self)
+        finally:
+            # Also runs after a duplicate, so the ebooks indexed before it stay searchable by prefix
+            if new_tokens:
+                # Sorting the new tokens first leaves two sorted runs, which timsort merges in linear time
+                self._vocabulary = sorted(self._vocabulary + sorted(new_tokens))
+
+    def remove(self, ebook):
+        # Drops an ebook from the index (KeyError if it was never added)
+        self._unindex(ebook)
+        ebook.remove_watcher(self)
+
+    def update(self, ebook):
+        # Re-indexes an ebook whose title, author, publisher or genre changed
+        self._unindex(ebook)
+        self._index(ebook)
+
+    def isbn_changed(self, ebook, old_isbn):
+        # Called by Ebook.set_isbn(); the ISBN is a search token, so the ebook is re-indexed
+        self.update(ebook)
+
+    def search(self, query, k=10):
+        # Top-k ebooks containing every query term, best score first
+        terms = self._query_terms(query)
+        if not terms:
+            return []
+        return self._rank([self._postings.get(term, {}) for term in terms], k)
+
+    def search_prefix(self, query, k=10, max_expansions=50):
+        # Autocomplete search: like search(), but the last term may be an unfinished word
+        terms = self._query_terms(query, prefix=True)
+        if not terms:
+            return []
+        matches = [self._postings.get(term, {}) for term in terms[:-1]]
+        # Merge the postings of the completions of the last term, keeping each ebook's best weight
+        expanded = {}
+        for token in self.complete(terms[-1], max_expansions, ranked=False):
+            for ebook, weight in self._postings[token].items():
+                if weight > expanded.get(ebook, 0.0):
+                    expanded[ebook] = weight
+        matches.append(expanded)
+        return self._rank(matches, k)
+
+    def complete(self, prefix, limit=10, ranked=True):
+        # Vocabulary tokens starting with `prefix`; ranked=True orders them by how many ebooks use them
+        prefix = prefix.lower()
+        vocabulary = self._vocabulary
+        tokens = []
+        for position in range(bisect.bisect_left(vocabulary, prefix), len(vocabulary)):
+            token = vocabulary[position]
+            if not token.startswith(prefix):
+                break
+            tokens.append(token)
+            if not ranked and len(tokens) >= limit:
+                break
+        if ranked:
+            return heapq.nlargest(limit, tokens, key=lambda token: len(self._postings[token]))
+        return tokens
+
+    def _query_terms(self, query, prefix=False):
+        # Tokenizes a query the way ebooks were indexed: a hyphenated number is looked up as one token, since ISBNs
+        # are indexed without their hyphens, unless no indexed token is (or, for the last term of a prefix query,
+        # starts with) the joined number; then its pieces are searched separately (e.g. a title like "1984-2004")
+        query = str(query)
+        end = len(query.rstrip())
+
+        def join(match):
+            joined = match.group().replace("-", "").lower()
+            if joined in self._postings or (prefix and match.end() == end and self.complete(joined, 1, ranked=False)):
+                return joined
+            return match.group()
+
+        return tokenize(_HYPHENATED_NUMBER.sub(join, query))
+
+    def _rank(self, matches, k):
+        # Intersects the per-term {ebook: weight} maps and returns the k best ebooks
+        if not all(matches):
+            return []
+        total = len(self._tokens_of)
+        # Rarer terms count for more (idf); start from the smallest map so the intersection stays cheap
+        weighted = sorted(((postings, math.log(1 + total / len(postings))) for postings in matches),
+                          key=lambda entry: len(entry[0]))
+        (first, first_idf), rest = weighted[0], weighted[1:]
+        scores = {}
+        for ebook, weight in first.items():
+            score = weight * first_idf
+            for postings, idf in rest:
+                other = postings.get(ebook)
+                if other is None:
+                    break
+                score += other * idf
+            else:
+                scores[ebook] = score
+        return [ebook for ebook, _score in heapq.nlargest(k, scores.items(), key=lambda entry: entry[1])]
+
+    def _index(self, ebook, new_tokens=None):
+        # Adds an ebook's tokens to the postings; tokens not seen before are inserted into the sorted vocabulary, or
+        # collected in `new_tokens` when one is given, for the caller to merge
+        tokens = {}
+        for field, weight in self.FIELD_WEIGHTS.items():
+            for token in tokenize(getattr(ebook, field)):
+                tokens[token] = tokens.get(token, 0.0) + weight
+        isbn = "".join(tokenize(ebook.get_isbn()))  # One token even for hyphenated ISBNs
+        tokens[isbn] = tokens.get(isbn, 0.0) + self.ISBN_WEIGHT
+        for token, weight in tokens.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                if new_tokens is None:
+                    bisect.insort(self._vocabulary, token)
+                else:
+                    new_tokens.append(token)
+            postings[ebook] = weight
+        self._tokens_of[ebook] = tokens
+
+    def _unindex(self, ebook):
+        # Removes an ebook's tokens from the postings
+        for token in self._tokens_of.pop(ebook):
+            postings = self._postings[token]
+            del postings[ebook]
+            if not postings:
+                del self._postings[token]
+                vocabulary = self._vocabulary
+                del vocabulary[bisect.bisect_left(vocabulary, token)]
@@ -0,0 +1,172 @@
+import mmap  # Map the store file so records are read straight from the page cache
+import os  # Atomic replacement of the store file on export
+import struct  # Fixed-width binary record layout
+
+from .core import Ebook, Customer  # Classes rebuilt from the stored records
+from .money import Money  # Prices are stored as integer cents
+
+# File layout (all integers little-endian):
+#   header  - magic (4 bytes), format version, record count, byte offset of the string heap
+#   records - `count` fixed-width records; every text field is an (offset, length) pair into the heap
+#   heap    - UTF-8 text, each distinct string stored once
+# Records are sorted by their first text field (ISBN for ebooks, email for customers) so lookups by that
+# key are a binary search over the mapped file and nothing has to be indexed at startup.
+FORMAT_VERSION = 2  # Version 2 stores prices as integer cents instead of float64
+_HEADER = struct.Struct("<4sHQQ")
+_STRING_REF = struct.Struct("<QI")  # The leading key field of every record
+
+
+# === Export ===
+def export_ebooks(ebooks, path):
+    # Writes ebooks to a binary store file (ISBNs are stored as text)
+    rows = [((str(ebook.get_isbn()), ebook.title, ebook.author, ebook.publication_date, ebook.genre,
+              ebook.publisher, ebook.language), (ebook.price_cents,)) for ebook in ebooks]
+    _write(path, EbookStore.MAGIC, EbookStore.RECORD, rows)
+
+
+def export_customers(customers, path):
+    # Writes customers to a binary store file
+    rows = [((customer.get_email(), customer.name, customer.get_contact_number(), customer.address,
+              customer.payment_method), (customer.loyalty_member,)) for customer in customers]
+    _write(path, CustomerStore.MAGIC, CustomerStore.RECORD, rows)
+
+
+def _write(path, magic, record, rows):
+    # Serializes (text fields, other fields) rows sorted by their key into `path`
+    rows.sort(key=lambda row: row[0][0])
+    heap = bytearray()
+    offsets = {}  # Text -> (offset, length) in the heap, so repeated values are stored once
+    table = bytearray(record.size * len(rows))
+    for index, (texts, others) in enumerate(rows):
+        if index and texts[0] == rows[index - 1][0][0]:
+            raise ValueError(f"Duplicate key in store: {texts[0]}")
+        refs = []
+        for text in texts:
+            ref = offsets.get(text)
+            if ref is None:
+                encoded = str(text).encode("utf-8")
+                ref = offsets[text] = (len(heap), len(encoded))
+                heap += encoded
+            refs.extend(ref)
+        record.pack_into(table, index * record.size, *refs, *others)
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as store_file:
+        store_file.write(_HEADER.pack(magic, FORMAT_VERSION, len(rows), _HEADER.size + len(table)))
+        store_file.write(table)
+        store_file.write(heap)
+    os.replace(temporary_path, path)  # Readers never see a half-written store
+
+
+# === Memory-Mapped Stores ===
+class _MappedStore:
+    """Read-only view of a store file; records are decoded only when they are accessed."""
+
+    MAGIC = None  # Set by subclasses
+    RECORD = None  # struct.Struct describing one record
+
+    def __init__(self, path):
+        # Map the file and read the header; no record is decoded here
+        with open(path, "rb") as store_file:
+            self._map = mmap.mmap(store_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._count, self._heap_offset = _HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} {self.MAGIC.decode()} store")
+        self._cache = {}  # Record number -> object already built, so every access returns the same object
+
+    def __len__(self):
+        # Number of records in the store
+        return self._count
+
+    def __getitem__(self, index):
+        # Returns the object for record `index` (records are in key order)
+        if not 0 <= index < self._count:
+            raise IndexError("store index out of range")
+        item = self._cache.get(index)
+        if item is None:
+            item = self._cache[index] = self._build(index)
+        return item
+
+    def __iter__(self):
+        # Iterate over every record in key order
+        return (self[index] for index in range(self._count))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        # Unmaps the file; objects already built stay usable
+        self._map.close()
+
+    def find(self, key, default=None):
+        # Binary search on the key field, decoding only the keys it visits
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._key(low) == key:
+            return self[low]
+        return default
+
+    def _offset(self, index):
+        # Byte offset of record `index`
+        return _HEADER.size + index * self.RECORD.size
+
+    def _text(self, offset, length):
+        # Decodes one string from the heap
+        start = self._heap_offset + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def _key(self, index):
+        # Decodes just the key field of record `index`
+        return self._text(*_STRING_REF.unpack_from(self._map, self._offset(index)))
+
+    def _fields(self, index, text_fields):
+        # Decodes record `index` into its text fields followed by its other fields
+        values = self.RECORD.unpack_from(self._map, self._offset(index))
+        texts = [self._text(values[position], values[position + 1]) for position in range(0, 2 * text_fields, 2)]
+        return texts + list(values[2 * text_fields:])
+
+    def _build(self, index):
+        # Subclasses turn a record into an object
+        raise NotImplementedError
+
+
+class EbookStore(_MappedStore):
+    """Ebook catalog opened from a store file written by export_ebooks()."""
+
+    MAGIC = b"EBKS"
+    # ISBN, title, author, publication date, genre, publisher, language, then the price in cents
+    RECORD = struct.Struct("<" + "QI" * 7 + "q")
+
+    def get(self, isbn, default=None):
+        # Ebook with the given ISBN, found by binary search
+        return self.find(str(isbn), default)
+
+    def _build(self, index):
+        # Rebuilds the Ebook for record `index`
+        isbn, title, author, publication_date, genre, publisher, language, price_cents = self._fields(index, 7)
+        return Ebook(title, author, publication_date, genre, Money.from_cents(price_cents), isbn, publisher, language)
+
+
+class CustomerStore(_MappedStore):
+    """Customer records opened from a store file written by export_customers()."""
+
+    MAGIC = b"CUSS"
+    # Email, name, contact number, address, payment method, then the loyalty flag
+    RECORD = struct.Struct("<" + "QI" * 5 + "?")
+
+    def get(self, email, default=None):
+        # Customer with the given email, found by binary search
+        return self.find(email, default)
+
+    def _build(self, index):
+        # Rebuilds the Customer for record `index`
+        email, name, contact_number, address, payment_method, loyalty_member = self._fields(index, 5)
+        return Customer(name, email, contact_number, address, payment_method, loyalty_member)
@@ -0,0 +1,120 @@
+import itertools  # Cumulative weights for skewed title popularity
+import random  # Seeded generators, so every run builds the same data
+
+from .core import Ebook, Customer, ShoppingCart, Order  # The objects being generated
+
+GENRES = ["Self-help", "Thriller", "Fantasy", "Romance", "Science", "History", "Biography", "Poetry"]
+PUBLISHERS = ["Penguin", "Celadon", "HarperCollins", "Macmillan", "Hachette", "Scholastic"]
+LANGUAGES = ["English", "Arabic", "French", "Spanish"]
+PAYMENT_METHODS = ["Credit Card", "Apple Pay", "PayPal", "Cash on Delivery"]
+SYLLABLES = ["ka", "lo", "mi", "ra", "te", "sun", "vel", "dor", "an", "is", "qu", "ze", "bar", "mon", "ith", "el"]
+
+
+# === Size Distributions ===
+def parse_distribution(spec):
+    # Turns a distribution spec into a function rng -> positive int. Supported specs:
+    #   "fixed:N"            - always N
+    #   "uniform:LOW:HIGH"   - any integer from LOW to HIGH, inclusive
+    #   "geometric:MEAN"     - 1, 2, 3 ... with the given mean (many small values, a long tail)
+    #   "zipf:S:MAX"         - 1 ... MAX with P(k) proportional to 1 / k**S
+    kind, _, arguments = spec.partition(":")
+    values = [float(value) for value in arguments.split(":")] if arguments else []
+    if kind == "fixed" and len(values) == 1:
+        size = int(values[0])
+        return lambda rng: size
+    if kind == "uniform" and len(values) == 2:
+        low, high = int(values[0]), int(values[1])
+        return lambda rng: rng.randint(low, high)
+    if kind == "geometric" and len(values) == 1 and values[0] >= 1:
+        success = 1 / values[0]  # Probability of stopping after each value
+
+        def geometric(rng):
+            size = 1
+            while rng.random() >= success:
+                size += 1
+            return size
+        return geometric
+    if kind == "zipf" and len(values) == 2:
+        sizes = range(1, int(values[1]) + 1)
+        cum_weights = list(itertools.accumulate(1 / size ** values[0] for size in sizes))
+        return lambda rng: rng.choices(sizes, cum_weights=cum_weights)[0]
+    raise ValueError(f"Unknown size distribution: {spec!r}")
+
+
+# === Synthetic Store ===
+class SyntheticStore:
+    """Seeded generator of ebooks, customers, carts and orders for benchmarks and load tests."""
+
+    def __init__(self, seed=0, lines="geometric:3", quantity="geometric:1.5", popularity=1.0, loyalty_rate=0.3):
+        # lines/quantity are distribution specs (see parse_distribution) for lines per cart and copies per line;
+        # popularity is the Zipf exponent of title choice (0 = every title equally likely)
+        self.seed = seed
+        self.lines = lines
+        self.quantity = quantity
+        self.popularity = popularity
+        self.loyalty_rate = loyalty_rate  # Share of customers in the loyalty program
+        self._lines = parse_distribution(lines)
+        self._quantity = parse_distribution(quantity)
+
+    def settings(self):
+        # The generator configuration, recorded next to benchmark results
+        return {"seed": self.seed, "lines": self.lines, "quantity": self.quantity, "popularity": self.popularity,
+                "loyalty_rate": self.loyalty_rate}
+
+    def ebook_fields(self, count):
+        # Ebook constructor arguments for `count` titles (so construction can be timed on its own)
+        rng = random.Random(f"{self.seed}-ebooks")
+        fields = []
+        for i in range(count):
+            title = " ".join(self._word(rng) for _ in range(rng.randint(1, 4))).title()
+            author = f"{self._word(rng).title()} {self._word(rng).title()}"
+            price = f"{rng.randint(99, 8_999) / 100:.2f}"  # $0.99 to $89.99
+            fields.append((title, author, str(rng.randint(1950, 2025)), rng.choice(GENRES), price,
+                           f"978{i:010d}", rng.choice(PUBLISHERS), rng.choice(LANGUAGES)))
+        return fields
+
+    def customer_fields(self, count):
+        # Customer constructor arguments for `count` customers
+        rng = random.Random(f"{self.seed}-customers")
+        return [(f"Customer {i}", f"customer{i}@example.com", f"050-{i:07d}", f"{i} Palm St, Dubai",
+                 rng.choice(PAYMENT_METHODS), rng.random() < self.loyalty_rate) for i in range(count)]
+
+    def ebooks(self, count):
+        # `count` Ebook objects
+        return [Ebook(*fields) for fields in self.ebook_fields(count)]
+
+    def customers(self, count):
+        # `count` Customer objects
+        return [Customer(*fields) for fields in self.customer_fields(count)]
+
+    def cart_lines(self, count, ebooks):
+        # [(ebook, quantity), ...] for `count` carts; popular titles are drawn more often
+        rng = random.Random(f"{self.seed}-carts")
+        cum_weights = list(itertools.accumulate(1 / (rank + 1) ** self.popularity for rank in range(len(ebooks))))
+        carts = []
+        for _ in range(count):
+            size = min(self._lines(rng), len(ebooks))
+            chosen = {}
+            while len(chosen) < size:
+                chosen[rng.choices(ebooks, cum_weights=cum_weights)[0]] = None
+            carts.append([(ebook, self._quantity(rng)) for ebook in chosen])
+        return carts
+
+    def carts(self, count, ebooks):
+        # `count` filled ShoppingCart objects
+        carts = []
+        for lines in self.cart_lines(count, ebooks):
+            cart = ShoppingCart()
+            for ebook, quantity in lines:
+                cart.add_item(ebook, quantity)
+            carts.append(cart)
+        return carts
+
+    def orders(self, count, ebooks, customers, discount=None):
+        # `count` Orders, each for a random customer
+        rng = random.Random(f"{self.seed}-orders")
+        return [Order(rng.choice(customers), cart, discount) for cart in self.carts(count, ebooks)]
+
+    def _word(self, rng):
+        # A pronounceable pseudo-word for titles and names
+        return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
@@ -1,7 +1,34 @@
-from code import *  # Import all classes and functions defined in code.py
+import asyncio  # Drive the async order pipeline check
+import decimal  # Reference arithmetic for the money checks
+import io  # In-memory files for the streamed invoices
+import os  # Scratch paths for the store round trip
+import random  # Random mutation sequences for the property checks
+import sys  # Shorter thread switch interval for the concurrency stress test
+import tempfile  # Scratch directory for the store round trip
+import threading  # Concurrent cart stress test
+import time  # Force thread switches inside cart updates
+from datetime import datetime, timedelta  # Fixed order dates for the ledger and promotion checks
+
+from ebookstore import *  # Import the core shop classes
+from ebookstore.order_pipeline import OrderPipeline, MemorySink  # Async pipeline and its fake sink
+from ebookstore.store import export_ebooks, export_customers, EbookStore, CustomerStore  # Binary catalog/customer store
+from ebookstore.synthetic import SyntheticStore  # Seeded benchmark data generator
+from ebookstore import instrumentation  # Opt-in hot-path timing and profiling
+from ebookstore.concurrent_cart import ConcurrentShoppingCart, CartRegistry  # Thread-safe carts
+from ebookstore.ledger import OrderLedger  # Append-only order history with sales rollups
+from ebookstore.pricing_cache import PricingCache  # LRU cache of order totals
+from ebookstore.promotions import PromotionRule, RulePlan, RuleBasedDiscount  # Compiled promotional rules
+from ebookstore.money import divide, RATE_SCALE  # Reference rounding for the promotion check
+from ebookstore.search import SearchIndex  # Full-text ebook search
+from ebookstore.catalog import Catalog  # ISBN-keyed catalog with secondary indexes
+from ebookstore.bulk_orders import process_orders  # Sharded bulk order processing
+from ebookstore.columnar import EbookTable  # Column-oriented ebook storage with row views
 
 # Main function to simulate customers interacting with an eBook store system
 def main():
+    # Show a confirmation message for every cart change, as the store console always has
+    ShoppingCart.default_event_sink = PrintEventSink()
+
     # === Define eBooks available for purchase ===
     # Initialize instances of Ebook with relevant details (title, author, etc.)
     ebook1 = Ebook("Atomic Habits", "James Clear", "2018", "Self-help", 29.99, "12345", "Penguin", "English")
@@ -63,6 +90,861 @@ def main():
     # Generate and print the invoice for Hamad's order, including VAT
     print(order3.generate_invoice())  # Print detailed invoice summary for Hamad
 
+
+# === Property checks (run with: python -m pytest test.py) ===
+def test_incremental_totals_match_recompute():
+    # Random add/remove/re-price sequences must leave the cart's running totals equal to a full recompute
+    rng = random.Random(2024)
+    ebooks = [Ebook(f"Book {i}", "Author", "2020", "Genre", round(rng.uniform(0.5, 99.99), 2), str(i), "Pub", "English")
+              for i in range(25)]
+    for _ in range(200):
+        cart = ShoppingCart(NullEventSink())  # No console output for the randomized run
+        for _ in range(rng.randint(1, 60)):
+            ebook = rng.choice(ebooks)
+            action = rng.random()
+            if action < 0.6:
+                cart.add_item(ebook, rng.randint(1, 5))
+            elif action < 0.95:
+                cart.remove_item(ebook, rng.randint(1, 5))
+            else:
+                ebook.price = round(rng.uniform(0.5, 99.99), 2)
+            expected_subtotal = sum((book.price * quantity for book, quantity in cart.items.items()), Money(0))
+            assert cart.subtotal == expected_subtotal
+            assert cart.total_quantity == sum(cart.items.values())
+            assert cart.line_count == len(cart.items)
+            assert all(quantity > 0 for quantity in cart.items.values())
+
+
+def test_money_matches_decimal_reference():
+    # 1M randomized orders, with random rates and rounding modes, must match a Decimal reference to the cent
+    rng = random.Random(13)
+    cent = decimal.Decimal("0.01")
+    modes = [decimal.ROUND_HALF_UP, decimal.ROUND_HALF_EVEN, decimal.ROUND_HALF_DOWN, decimal.ROUND_FLOOR,
+             decimal.ROUND_CEILING, decimal.ROUND_DOWN, decimal.ROUND_UP]
+    ebooks = [Ebook(f"Book {i}", "Author", "2020", "Genre", f"{rng.randint(1, 99_999) / 100:.2f}", str(i), "Pub",
+                    "English") for i in range(1_000)]
+    customers = [Customer("Member", "m@example.com", "050-0000000", "Dubai", "Card", True),
+                 Customer("Guest", "g@example.com", "050-0000000", "Dubai", "Card", False)]
+    discount = Discount()
+    for _ in range(1_000_000):
+        cart = ShoppingCart(NullEventSink())
+        for _ in range(rng.randint(1, 4)):
+            cart.add_item(rng.choice(ebooks), rng.randint(1, 6))
+        order = Order(rng.choice(customers), cart, discount)
+        discount.loyalty_discount = rng.choice((0.1, 0.125, 0.15))
+        discount.rounding = rng.choice(modes)
+        order.vat_rate = rng.choice((0.08, 0.05, 0.075, 0.2))
+        order.vat_rounding = rng.choice(modes)
+
+        # The same order priced entirely in Decimal
+        subtotal = sum(ebook.price.to_decimal() * quantity for ebook, quantity in cart.items.items())
+        rate = decimal.Decimal(0)
+        if order.customer.loyalty_member:
+            rate += decimal.Decimal(repr(discount.loyalty_discount))
+        if cart.total_quantity >= discount.bulk_threshold:
+            rate += decimal.Decimal(repr(discount.bulk_discount))
+        expected_discount = (subtotal * rate).quantize(cent, rounding=discount.rounding)
+        expected_vat = ((subtotal - expected_discount) * decimal.Decimal(repr(order.vat_rate))).quantize(
+            cent, rounding=order.vat_rounding)
+        expected = (subtotal, expected_discount, expected_vat, subtotal - expected_discount + expected_vat)
+        assert tuple(money.to_decimal() for money in order.calculate_total()) == expected
+
+
+def test_money_works_with_decimal_and_int():
+    # Money compares, hashes and does arithmetic with Decimal and int like a Decimal amount would
+    D = decimal.Decimal
+    price = Money("10.00")
+    assert price == D("10.00") and D("10") == price and price == 10 and price != D("10.001")
+    assert len({price, D("10"), 10}) == 1 and hash(Money("0.25")) == hash(D("0.25"))
+    assert price > 0 and 0 < price and price < D("10.01") and D("9.995") < price and not price <= 9
+    assert price + D("0.005") == D("10.005") and D("1.5") + price == D("11.50") and 25 - price == Money(15)
+    assert price + 1 == Money(11) and price * D("0.08") == D("0.8") and price / 4 == D("2.5")
+    assert sum([Money("0.10")] * 3) == D("0.30") and sum([price, price], Money(0)) == 20
+    assert round(Money("2.50")) == 2 and round(Money("3.50")) == 4 and round(price, 2) is price
+    assert round(Money("12.345"), 1) == D("12.3") and round(Money("15.25"), -1) == 20
+    assert D(str(price)) == price.to_decimal() == D("10.00")
+    total = Order(Customer("Member", "m@example.com", "050", "Dubai", "Card", True), ShoppingCart()).calculate_total()
+    assert all(value == 0 for value in total)
+
+
+def test_order_pipeline_persists_every_order():
+    # Every valid order reaches the fake sink with the same totals and invoice as the synchronous path,
+    # and an invalid (empty) cart fails through its future without stopping the pipeline
+    ebook = Ebook("Atomic Habits", "James Clear", "2018", "Self-help", 29.99, "12345", "Penguin", "English")
+    customers = [Customer(f"Customer {i}", "c@example.com", "050-0000000", "Dubai", "Card", i % 2 == 0)
+                 for i in range(50)]
+    carts = []
+    for i in range(50):
+        cart = ShoppingCart()
+        if i != 7:
+            cart.add_item(ebook, i % 6 + 1)
+        carts.append(cart)
+
+    async def run():
+        sink = MemorySink(delay=0.001)
+        async with OrderPipeline(sink, queue_size=4, persist_workers=3) as pipeline:
+            futures = [await pipeline.submit(customer, cart) for customer, cart in zip(customers, carts)]
+        outcomes = await asyncio.gather(*futures, return_exceptions=True)
+        return sink, outcomes
+
+    sink, outcomes = asyncio.run(run())
+    assert len(sink.records) == 49
+    assert isinstance(outcomes[7], ValueError)
+    for customer, cart, outcome in zip(customers, carts, outcomes):
+        if cart.items:
+            order = Order(customer, cart)
+            assert outcome.total == order.calculate_total()[3]
+            assert outcome.invoice == order.generate_invoice()
+
+
+def test_order_pipeline_invoices_the_cart_it_priced():
+    # A cart changed while its order is in flight is priced and invoiced as it was when the order was validated
+    habits = Ebook("Atomic Habits", "James Clear", "2018", "Self-help", 29.99, "12345", "Penguin", "English")
+    patient = Ebook("The Silent Patient", "Alex Michaelides", "2019", "Thriller", 49.99, "54321", "Celadon", "English")
+    customer = Customer("Zayed", "zayed@example.com", "050-1234567", "Dubai", "Credit Card", True)
+    carts = [ShoppingCart(NullEventSink()), ConcurrentShoppingCart(NullEventSink())]
+    for cart in carts:
+        cart.add_item(habits, 2)
+    expected = [Order(customer, cart.copy()) for cart in carts]
+
+    class ChangingPipeline(OrderPipeline):
+        async def _price(self, job):
+            await super()._price(job)
+            for cart in carts:
+                cart.add_item(patient, 3)  # The shopper keeps going between pricing and rendering
+
+    async def run():
+        async with ChangingPipeline(MemorySink()) as pipeline:
+            futures = [await pipeline.submit(customer, cart) for cart in carts]
+        return await asyncio.gather(*futures)
+
+    for outcome, order in zip(asyncio.run(run()), expected):
+        assert outcome.total == order.calculate_total()[3] and outcome.invoice == order.generate_invoice()
+        assert f"Total with VAT: ${outcome.total:.2f}" in outcome.invoice
+
+
+def test_order_pipeline_prices_off_the_event_loop():
+    # Slow pricing runs in the executor: four orders are priced (and invoiced) at once and the event loop keeps running
+    from concurrent.futures import ThreadPoolExecutor  # The executor handed to the pipeline
+
+    class SlowDiscount(Discount):
+        def apply_discount_cents(self, *args, **kwargs):
+            time.sleep(0.05)  # Stands in for heavy promotional pricing; blocks whichever thread runs it
+            return super().apply_discount_cents(*args, **kwargs)
+
+    ebook = Ebook("Atomic Habits", "James Clear", "2018", "Self-help", 29.99, "12345", "Penguin", "English")
+    customer = Customer("Zayed", "zayed@example.com", "050-1234567", "Dubai", "Credit Card", True)
+    carts = []
+    for quantity in range(1, 9):
+        cart = ShoppingCart(NullEventSink())
+        cart.add_item(ebook, quantity)
+        carts.append(cart)
+    discount = SlowDiscount()
+
+    async def run(executor):
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            # Counts how often the loop gets to run other tasks while orders are priced
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        async with OrderPipeline(MemorySink(), price_workers=4, render_workers=4, discount=discount,
+                                 executor=executor) as pipeline:
+            futures = [await pipeline.submit(customer, cart) for cart in carts]
+        results = await asyncio.gather(*futures)
+        elapsed = time.perf_counter() - started
+        done.set()
+        await task
+        return results, elapsed, ticks
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results, elapsed, ticks = asyncio.run(run(executor))
+    # Each order is priced twice (totals, then invoice): 16 x 50 ms, four at a time, instead of 0.8 s one by one
+    assert elapsed < 0.5
+    assert ticks >= 10
+    for cart, result in zip(carts, results):
+        order = Order(customer, cart, discount)
+        assert result.total == order.calculate_total()[3] and result.invoice == order.generate_invoice()
+
+
+def test_store_round_trip():
+    # Ebooks and customers exported to the binary store come back with every attribute intact
+    ebooks = [Ebook("Atomic Habits", "James Clear", "2018", "Self-help", 29.99, "12345", "Penguin", "English"),
+              Ebook("The Silent Patient", "Alex Michaelides", "2019", "Thriller", 49.99, "54321", "Celadon", "English"),
+              Ebook("Mawsim al-Hijra", "Tayeb Salih", "1966", "Novel", 15.5, "00007", "Heinemann", "العربية")]
+    customers = [Customer("Zayed Alblooshi", "zayed@example.com", "050-1234567", "123 Palm St, Dubai", "Credit Card", True),
+                 Customer("Hamad Almulla", "hamad@example.com", "050-3344556", "789 Desert Rd, Sharjah", "Apple Pay")]
+    with tempfile.TemporaryDirectory() as directory:
+        export_ebooks(ebooks, os.path.join(directory, "ebooks.bin"))
+        export_customers(customers, os.path.join(directory, "customers.bin"))
+        with EbookStore(os.path.join(directory, "ebooks.bin")) as ebook_store, \
+                CustomerStore(os.path.join(directory, "customers.bin")) as customer_store:
+            assert len(ebook_store) == 3 and len(customer_store) == 2
+            for ebook in ebooks:
+                loaded = ebook_store.get(ebook.get_isbn())
+                assert loaded is ebook_store.get(ebook.get_isbn())  # Same object on every access
+                assert (str(loaded), loaded.get_isbn(), loaded.genre, loaded.publication_date) == \
+                       (str(ebook), ebook.get_isbn(), ebook.genre, ebook.publication_date)
+            for customer in customers:
+                loaded = customer_store.get(customer.get_email())
+                assert (str(loaded), loaded.get_contact_number()) == (str(customer), customer.get_contact_number())
+            assert ebook_store.get("99999") is None
+            assert [ebook.get_isbn() for ebook in ebook_store] == ["00007", "12345", "54321"]
+
+
+def test_synthetic_store_is_seeded():
+    # The same seed builds the same data, and cart sizes stay inside the requested distributions
+    def snapshot(store):
+        ebooks = store.ebooks(50)
+        return ([str(ebook) for ebook in ebooks], store.customer_fields(20),
+                [[(ebook.get_isbn(), quantity) for ebook, quantity in lines] for lines in store.cart_lines(200, ebooks)])
+    store = SyntheticStore(seed=7, lines="uniform:2:4", quantity="fixed:3")
+    assert snapshot(store) == snapshot(SyntheticStore(seed=7, lines="uniform:2:4", quantity="fixed:3"))
+    assert snapshot(store) != snapshot(SyntheticStore(seed=8, lines="uniform:2:4", quantity="fixed:3"))
+    for lines in store.cart_lines(200, store.ebooks(50)):
+        assert 2 <= len(lines) <= 4 and len({ebook for ebook, _ in lines}) == len(lines)
+        assert all(quantity == 3 for _, quantity in lines)
+
+
+def test_instrumentation_counts_calls_and_restores_methods():
+    # Enabled, every hot-path call is counted and exported; disabled, the original methods are back in place
+    originals = (ShoppingCart.add_item, Order.calculate_total_cents, Discount.apply_discount_cents)
+    ebook = Ebook("Atomic Habits", "James Clear", "2018", "Self-help", 29.99, "12345", "Penguin", "English")
+    customer = Customer("Zayed Alblooshi", "zayed@example.com", "050-1234567", "Dubai", "Credit Card", True)
+    with instrumentation.instrumented(instrumentation.Metrics()) as metrics:
+        assert instrumentation.is_enabled()
+        cart = ShoppingCart(NullEventSink())
+        cart.add_item(ebook, 3)
+        cart.remove_item(ebook, 1)
+        order = Order(customer, cart)
+        assert order.calculate_total()[3] == Money("58.30")
+        order.generate_invoice()
+    assert not instrumentation.is_enabled()
+    assert (ShoppingCart.add_item, Order.calculate_total_cents, Discount.apply_discount_cents) == originals
+    counts = {name: histogram["count"] for name, histogram in metrics.snapshot().items()}
+    assert counts == {"ShoppingCart.add_item": 1, "ShoppingCart.remove_item": 1, "Order.calculate_total": 1,
+                      "Order.calculate_total_cents": 2, "Discount.apply_discount_cents": 2,
+                      "Order.generate_invoice": 1}
+    prometheus = metrics.to_prometheus()
+    assert 'ebook_store_call_duration_seconds_count{method="Order.calculate_total_cents"} 2' in prometheus
+    assert 'ebook_store_call_duration_seconds_bucket{method="ShoppingCart.add_item",le="+Inf"} 1' in prometheus
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "profile.prof")
+        with instrumentation.profiled(path):
+            order.generate_invoice()
+        assert os.path.getsize(path) > 0
+
+
+def test_concurrent_cart_loses_no_updates():
+    # Threads hammering one shared cart (through the registry) lose no update, and every snapshot taken meanwhile
+    # is internally consistent
+    ebooks = [Ebook(f"Title {i}", "Author", "2020", "Fiction", 1 + i / 100, str(i), "Penguin", "English")
+              for i in range(8)]
+    customer = Customer("Family Account", "family@example.com", "050-0000000", "Dubai", "Credit Card", True)
+    registry = CartRegistry(stripes=4, event_sink=NullEventSink())
+    threads, rounds = 8, 2_000
+    inconsistent = []
+
+    def shopper(seed):
+        rng = random.Random(seed)
+        cart = registry.cart_for(customer)
+        for i in range(rounds):
+            ebook = rng.choice(ebooks)
+            cart.add_item(ebook, 2)
+            cart.remove_item(ebook, 1)  # Net +1 copy of each ebook per round
+            if i % 100 == 0:
+                snapshot = cart.snapshot()
+                if snapshot.subtotal_cents != sum(e.price_cents * q for e, q in snapshot.items.items()):
+                    inconsistent.append(snapshot)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads as often as possible to provoke races
+    try:
+        workers = [threading.Thread(target=shopper, args=(seed,)) for seed in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    finally:
+        sys.setswitchinterval(interval)
+    cart = registry.cart_for(customer)
+    assert isinstance(cart, ConcurrentShoppingCart) and len(registry) == 1 and not inconsistent
+    assert cart.total_quantity == threads * rounds
+    assert cart.subtotal_cents == sum(ebook.price_cents * quantity for ebook, quantity in cart.items.items())
+    order = registry.checkout(customer)
+    assert customer not in registry and order.shopping_cart.total_quantity == threads * rounds
+    assert order.calculate_total() == Order(customer, cart).calculate_total()
+
+
+class SlowPriceEbook(Ebook):
+    """Ebook whose price lookup sleeps, handing the GIL to other threads in the middle of a cart update."""
+
+    @property
+    def price_cents(self):
+        time.sleep(0.001)  # Lands between the cart's read of its running subtotal and its write-back
+        return self._price_cents
+
+
+def test_concurrent_cart_survives_a_forced_race():
+    # Every add_item reads the running subtotal, then the price (which yields), then writes the sum back; with four
+    # threads that is a guaranteed lost update unless the read-modify-write runs under a lock
+    ebook = SlowPriceEbook("Dune", "Frank Herbert", "1965", "Fantasy", "9.99", "111", "Ace", "English")
+    threads, rounds = 4, 25
+
+    def race(cart):
+        def shopper():
+            for _ in range(rounds):
+                cart.add_item(ebook)
+
+        workers = [threading.Thread(target=shopper) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return cart.subtotal_cents
+
+    expected = 999 * threads * rounds
+    assert race(ShoppingCart(NullEventSink())) < expected  # Negative control: the plain cart loses updates
+    cart = ConcurrentShoppingCart(NullEventSink(), stripes=4)
+    assert race(cart) == expected and cart.total_quantity == threads * rounds
+
+
+def test_ledger_rollups_survive_reopen_and_match_full_scan():
+    # Rollups kept incrementally, across a snapshot, a journal replay and a torn final write, equal a full rescan
+    store = SyntheticStore(seed=3)
+    ebooks, customers = store.ebooks(40), store.customers(10)
+    orders = store.orders(600, ebooks, customers)
+    for index, order in enumerate(orders):
+        order.order_date = datetime(2026, 3, 1 + index % 28, 12)
+    with tempfile.TemporaryDirectory() as directory:
+        with OrderLedger(directory, snapshot_every=250, top_size=5) as ledger:
+            entries = [ledger.record(order) for order in orders[:400]]
+        ledger = OrderLedger(directory, snapshot_every=250, top_size=5)  # Snapshot at 250, replay of the rest
+        entries += [ledger.record(order) for order in orders[400:]]
+        ledger.flush()
+        with open(os.path.join(directory, OrderLedger.JOURNAL), "ab") as journal:
+            journal.write(b'[601,"2026-03-0')  # Crash in the middle of an append
+        reopened = OrderLedger(directory, top_size=5)
+        assert len(reopened) == 600 and list(reopened.entries()) == entries
+        assert reopened.rollups.to_dict() == ledger.rollups.to_dict()
+        rollups = reopened.rollups
+        copies, genres = {}, {}
+        for entry in entries:
+            for line in entry.lines:
+                copies[line.isbn] = copies.get(line.isbn, 0) + line.quantity
+                genres[line.genre] = genres.get(line.genre, 0) + line.amount
+        expected = sorted(copies.items(), key=lambda item: (-item[1], item[0]))
+        assert [(isbn, count) for isbn, _, count in rollups.bestsellers(5)] == expected[:5]
+        assert [(isbn, count) for isbn, _, count in rollups.bestsellers(20)] == expected[:20]
+        assert rollups.revenue_by("genre") == dict(sorted(genres.items(), key=lambda item: -item[1]))
+        week = [entry for entry in entries if 8 <= entry.order_date.day <= 14]
+        assert rollups.between("2026-03-08", "2026-03-14") == {
+            "orders": len(week), "copies": sum(line.quantity for entry in week for line in entry.lines),
+            "subtotal": sum(entry.subtotal for entry in week), "discount": sum(entry.discount for entry in week),
+            "vat": sum(entry.vat for entry in week), "total": sum(entry.total for entry in week)}
+        assert entries[0].total == orders[0].calculate_total()[3].cents
+        reopened.close()
+
+
+def test_pricing_cache_never_serves_stale_totals():
+    # Cached totals always equal a fresh calculate_total(), however the cart's ebooks differ from earlier ones
+    member = Customer("Member", "m@example.com", "050-0000000", "Dubai", "Card", True)
+    rules = RuleBasedDiscount([PromotionRule("fantasy", rate=0.5, genre="Fantasy"),
+                               PromotionRule("penguin", rate=0.25, publisher="Penguin")])
+    cache = PricingCache()
+
+    def check(ebook, discount, quantity=2):
+        cart = ShoppingCart()
+        cart.add_item(ebook, quantity)
+        order = Order(member, cart, discount)
+        assert cache.price_order(order) == order.calculate_total()
+
+    for discount in (Discount(), rules):
+        # A new Ebook object reusing a cached ISBN at another price (no price setter, so no epoch change)
+        check(Ebook("Dune", "Herbert", "1965", "Fantasy", "10.00", "111", "Penguin", "English"), discount)
+        check(Ebook("Dune", "Herbert", "1965", "Fantasy", "99.00", "111", "Penguin", "English"), discount)
+    # Same ISBN and price, but a genre or publisher that the rules see differently
+    check(Ebook("Dune", "Herbert", "1965", "Poetry", "10.00", "111", "Penguin", "English"), rules)
+    check(Ebook("Dune", "Herbert", "1965", "Poetry", "10.00", "111", "Ace", "English"), rules)
+    ebook = Ebook("Dune", "Herbert", "1965", "Fantasy", "10.00", "111", "Ace", "English")
+    check(ebook, rules)
+    ebook.genre = "Poetry"  # Changed in place; now the same line as the Poetry/Ace cart above
+    check(ebook, rules)
+    assert cache.hits == 1 and cache.invalidations == 0
+    # A price change through the setter drops the whole cache
+    ebook.price = "12.00"
+    check(ebook, rules)
+    check(ebook, rules)
+    assert cache.invalidations == 1 and cache.hits == 2
+
+
+def test_search_finds_isbns_as_typed_through_index_updates():
+    # An ISBN is found with or without its hyphens, after incremental adds, removals and ISBN changes
+    habits = Ebook("Atomic Habits", "James Clear", "2018", "Self-help", "29.99", "978-0-7352-1129-2", "Penguin",
+                   "English")
+    songs = Ebook("Songs 1984-2004", "Various", "2005", "Poetry", "5.00", "0-14-044913-X", "Ace", "English")
+    index = SearchIndex([habits])
+    for query in ("978-0-7352-1129-2", "9780735211292", "atomic 978-0-7352-1129-2", " 978-0-7352-1129-2 "):
+        assert index.search(query) == [habits]
+    assert index.search_prefix("978-0-73") == [habits] and index.search("978-0-7352-1129-3") == []
+    index.add(songs)
+    assert index.search("0-14-044913-x") == [songs] and index.search_prefix("songs 0-14-04") == [songs]
+    assert index.search("1984-2004") == [songs]  # A hyphenated number that is not an ISBN still matches its pieces
+    habits.set_isbn("978-1-84794-183-1")
+    assert index.search("978-0-7352-1129-2") == [] and index.search("978-1-84794-183-1") == [habits]
+    index.remove(songs)
+    assert index.search("0-14-044913-X") == [] and index.search_prefix("0-14") == []
+    songs.set_isbn("978-0-00-000000-0")  # No longer watched, so the index is untouched
+    assert index.search("978-0-00-000000-0") == [] and len(index) == 1
+
+
+def test_price_orders_matches_calculate_total():
+    # The vectorized batch prices equal Order.calculate_total() for every order, whatever its discount, rates and
+    # rounding modes, including promotional rules
+    from ebookstore.batch_pricing import price_orders  # Needs NumPy, so only imported by this check
+    rng = random.Random(3)
+    modes = [decimal.ROUND_HALF_UP, decimal.ROUND_HALF_EVEN, decimal.ROUND_HALF_DOWN, decimal.ROUND_FLOOR,
+             decimal.ROUND_CEILING, decimal.ROUND_DOWN, decimal.ROUND_UP]
+    genres, publishers = ["Fantasy", "Thriller", "Poetry"], ["Penguin", "Ace"]
+    ebooks = [Ebook(f"Book {i}", "Author", "2020", rng.choice(genres), f"{rng.randint(1, 9_999) / 100:.2f}", str(i),
+                    rng.choice(publishers), "English") for i in range(50)]
+    rules = [PromotionRule("fantasy", rate=0.05, genre="Fantasy"),
+             PromotionRule("ace", tiers=[(2, 0.03), (5, 0.07)], publisher="Ace"),
+             PromotionRule("book 7", rate=0.5, isbn="7")]
+    customers = [Customer("Member", "m@example.com", "050", "Dubai", "Card", True),
+                 Customer("Guest", "g@example.com", "050", "Dubai", "Card", False)]
+    orders = []
+    for _ in range(2_000):
+        cart = ShoppingCart()
+        for _ in range(rng.randint(0, 5)):
+            cart.add_item(rng.choice(ebooks), rng.randint(1, 4))
+        discount = RuleBasedDiscount(rules) if rng.random() < 0.4 else Discount()
+        discount.loyalty_discount = rng.choice((0.1, 0.125, 0.15))
+        discount.bulk_discount = rng.choice((0.2, 0.05))
+        discount.rounding = rng.choice(modes)
+        order = Order(rng.choice(customers), cart, discount)
+        order.vat_rate = rng.choice((0.08, 0.05, 0.075, 0.2))
+        order.vat_rounding = rng.choice(modes)
+        orders.append(order)
+    batch = price_orders(orders)
+    for index, order in enumerate(orders):
+        assert [int(field[index]) for field in batch] == [value.cents for value in order.calculate_total()]
+
+
+def test_price_lines_handles_empty_carts():
+    # Empty carts at the start, in the middle and at the end sum to zero without shifting their neighbours' lines
+    from ebookstore.batch_pricing import price_lines, flatten_carts  # Needs NumPy, so only imported by this check
+    ebooks = [Ebook(f"Book {i}", "Author", "2020", "Fiction", f"{i * 3 + 0.99:.2f}", str(i), "Penguin", "English")
+              for i in range(6)]
+    carts = [ShoppingCart() for _ in range(7)]
+    for ebook, quantity in zip(ebooks[:3], (1, 2, 3)):
+        carts[1].add_item(ebook, quantity)
+    carts[3].add_item(ebooks[3], 1)
+    for ebook in ebooks[3:]:
+        carts[5].add_item(ebook, 4)  # Enough copies for the bulk discount
+    loyalty = [True, False, True, True, False, True, False]
+    batch = price_lines(*flatten_carts(carts), loyalty)
+    for index, cart in enumerate(carts):
+        customer = Customer("Buyer", "b@example.com", "050", "Dubai", "Card", loyalty[index])
+        expected = Order(customer, cart).calculate_total()
+        assert [int(field[index]) for field in batch] == [value.cents for value in expected]
+    assert list(batch.subtotal) == [0, 99 + 2 * 399 + 3 * 699, 0, 999, 0, 4 * (999 + 1299 + 1599), 0]
+    assert list(price_lines([100, 200, 300], [1, 1, 1], [3, 0], [False, False]).subtotal) == [600, 0]
+
+
+def test_batch_pricing_large_amounts_and_discount_subclasses():
+    # Products too large for int64 fall back to Python integers, every order is priced from one snapshot, and
+    # discounts that cannot be vectorized are refused instead of being priced at the base rates
+    from ebookstore.batch_pricing import price_orders, price_subtotals  # Needs NumPy, so only imported here
+    modes = [decimal.ROUND_HALF_UP, decimal.ROUND_HALF_EVEN, decimal.ROUND_HALF_DOWN, decimal.ROUND_FLOOR,
+             decimal.ROUND_CEILING, decimal.ROUND_DOWN, decimal.ROUND_UP]
+    snapshots = []
+
+    class CountingCart(ShoppingCart):
+        def snapshot(self):
+            snapshots.append(self)
+            return super().snapshot()
+
+    member = Customer("Member", "m@example.com", "050", "Dubai", "Card", True)
+    orders = []
+    for index, mode in enumerate(modes):
+        discount = Discount()
+        discount.loyalty_discount = 0.333333333333  # A rate whose exact fraction overflows int64 at these amounts
+        discount.rounding = mode
+        cart = CountingCart()
+        cart.add_item(Ebook(f"Atlas {index}", "Author", "2020", "Maps", f"{300_000 + index}.00", str(index), "Ace",
+                            "English"), 1)
+        orders.append(Order(member, cart, discount))
+        single = price_subtotals([cart.subtotal_cents], [1], [True], discount)
+        assert [int(field[0]) for field in single] == list(orders[-1].calculate_total_cents())
+    expected = [order.calculate_total_cents() for order in orders]
+    del snapshots[:]
+    batch = price_orders(orders)
+    assert [tuple(int(field[index]) for field in batch) for index in range(len(orders))] == expected
+    assert snapshots == [order.shopping_cart for order in orders]
+
+    class HalfPriceDiscount(Discount):
+        def apply_discount_cents(self, subtotal_cents, is_loyalty_member, bulk_quantity, shopping_cart=None,
+                                 when=None):
+            return subtotal_cents // 2
+
+    try:
+        price_orders(orders + [Order(member, orders[0].shopping_cart, HalfPriceDiscount())])
+        raise AssertionError("custom discount priced at the base rates")
+    except TypeError:
+        pass
+
+
+def test_streamed_invoices_match_generate_invoice():
+    # write_invoice() and write_invoices() stream exactly the text generate_invoice() returns
+    store = SyntheticStore(seed=4)
+    orders = store.orders(300, store.ebooks(60), store.customers(20))
+    orders.append(Order(orders[0].customer, ShoppingCart()))  # An empty cart still gets an invoice
+    for order in orders[:20]:
+        stream = io.StringIO()
+        order.write_invoice(stream)
+        assert stream.getvalue() == order.generate_invoice() == "".join(order.iter_invoice())
+    for separator in ("\n", "", "---\n"):
+        stream = io.StringIO()
+        write_invoices(orders, stream, separator)
+        assert stream.getvalue() == separator.join(order.generate_invoice() for order in orders)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "invoices.txt")
+        with open(path, "w") as invoices:
+            write_invoices(iter(orders), invoices)  # Any iterable of orders, e.g. a generator
+        with open(path) as invoices:
+            assert invoices.read() == "\n".join(order.generate_invoice() for order in orders)
+
+
+def test_rule_plan_matches_naive_evaluation():
+    # The compiled plan gives the same discount as checking every rule against every line, for random rule sets
+    # mixing flat and tiered rates, date windows and ISBN, genre, publisher and cart-wide filters
+    rng = random.Random(7)
+    modes = [decimal.ROUND_HALF_UP, decimal.ROUND_HALF_EVEN, decimal.ROUND_FLOOR, decimal.ROUND_CEILING]
+    genres, publishers = ["Fantasy", "Thriller", "Poetry"], ["Penguin", "Ace", "Tor"]
+    ebooks = [Ebook(f"Book {i}", "Author", "2020", rng.choice(genres), f"{rng.randint(1, 9_999) / 100:.2f}", str(i),
+                    rng.choice(publishers), "English") for i in range(30)]
+    start = datetime(2026, 6, 1)
+
+    def random_rule(index):
+        window = rng.choice([(None, None), (start.date(), (start + timedelta(days=10)).date()),
+                             ((start + timedelta(days=5)).date(), None), (None, (start + timedelta(days=3)).date())])
+        rate = {"rate": rng.choice((0.05, 0.1, 0.125))} if rng.random() < 0.5 else \
+            {"tiers": [(rng.randint(1, 3), 0.02), (rng.randint(4, 8), 0.06)]}
+        filters = rng.choice([{"isbn": str(rng.randrange(30))}, {"genre": rng.choice(genres)},
+                              {"publisher": rng.choice(publishers)},
+                              {"genre": rng.choice(genres), "publisher": rng.choice(publishers)},
+                              {"isbn": str(rng.randrange(30)), "genre": rng.choice(genres)}, {}])
+        return PromotionRule(f"rule {index}", starts=window[0], ends=window[1], **rate, **filters)
+
+    def naive(rules, cart, when, rounding):
+        scaled = 0
+        for rule in rules:
+            lines = [(ebook, quantity) for ebook, quantity in cart.items.items() if rule.matches(ebook)]
+            if rule.is_active(when.date()) and lines:
+                quantity = sum(quantity for _, quantity in lines)
+                scaled += sum(ebook.price_cents * quantity for ebook, quantity in lines) * rule.units_for(quantity)
+        return divide(scaled, RATE_SCALE, rounding)
+
+    for _ in range(100):
+        rules = [random_rule(index) for index in range(rng.randint(1, 12))]
+        plan = RulePlan(rules)
+        for _ in range(20):
+            cart = ShoppingCart()
+            for ebook in rng.sample(ebooks, rng.randint(0, 6)):
+                cart.add_item(ebook, rng.randint(1, 5))
+            when = start + timedelta(days=rng.randint(-2, 14), hours=rng.randint(0, 23))
+            rounding = rng.choice(modes)
+            assert plan.evaluate(cart, when, rounding).cents == naive(rules, cart, when, rounding)
+
+
+def test_catalog_indexes_and_isbn_changes():
+    # Secondary-index lookups, set_isbn() re-keying, and a rejected duplicate ISBN leaving every watcher unchanged
+    habits = Ebook("Atomic Habits", "James Clear", "2018-10-16", "Self-help", 29.99, "12345", "Penguin", "English")
+    patient = Ebook("The Silent Patient", "Alex Michaelides", "2019", "Thriller", 49.99, "54321", "Celadon", "English")
+    clear = Ebook("Clear Thinking", "James Clear", "2018", "Self-help", 19.99, "11111", "Avery", "Arabic")
+    undated = Ebook("Untitled", "Anonymous", "n.d.", "Poetry", 5.00, "99999", "Penguin", "English")
+    catalog = Catalog([habits, patient, clear, undated])
+    assert len(catalog) == 4 and list(catalog) == [habits, patient, clear, undated]
+    assert catalog.by_author("James Clear") == [habits, clear] and catalog.by_author("Nobody") == []
+    assert catalog.by_genre("Self-help") == [habits, clear] and catalog.by_genre("Thriller") == [patient]
+    assert catalog.by_publisher("Penguin") == [habits, undated] and catalog.by_publisher("Avery") == [clear]
+    assert catalog.by_language("English") == [habits, patient, undated] and catalog.by_language("Arabic") == [clear]
+    assert catalog.by_year(2018) == [habits, clear] and catalog.by_year(2019) == [patient]
+    assert catalog.by_year(None) == [undated] and catalog.by_year(2020) == []
+    try:
+        catalog.add(Ebook("Copy", "Someone", "2020", "Poetry", 1.00, "12345", "Ace", "English"))
+        raise AssertionError("duplicate ISBN accepted")
+    except ValueError:
+        pass
+
+    # Re-keying: the ebook moves to its new ISBN, the old one is free again
+    habits.set_isbn("67890")
+    assert catalog.get("67890") is habits and "12345" not in catalog and catalog.get("12345") is None
+    habits.set_isbn("67890")  # Unchanged ISBN is a no-op
+    assert catalog.get("67890") is habits and len(catalog) == 4
+
+    # A duplicate in one watcher is rolled back in the watchers already told, and never reaches the later ones
+    other = Catalog([Ebook("Other", "Someone", "2020", "Poetry", 1.00, "24680", "Ace", "English")])
+    other.add(habits)
+    index = SearchIndex([habits])  # Watches habits after both catalogs
+    watchers = (catalog, other, index)
+    assert habits._watchers == watchers
+    try:
+        habits.set_isbn("24680")
+        raise AssertionError("duplicate ISBN accepted")
+    except ValueError:
+        pass
+    assert habits.get_isbn() == "67890" and habits._watchers == watchers
+    assert catalog.get("67890") is habits and "24680" not in catalog and len(catalog) == 4
+    assert other.get("67890") is habits and other.get("24680").title == "Other" and len(other) == 2
+    assert index.search("67890") == [habits] and index.search("24680") == []
+
+    # Removed ebooks stop being watched and leave no empty index buckets behind
+    assert catalog.remove("54321") is patient and "54321" not in catalog and catalog.by_genre("Thriller") == []
+    patient.set_isbn("12345")
+    assert "12345" not in catalog and catalog.get("54321") is None
+
+    # Indexed attributes changed in place stay filed under their old keys until update(), and remove() still works
+    clear.genre, clear.author, clear.publication_date = "Business", "J. Clear", "2021"
+    assert catalog.by_genre("Self-help") == [habits, clear] and catalog.by_genre("Business") == []
+    catalog.update(clear)
+    assert catalog.by_genre("Self-help") == [habits] and catalog.by_genre("Business") == [clear]
+    assert catalog.by_author("J. Clear") == [clear] and catalog.by_year(2021) == [clear]
+    assert catalog.by_year(2018) == [habits]
+    habits.genre, habits.language = "Poetry", "French"
+    assert catalog.remove("67890") is habits and len(catalog) == 2
+    assert catalog.by_genre("Self-help") == [] and catalog.by_language("English") == [undated]
+    assert catalog.by_publisher("Penguin") == [undated] and catalog.by_year(2018) == []
+
+
+def test_process_orders_matches_orders():
+    # Every executor returns, in input order, the totals and invoice Order() gives for the original pairs
+    rng = random.Random(8)
+    ebooks = [Ebook(f"Title {i}", f"Author {i % 4}", "2020", rng.choice(("Poetry", "Fiction")),
+                    round(rng.uniform(0.5, 80), 2), str(1000 + i), rng.choice(("Ace", "Penguin")), "English")
+              for i in range(30)]
+    pairs = []
+    for i in range(50):
+        cart = ShoppingCart()
+        for ebook in rng.sample(ebooks, rng.randint(1, 6)):
+            cart.add_item(ebook, rng.randint(1, 12))
+        pairs.append((Customer(f"Customer {i}", "c@example.com", "050-0000000", "Dubai", "Card", i % 3 == 0), cart))
+    discount = RuleBasedDiscount([PromotionRule("Poetry", rate=0.1, genre="Poetry"),
+                                  PromotionRule("Ace bulk", tiers=[(5, 0.05), (20, 0.15)], publisher="Ace")])
+    order_date = datetime(2024, 3, 1, 12, 30)
+    expected = []
+    for customer, cart in pairs:
+        order = Order(customer, cart, discount)
+        order.vat_rate = 0.05
+        order.order_date = order_date
+        expected.append((customer.name, *order.calculate_total(), order.generate_invoice()))
+    for executor in ("inline", "thread", "process"):
+        # A generator of pairs and small shards, so several shards are in flight at once
+        results = process_orders((pair for pair in pairs), discount, vat_rate=0.05, workers=2, executor=executor,
+                                 chunk_size=7, order_date=order_date)
+        assert [tuple(result) for result in results] == expected, executor
+
+
+def test_calculate_total_reuses_money_only_while_inputs_are_unchanged():
+    # Money totals are kept once an order is priced twice, and every input that affects the price invalidates them
+    dune = Ebook("Dune", "Herbert", "1965", "Fantasy", "10.00", "111", "Penguin", "English")
+    emma = Ebook("Emma", "Austen", "1815", "Classics", "7.49", "222", "Ace", "English")
+    customer = Customer("Shopper", "s@example.com", "050", "Dubai", "Card", False)
+    cart = ShoppingCart()
+    cart.add_item(dune, 2)
+    order = Order(customer, cart)
+
+    def check(cached=True):
+        # Priced twice (so the second call keeps its Money), then served from the cache, always equal to the cents
+        first = order.calculate_total()
+        assert (order.calculate_total() is order.calculate_total()) == cached
+        assert [value.cents for value in first] == list(order.calculate_total_cents())
+        return [value.cents for value in first]
+
+    def other_half_discount():
+        discount = Discount()
+        discount.loyalty_discount = 0.5
+        return discount
+
+    changes = [lambda: cart.add_item(emma, 3), lambda: cart.remove_item(emma, 1),
+               lambda: setattr(dune, "price", "11.25"), lambda: setattr(customer, "loyalty_member", True),
+               lambda: setattr(order.discount, "loyalty_discount", 0.15),
+               lambda: setattr(order.discount, "bulk_threshold", 4),
+               lambda: setattr(order.discount, "bulk_discount", 0.05), lambda: setattr(order, "vat_rate", 0.2),
+               lambda: setattr(order.discount, "rounding", decimal.ROUND_FLOOR),
+               lambda: setattr(order, "vat_rounding", decimal.ROUND_DOWN),
+               lambda: setattr(order, "discount", other_half_discount()),
+               lambda: setattr(order, "shopping_cart", ConcurrentShoppingCart()),
+               lambda: order.shopping_cart.add_item(emma, 1),
+               lambda: order.shopping_cart.add_item(dune, 1)]
+    totals = check()
+    for index, change in enumerate(changes):
+        change()
+        previous, totals = totals, check()
+        assert totals != previous, index
+
+    # Discounts that read the cart lines, or override apply_discount_cents(), are priced on every call
+    order.shopping_cart = cart
+    order.discount = RuleBasedDiscount([PromotionRule("poetry", rate=0.5, genre="Poetry")])
+    before = check(cached=False)
+    dune.genre = "Poetry"  # Changed in place: no cart, price or rate change
+    assert check(cached=False) != before
+
+    class ToggleDiscount(Discount):
+        enabled = False
+
+        def apply_discount_cents(self, subtotal_cents, is_loyalty_member, bulk_quantity, shopping_cart=None,
+                                 when=None):
+            return subtotal_cents // 4 if self.enabled else 0
+
+    order.discount = ToggleDiscount()
+    before = check(cached=False)
+    order.discount.enabled = True
+    assert check(cached=False) != before
+
+
+def test_search_vocabulary_stays_sorted_through_updates():
+    # The prefix vocabulary is maintained in place: always exactly the sorted live tokens, whatever changed
+    rng = random.Random(11)
+    syllables = ["ka", "lo", "mi", "nu", "ra", "se", "ti", "vo"]
+
+    def word():
+        return "".join(rng.choice(syllables) for _ in range(rng.randint(1, 3)))
+
+    def ebook(number):
+        return Ebook(f"{word()} {word()}".title(), word().title(), "2020", rng.choice(["Poetry", "Fiction"]), 5.0,
+                     f"978-{number:06d}", rng.choice(["Ace", "Penguin"]), "English")
+
+    ebooks = [ebook(number) for number in range(200)]
+    index = SearchIndex(ebooks[:100])
+    index.add_many(ebooks[100:150])
+    try:
+        index.add_many(ebooks[150:160] + [ebooks[0]])  # The duplicate stops the batch after ten new ebooks
+        raise AssertionError("duplicate ebook indexed")
+    except ValueError:
+        pass
+    assert index._vocabulary == sorted(index._postings) and len(index) == 160
+    live, waiting = ebooks[:160], ebooks[160:]
+    for step in range(300):
+        action = rng.random()
+        if action < 0.3 and waiting:
+            live.append(waiting.pop())
+            index.add(live[-1])
+        elif action < 0.5:
+            index.remove(live.pop(rng.randrange(len(live))))
+        elif action < 0.8:
+            target = rng.choice(live)
+            target.title = f"{word()} {word()}".title()
+            index.update(target)
+        else:
+            rng.choice(live).set_isbn(f"979-{step:06d}")
+        assert index._vocabulary == sorted(index._postings)
+    # A token added after the first prefix query is found by the next one
+    assert index.complete("zz") == []
+    fresh = Ebook("Zzyzx Road", "Nobody", "2024", "Fiction", 5.0, "980-000001", "Ace", "English")
+    index.add(fresh)
+    assert index.complete("zz") == ["zzyzx"] and index.search_prefix("zzy") == [fresh]
+
+
+def test_pricing_cache_keys_and_prices_one_snapshot():
+    # A cart that changes while it is being priced must not store one content's totals under another's key
+    dune = Ebook("Dune", "Herbert", "1965", "Fantasy", "10.00", "111", "Penguin", "English")
+    emma = Ebook("Emma", "Austen", "1815", "Classics", "7.49", "222", "Ace", "English")
+
+    class BusyCart(ShoppingCart):
+        # Another writer adds a copy of Emma just before every snapshot is taken
+        __slots__ = ()
+
+        def snapshot(self):
+            self.add_item(emma, 1)
+            return super().snapshot()
+
+    customer = Customer("Shopper", "s@example.com", "050", "Dubai", "Card", True)
+    cache = PricingCache()
+    busy = BusyCart()
+    busy.add_item(dune, 1)
+    cache.price_order(Order(customer, busy))
+    for with_emma in (False, True):
+        # Plain carts with the contents before and after the concurrent add
+        cart = ShoppingCart()
+        cart.add_item(dune, 1)
+        if with_emma:
+            cart.add_item(emma, 1)
+        order = Order(customer, cart)
+        assert cache.price_order(order) == order.calculate_total()
+    assert cache.hits == 1 and cache.misses == 2
+
+
+def test_ebook_table_rows_round_trip_their_ebooks():
+    # A row reads back exactly what its source Ebook held, and behaves like one in carts, catalogs and search
+    dune = Ebook("Dune", "Herbert", "1965", "Fantasy", "10.00", "111", "Penguin", "English")
+    emma = Ebook("Emma", "Austen", "1815", "Classics", "7.49", "222", "Ace", "English")
+    table = EbookTable([dune, emma])
+    row = table.get("222")
+    for field in ("title", "author", "publication_date", "genre", "publisher", "language", "price", "price_cents"):
+        assert getattr(row, field) == getattr(emma, field)
+    assert row.get_isbn() == "222" and str(row) == str(emma)
+    assert table[-1] == row and table[1] == row and table[0] != row and table.get("999") is None
+    for index in (2, -3):
+        try:
+            table[index]
+            assert False, "row index out of range was accepted"
+        except IndexError:
+            pass
+    try:
+        table.add_ebook(dune)
+        assert False, "duplicate ISBN was appended"
+    except ValueError:
+        assert len(table) == 2
+
+    # Two views of one row are the same cart line, and a price write-back re-prices the cart
+    cart = ShoppingCart(NullEventSink())
+    cart.add_item(table[1], 1)
+    cart.add_item(table.get("222"), 2)
+    assert cart.line_count == 1 and cart.subtotal_cents == 3 * 749
+    row.price = "5.00"
+    assert table[1].price_cents == 500 and cart.subtotal_cents == 1500
+
+    # ISBN changes re-key the table and reach the catalogs and search indexes the row was added to
+    catalog = Catalog()
+    index = SearchIndex()
+    catalog.add(row)
+    index.add(row)
+    row.set_isbn("333")
+    assert table.get("222") is None and table.get("333") == row and catalog.get("333") == row
+    assert "222" not in catalog and index.search("333") == [row] and index.search("222") == []
+    assert catalog.by_author("Austen") == [row] and index.search("emma") == [row]
+    try:
+        table[1].set_isbn("111")
+        assert False, "duplicate ISBN was accepted by the table"
+    except ValueError:
+        assert table.get("111") == table[0] and row.get_isbn() == "333"
+    other = EbookTable([Ebook("Dune", "Herbert", "1965", "Fantasy", "10.00", "444", "Penguin", "English")])
+    catalog.add(other[0])
+    index.add(other[0])
+    try:
+        # Rejected by the catalog after the table was re-keyed: everything rolls back
+        other[0].set_isbn("333")
+        assert False, "duplicate ISBN was accepted by the catalog"
+    except ValueError:
+        assert other.get("444") == other[0] and other.get("333") is None
+        assert catalog.get("444") == other[0] and catalog.get("333") == row
+        assert index.search("444") == [other[0]]
+    catalog.remove("333")
+    index.remove(row)
+    row.remove_watcher(catalog)
+    row.remove_watcher(index)
+    row.set_isbn("555")
+    assert "555" not in catalog and index.search("555") == []
+
+
 # Ensure the main function only runs when this script is executed directly
 if __name__ == "__main__":
     main()  # Run the main function to simulate the eBook store interactions